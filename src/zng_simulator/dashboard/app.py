@@ -11,13 +11,19 @@ ingestion, variance analysis, auto-tuning, and recommendation alerts.
 
 from __future__ import annotations
 
-import io
+import hashlib
+import importlib
+import math
 import os
+import threading
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import pyarrow as pa
 import streamlit as st
 from scipy.special import gamma as gamma_func
 
@@ -34,35 +40,30 @@ from zng_simulator.config import (
     StationConfig,
     VehicleConfig,
 )
-from zng_simulator.engine.orchestrator import run_engine
-from zng_simulator.engine.field_data import (
-    apply_tuned_parameters,
-    auto_tune_parameters,
-    compute_variance_report,
-    ingest_bms_csv,
-    ingest_charger_csv,
-)
-from zng_simulator.engine.optimizer import find_minimum_fleet_size, find_optimal_scale
-from zng_simulator.finance.dcf import build_dcf_table
-from zng_simulator.finance.dscr import build_debt_schedule, compute_dscr
-from zng_simulator.finance.statements import build_financial_statements
-from zng_simulator.finance.charger_npv import compute_charger_npv
-from zng_simulator.models.field_data import FieldDataSet
-from zng_simulator.models.results import SimulationResult
+from zng_simulator.dashboard.components import card_row
+from zng_simulator.dashboard.formatting import fmt_count, fmt_inr, rupees
+from zng_simulator.models.field_data import AutoTuneResult, FieldDataSet
+from zng_simulator.models.results import DCFResult, SimulationResult
 
 # ---------------------------------------------------------------------------
 # Default instances — single source of truth for sidebar defaults
 # ---------------------------------------------------------------------------
-_DEF_V = VehicleConfig()
-_DEF_P = PackSpec()
-_DEF_C = ChargerVariant()
-_DEF_S = StationConfig()
-_DEF_O = OpExConfig()
-_DEF_R = RevenueConfig()
-_DEF_CH = ChaosConfig()
-_DEF_D = DemandConfig()
-_DEF_F = FinanceConfig()
-_DEF_SIM = SimulationConfig()
+@st.cache_resource(show_spinner=False)
+def _default_configs():
+    """Build the default config instances once per process, not on every rerun.
+
+    The instances are shared across sessions and must only be read.
+    """
+    return (
+        VehicleConfig(), PackSpec(), ChargerVariant(), StationConfig(), OpExConfig(),
+        RevenueConfig(), ChaosConfig(), DemandConfig(), FinanceConfig(), SimulationConfig(),
+    )
+
+
+(
+    _DEF_V, _DEF_P, _DEF_C, _DEF_S, _DEF_O,
+    _DEF_R, _DEF_CH, _DEF_D, _DEF_F, _DEF_SIM,
+) = _default_configs()
 
 # ---------------------------------------------------------------------------
 # Page config
@@ -72,7 +73,9 @@ st.set_page_config(page_title="ZNG BSN Simulator", page_icon="⚡", layout="wide
 # ---------------------------------------------------------------------------
 # Custom CSS — dark polished card theme
 # ---------------------------------------------------------------------------
-st.markdown("""
+# Style-only HTML goes to Streamlit's event container, so the theme takes no
+# layout space and skips the markdown renderer on every rerun.
+_APP_CSS = """\
 <style>
 /* ── Google Fonts: Inter ─────────────────────────────────────────── */
 @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
@@ -231,7 +234,8 @@ section[data-testid="stFileUploader"] label {
     border-radius: 8px !important;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.html(_APP_CSS)
 
 # ---------------------------------------------------------------------------
 # Title area — Zunogo branding
@@ -278,33 +282,133 @@ else:
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _fmt_inr(val: float) -> str:
-    """Format INR with lakhs / crores for large values."""
-    if abs(val) >= 1e7:
-        return f"₹{val / 1e7:,.2f} Cr"
-    if abs(val) >= 1e5:
-        return f"₹{val / 1e5:,.2f} L"
-    return f"₹{val:,.0f}"
+# CPC waterfall components in display order: (label, CPCWaterfall field)
+_CPC_COMPONENTS = (
+    ("Battery", "battery"), ("Charger", "charger"),
+    ("Electricity", "electricity"), ("Real estate", "real_estate"),
+    ("Maintenance", "maintenance"), ("Insurance", "insurance"),
+    ("Sabotage", "sabotage"), ("Logistics", "logistics"),
+    ("Overhead", "overhead"),
+)
+
+# Ten-cell confidence bars indexed by int(confidence * 10), 0…10 — each is a
+# slice of the full and empty templates joined at the fill point.
+_BAR_FULL, _BAR_EMPTY = "█" * 10, "░" * 10
+_CONF_BARS = np.array([_BAR_FULL[:k] + _BAR_EMPTY[k:] for k in range(11)], dtype=object)
+
+# Bound formatters for the tuned-parameters table columns.
+_fmt_4g = "{:.4g}".format
+_fmt_change_pct = "{:+.1f}%".format
+_fmt_conf_pct = " {:.0%}".format
+
+# Sample field-data CSVs offered under "Download Templates".
+_BMS_TEMPLATE_BYTES = (
+    b"pack_id,month,soh,cumulative_cycles,temperature_avg_c\n"
+    b"P001,6,0.95,300,35.2\n"
+    b"P001,12,0.89,620,34.0\n"
+    b"P002,6,0.94,310,36.0\n"
+    b"P002,12,0.88,650,33.5\n"
+)
+_CHARGER_TEMPLATE_BYTES = (
+    b"dock_id,failure_month,downtime_hours,charger_variant_name,repair_cost,was_replaced\n"
+    b"D01,3,8.5,Budget-1kW,1200,false\n"
+    b"D02,5,12.0,Budget-1kW,1500,false\n"
+    b"D01,9,24.0,Budget-1kW,2000,true\n"
+)
+
+# Static body of the Auto-Calibration "Show calibration methodology" expander.
+_CALIBRATION_METHODOLOGY_MD = """\
+**Degradation rate (β)**: For each BMS record, compute:
+`β_eff = (1.0 − SOH − calendar_loss) / cumulative_cycles`, then take the median.
 
+**Calendar aging**: For low-cycle packs (< 50 cycles), estimate:
+`calendar_rate = (1.0 − SOH) / months`, then take the median.
 
-def _card(icon: str, label: str, value: str, accent: str = "#6c5ce7") -> str:
-    """Return HTML for a styled metric card with colored top accent."""
-    return f"""
-    <div style="
-        background: linear-gradient(135deg, rgba(30,34,44,0.95), rgba(22,26,35,0.98));
-        border: 1px solid rgba(255,255,255,0.05);
-        border-top: 3px solid {accent};
-        border-radius: 8px;
-        padding: 14px 16px 12px;
-        box-shadow: 0 1px 6px rgba(0,0,0,0.18);
-        text-align: center;
-    ">
-        <div style="font-size: 1.3rem; margin-bottom: 2px; line-height: 1;">{icon}</div>
-        <div style="font-family: 'Inter', sans-serif; font-size: 1.25rem; font-weight: 700; color: #fff; letter-spacing: -0.3px; line-height: 1.3;">{value}</div>
-        <div style="font-family: 'Inter', sans-serif; font-size: 0.65rem; color: rgba(255,255,255,0.42); text-transform: uppercase; letter-spacing: 0.6px; margin-top: 3px; line-height: 1.3; font-weight: 500;">{label}</div>
-    </div>
+**Charger MTBF**: From failure logs, compute:
+`actual_MTBF = total_operating_hours / total_failures`
+
+**Confidence scoring**:
+- BMS: `min(1.0, num_packs / 50)` — 50+ packs = full confidence
+- MTBF: `min(1.0, num_failures / 10)` — 10+ failures = full confidence
+"""
+
+
+def _fmt_be(month: int | None) -> str:
+    """Break-even month label: ``Mo. 14``, or ``Never`` when not reached."""
+    return f"Mo. {month}" if month else "Never"
+
+
+def _fmt_be_delta(original: int | None, tuned: int | None) -> str:
+    """Signed change in break-even month, ``N/A`` unless both runs break even."""
+    return f"{tuned - original:+d} months" if original and tuned else "N/A"
+
+
+def _columns(rows: list, *fields: str, fill: float | None = None) -> dict[str, np.ndarray]:
+    """Transpose a list of result rows into one NumPy array per field (AoS → SoA).
+
+    With ``fill`` set, ``None`` values (stochastic-only fields) are replaced
+    so the column gets a numeric dtype.
+    """
+    if fill is None:
+        return {f: np.array([getattr(r, f) for r in rows]) for f in fields}
+    return {f: np.array([v if (v := getattr(r, f)) is not None else fill for r in rows]) for f in fields}
+
+
+@lru_cache(maxsize=8)
+def _month_index(n: int) -> pd.Index:
+    """1-based month axis shared by every monthly chart of length ``n``."""
+    return pd.Index(np.arange(1, n + 1, dtype=np.int16), name="Month")
+
+
+def _monthly(data: dict) -> pd.DataFrame:
+    """Chart frame for equal-length monthly series, indexed by the shared month axis."""
+    n = len(next(iter(data.values())))
+    return pd.DataFrame(data, index=_month_index(n))
+
+
+def _f32(seq) -> np.ndarray:
+    """Chart feed as float32 — halves the Arrow payload for ratio/per-cycle series.
+
+    Not for cumulative ₹ series: float32 keeps ~7 significant digits, which
+    would show up as wrong trailing rupees in chart tooltips.
+    """
+    return np.asarray(seq, dtype=np.float32)
+
+
+
+def _salvage_and_dcf(
+    res: SimulationResult, finance: FinanceConfig, discount_rate_annual: float, salvage_per_pack: float,
+) -> tuple[float, DCFResult]:
+    """Terminal salvage (all packs at second-life value) and the DCF table it feeds."""
+    salvage = res.derived.total_packs * salvage_per_pack
+    return salvage, build_dcf_table(res.months, res.summary, finance, discount_rate_annual, salvage)
+
+
+@st.fragment
+def _render_per_variant(
+    key: str, results: list[SimulationResult], render_block: Callable[..., None],
+    cv_map: dict[str, ChargerVariant] | None = None,
+) -> None:
+    """Render ``render_block`` for each charger variant, one tab per variant.
+
+    Tab switches rerun only this fragment, and only the selected tab's
+    block is built. With ``cv_map`` the block is called as
+    ``render_block(res, cv)`` with the variant resolved by name.
     """
+    def _render(res: SimulationResult) -> None:
+        if cv_map is None:
+            render_block(res)
+        else:
+            render_block(res, cv_map[res.charger_variant_id])
 
+    if len(results) == 1:
+        _render(results[0])
+        return
+    tabs = st.tabs([r.charger_variant_id for r in results], key=key, on_change="rerun")
+    for tab, res in zip(tabs, results):
+        with tab:
+            if tab.open:
+                _render(res)
 
 # ---------------------------------------------------------------------------
 # SIDEBAR — Inputs
@@ -1101,7 +1205,28 @@ for idx, (show_charger_preview, charger_params) in enumerate(zip(charger_preview
         
         st.markdown("---")
 
+@st.cache_resource(show_spinner=False)
+def _prewarm_engine_imports() -> threading.Thread:
+    """Import the engine and finance modules in a daemon thread, once per process.
+
+    They are imported lazily after the run gate below; warming them while the
+    user is still on the "Ready to Simulate" page takes that cost off the first
+    Run click.
+    """
+    modules = (
+        "zng_simulator.engine.orchestrator", "zng_simulator.finance.dcf",
+        "zng_simulator.finance.dscr", "zng_simulator.finance.statements",
+        "zng_simulator.finance.charger_npv",
+    )
+    thread = threading.Thread(
+        target=lambda: [importlib.import_module(m) for m in modules], name="zng-prewarm", daemon=True,
+    )
+    thread.start()
+    return thread
+
+
 if not (run_clicked or "results" in st.session_state):
+    _prewarm_engine_imports()
     st.markdown("""
     <div style="
         background: linear-gradient(135deg, rgba(108,92,231,0.10), rgba(9,132,227,0.06));
@@ -1121,10 +1246,59 @@ if not (run_clicked or "results" in st.session_state):
 # ---------------------------------------------------------------------------
 # RUN ENGINE
 # ---------------------------------------------------------------------------
+# Engine and finance modules load only once a run has been requested, so the
+# "Ready to Simulate" page and pre-run sidebar edits do not pay for them.
+from zng_simulator.engine.orchestrator import run_engine, run_engine_batch
+from zng_simulator.finance.dcf import build_dcf_table
+from zng_simulator.finance.dscr import build_debt_schedule, compute_dscr
+from zng_simulator.finance.statements import build_financial_statements
+from zng_simulator.finance.charger_npv import compute_charger_npv
+
+# Engine results are a pure function of (scenario, charger variant), so the
+# engine and finance caches key on their JSON and leave the models unhashed.
+_scenario_key = scenario.model_dump_json()
+
+
+@st.cache_data(max_entries=32, ttl=600, show_spinner=False)
+def _cached_run_engine_batch(
+    scenario_key: str, variant_keys: tuple[str, ...], _scenario: Scenario, _cvs: list[ChargerVariant],
+) -> list[SimulationResult]:
+    """Run the selected engine for every charger variant; reruns with unchanged inputs hit the cache."""
+    return run_engine_batch(_scenario, _cvs)
+
+
 with st.spinner("Running simulation…" if sim_engine == "static" else f"Running {sim_mc} Monte-Carlo simulations…"):
-    results: list[SimulationResult] = [run_engine(scenario, cv) for cv in charger_variants]
+    results: list[SimulationResult] = _cached_run_engine_batch(
+        _scenario_key, tuple(cv.model_dump_json() for cv in charger_variants), scenario, charger_variants,
+    )
 st.session_state["results"] = results
 
+# Result → charger lookup (first variant wins on duplicate names, as before)
+_cv_by_name: dict[str, ChargerVariant] = {}
+_cv_index_by_name: dict[str, int] = {}
+for _i, _cv in enumerate(charger_variants):
+    _cv_by_name.setdefault(_cv.name, _cv)
+    _cv_index_by_name.setdefault(_cv.name, _i)
+
+# Variant × component CPC matrix (columns in _CPC_COMPONENTS order) and the
+# per-variant totals, gathered once for the cross-variant chart and comparison.
+_cpc_matrix = np.array([[getattr(r.cpc_waterfall, field) for _, field in _CPC_COMPONENTS] for r in results])
+_cpc_totals = np.array([r.cpc_waterfall.total for r in results])
+
+# Monthly series of each result as column arrays (AoS → SoA), keyed by
+# id(result) and built once per run for the cash-flow, health and
+# reliability sections. Stochastic-only fields have None filled with 0.
+_month_cols: dict[int, dict[str, np.ndarray]] = {
+    id(r): _columns(
+        r.months, "month", "fleet_size", "swap_visits", "total_cycles",
+        "revenue", "opex_total", "capex_this_month", "net_cash_flow", "cumulative_cash_flow",
+    ) | (_columns(
+        r.months, "avg_soh", "packs_retired_this_month", "replacement_capex_this_month",
+        "salvage_credit_this_month", "charger_failures_this_month", fill=0,
+    ) if r.engine_type == "stochastic" else {})
+    for r in results
+}
+
 # Dynamic subtitle
 _is_stochastic = results[0].engine_type == "stochastic"
 _has_mc = results[0].monte_carlo is not None
@@ -1143,7 +1317,9 @@ multi_charger = len(results) > 1
 # ═══════════════════════════════════════════════════════════════════════════
 # ==============================  MAIN TABS  ==============================
 # ═══════════════════════════════════════════════════════════════════════════
-operations_tab, finance_tab, intelligence_tab = st.tabs(["Operations", "Finance", "Intelligence"])
+operations_tab, finance_tab, intelligence_tab = st.tabs(
+    ["Operations", "Finance", "Intelligence"], key="main_tab", on_change="rerun",
+)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1155,100 +1331,160 @@ with operations_tab:
     st.divider()
     st.header("Operational Overview")
 
-    d0 = results[0].derived
-
-    # --- Fleet composition — styled cards ---
-    st.subheader("Fleet Composition")
-    fi_cols = st.columns(5)
-    fi_cards = [
-        ("🚗", "Fleet Size", f"{d0.initial_fleet_size:,}", "#6c5ce7"),
-        ("⚡", "Charging Docks", f"{d0.total_docks:,}", "#00b894"),
-        ("🔋", "Active Packs", f"{d0.packs_on_vehicles:,}", "#0984e3"),
-        ("🔌", "Float Packs", f"{d0.packs_in_docks:,}", "#fdcb6e"),
-        ("📦", "Total Inventory", f"{d0.total_packs:,}", "#e17055"),
-    ]
-    for col, (icon, label, value, accent) in zip(fi_cols, fi_cards):
-        col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-
-    with st.expander("Show inventory formulas"):
-        st.markdown(f"**Active packs** — `fleet × packs_per_vehicle` = {d0.initial_fleet_size:,} × {v.packs_per_vehicle} = **{d0.packs_on_vehicles:,}**")
-        st.markdown(f"**Float packs** — `stations × docks_per_station` = {station.num_stations} × {station.docks_per_station} = **{d0.packs_in_docks:,}**")
-        st.markdown(f"**Total inventory** — {d0.packs_on_vehicles:,} + {d0.packs_in_docks:,} = **{d0.total_packs:,}**")
-
-    # --- Key operating metrics ---
-    st.subheader("Key Operating Metrics")
-    m1, m2, m3, m4 = st.columns(4)
-    m1.metric("Energy per Swap", f"{d0.energy_per_swap_cycle_per_pack_kwh:.3f} kWh",
-              help="Energy consumed from one pack per swap cycle (per pack)")
-    m2.metric("Daily Swaps per Vehicle", f"{d0.swap_visits_per_vehicle_per_day:.2f}",
-              help="Station visits per vehicle per day — all packs swapped per visit")
-    m3.metric("Pack Cycle Life", f"{d0.pack_lifetime_cycles:,} cycles")
-    m4.metric("Energy per Visit", f"{d0.energy_per_swap_cycle_per_vehicle_kwh:.2f} kWh",
-              help="Total energy refilled per swap visit (all packs × energy per pack)")
-
-    # --- Per-charger derived ---
-    if multi_charger:
-        cols = st.columns(len(results))
-        for col, res in zip(cols, results):
-            dd = res.derived
-            col.markdown(f"**{res.charger_variant_id}**")
-            col.metric("Charge Duration", f"{dd.charge_time_minutes:.1f} min")
-            col.metric("Effective C-Rate", f"{dd.effective_c_rate:.2f} C")
-            col.metric("Cycles per Dock / Day", f"{dd.cycles_per_day_per_dock:.1f}")
-    else:
-        dd = d0
-        m1, m2, m3 = st.columns(3)
-        m1.metric("Charge Duration", f"{dd.charge_time_minutes:.1f} min")
-        m2.metric("Effective C-Rate", f"{dd.effective_c_rate:.2f} C")
-        m3.metric("Cycles per Dock / Day", f"{dd.cycles_per_day_per_dock:.1f}")
-
-    # --- Formula detail ---
-    with st.expander("Show operating formulas"):
-        rated_kw_0 = charger_variants[0].rated_power_w / 1000
-        formulas = {
-            "Energy per swap cycle (per pack)": (
-                "`capacity × (1 − range_anxiety_buffer)`  ← driver-behaviour assumption, not hard limit",
-                f"{v.pack_capacity_kwh} × (1 − {v.range_anxiety_buffer_pct:.2f}) = **{d0.energy_per_swap_cycle_per_pack_kwh:.4f} kWh**",
-            ),
-            "Energy per swap visit (per vehicle)": (
-                "`packs_per_vehicle × energy_per_pack`",
-                f"{v.packs_per_vehicle} × {d0.energy_per_swap_cycle_per_pack_kwh:.4f} = **{d0.energy_per_swap_cycle_per_vehicle_kwh:.4f} kWh**",
-            ),
-            "Daily energy need": (
-                "`daily_km × Wh_per_km`",
-                f"{v.avg_daily_km} × {v.energy_consumption_wh_per_km} = **{d0.daily_energy_need_wh:,.0f} Wh**",
-            ),
-            "Swap visits / day / vehicle": (
-                "`energy_need_Wh / energy_per_visit_Wh`  ← visits, not individual pack swaps",
-                f"{d0.daily_energy_need_wh:,.0f} / {d0.energy_per_swap_cycle_per_vehicle_kwh * 1000:,.0f} = **{d0.swap_visits_per_vehicle_per_day:.4f}**",
-            ),
-            "Charge time": (
-                "`capacity / (power_kW × efficiency) × 60`",
-                f"{v.pack_capacity_kwh} / ({rated_kw_0} × {charger_variants[0].charging_efficiency_pct}) × 60 = **{d0.charge_time_minutes:.2f} min**",
-            ),
-            "Effective C-rate": (
-                "`power_kW / capacity`",
-                f"{rated_kw_0} / {v.pack_capacity_kwh} = **{d0.effective_c_rate:.4f} C**",
-            ),
-            "Cycles / day / dock": (
-                "`(op_hours × 60) / charge_time`",
-                f"({station.operating_hours_per_day} × 60) / {d0.charge_time_minutes:.2f} = **{d0.cycles_per_day_per_dock:.2f}**",
-            ),
-            "Pack lifetime cycles": (
-                "`(1 − retirement_SOH) / (β/100 × aggressiveness)`",
-                f"(1.0 − {p.retirement_soh_pct}) / ({p.cycle_degradation_rate_pct} / 100 × {chaos_cfg.aggressiveness_index}) = **{d0.pack_lifetime_cycles:,}**",
-            ),
-        }
-        for name, (formula, calc) in formulas.items():
-            st.markdown(f"**{name}** — {formula}  \n{calc}")
+    @st.fragment
+    def _render_overview(results: list[SimulationResult]):
+        """Fleet composition, operating metrics and their formula expanders."""
+        d0 = results[0].derived
+
+        # --- Fleet composition — styled cards ---
+        st.subheader("Fleet Composition")
+        fi_cards = [
+            ("🚗", "Fleet Size", fmt_count(d0.initial_fleet_size), "#6c5ce7"),
+            ("⚡", "Charging Docks", fmt_count(d0.total_docks), "#00b894"),
+            ("🔋", "Active Packs", fmt_count(d0.packs_on_vehicles), "#0984e3"),
+            ("🔌", "Float Packs", fmt_count(d0.packs_in_docks), "#fdcb6e"),
+            ("📦", "Total Inventory", fmt_count(d0.total_packs), "#e17055"),
+        ]
+        st.markdown(card_row(fi_cards), unsafe_allow_html=True)
+
+        inv_formula_exp = st.expander("Show inventory formulas", key="inventory_formulas", on_change="rerun")
+        with inv_formula_exp:
+            if not inv_formula_exp.open:
+                st.caption("Expand to load the formula breakdown.")
+            else:
+                st.markdown(f"**Active packs** — `fleet × packs_per_vehicle` = {d0.initial_fleet_size:,} × {v.packs_per_vehicle} = **{d0.packs_on_vehicles:,}**")
+                st.markdown(f"**Float packs** — `stations × docks_per_station` = {station.num_stations} × {station.docks_per_station} = **{d0.packs_in_docks:,}**")
+                st.markdown(f"**Total inventory** — {d0.packs_on_vehicles:,} + {d0.packs_in_docks:,} = **{d0.total_packs:,}**")
+
+        # --- Key operating metrics ---
+        st.subheader("Key Operating Metrics")
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Energy per Swap", f"{d0.energy_per_swap_cycle_per_pack_kwh:.3f} kWh",
+                  help="Energy consumed from one pack per swap cycle (per pack)")
+        m2.metric("Daily Swaps per Vehicle", f"{d0.swap_visits_per_vehicle_per_day:.2f}",
+                  help="Station visits per vehicle per day — all packs swapped per visit")
+        m3.metric("Pack Cycle Life", f"{fmt_count(d0.pack_lifetime_cycles)} cycles")
+        m4.metric("Energy per Visit", f"{d0.energy_per_swap_cycle_per_vehicle_kwh:.2f} kWh",
+                  help="Total energy refilled per swap visit (all packs × energy per pack)")
+
+        # --- Per-charger derived ---
+        if multi_charger:
+            # One card grid per metric, one column per variant — a single element
+            # instead of four per variant column.
+            dd_rows = [
+                [("⏱️", f"{r.charger_variant_id} · Charge Duration", f"{r.derived.charge_time_minutes:.1f} min", "#6c5ce7") for r in results],
+                [("⚡", f"{r.charger_variant_id} · Effective C-Rate", f"{r.derived.effective_c_rate:.2f} C", "#00b894") for r in results],
+                [("🔁", f"{r.charger_variant_id} · Cycles per Dock / Day", f"{r.derived.cycles_per_day_per_dock:.1f}", "#0984e3") for r in results],
+            ]
+            st.markdown("".join(card_row(row, pad_below=True) for row in dd_rows), unsafe_allow_html=True)
+        else:
+            dd = d0
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Charge Duration", f"{dd.charge_time_minutes:.1f} min")
+            m2.metric("Effective C-Rate", f"{dd.effective_c_rate:.2f} C")
+            m3.metric("Cycles per Dock / Day", f"{dd.cycles_per_day_per_dock:.1f}")
+
+        # --- Formula detail ---
+        op_formula_exp = st.expander("Show operating formulas", key="operating_formulas", on_change="rerun")
+        with op_formula_exp:
+            if not op_formula_exp.open:
+                st.caption("Expand to load the formula breakdown.")
+            else:
+                rated_kw_0 = charger_variants[0].rated_power_w / 1000
+                formulas = {
+                    "Energy per swap cycle (per pack)": (
+                        "`capacity × (1 − range_anxiety_buffer)`  ← driver-behaviour assumption, not hard limit",
+                        f"{v.pack_capacity_kwh} × (1 − {v.range_anxiety_buffer_pct:.2f}) = **{d0.energy_per_swap_cycle_per_pack_kwh:.4f} kWh**",
+                    ),
+                    "Energy per swap visit (per vehicle)": (
+                        "`packs_per_vehicle × energy_per_pack`",
+                        f"{v.packs_per_vehicle} × {d0.energy_per_swap_cycle_per_pack_kwh:.4f} = **{d0.energy_per_swap_cycle_per_vehicle_kwh:.4f} kWh**",
+                    ),
+                    "Daily energy need": (
+                        "`daily_km × Wh_per_km`",
+                        f"{v.avg_daily_km} × {v.energy_consumption_wh_per_km} = **{d0.daily_energy_need_wh:,.0f} Wh**",
+                    ),
+                    "Swap visits / day / vehicle": (
+                        "`energy_need_Wh / energy_per_visit_Wh`  ← visits, not individual pack swaps",
+                        f"{d0.daily_energy_need_wh:,.0f} / {d0.energy_per_swap_cycle_per_vehicle_kwh * 1000:,.0f} = **{d0.swap_visits_per_vehicle_per_day:.4f}**",
+                    ),
+                    "Charge time": (
+                        "`capacity / (power_kW × efficiency) × 60`",
+                        f"{v.pack_capacity_kwh} / ({rated_kw_0} × {charger_variants[0].charging_efficiency_pct}) × 60 = **{d0.charge_time_minutes:.2f} min**",
+                    ),
+                    "Effective C-rate": (
+                        "`power_kW / capacity`",
+                        f"{rated_kw_0} / {v.pack_capacity_kwh} = **{d0.effective_c_rate:.4f} C**",
+                    ),
+                    "Cycles / day / dock": (
+                        "`(op_hours × 60) / charge_time`",
+                        f"({station.operating_hours_per_day} × 60) / {d0.charge_time_minutes:.2f} = **{d0.cycles_per_day_per_dock:.2f}**",
+                    ),
+                    "Pack lifetime cycles": (
+                        "`(1 − retirement_SOH) / (β/100 × aggressiveness)`",
+                        f"(1.0 − {p.retirement_soh_pct}) / ({p.cycle_degradation_rate_pct} / 100 × {chaos_cfg.aggressiveness_index}) = **{d0.pack_lifetime_cycles:,}**",
+                    ),
+                }
+                for name, (formula, calc) in formulas.items():
+                    st.markdown(f"**{name}** — {formula}  \n{calc}")
+
+    _render_overview(results)
 
     # ── SECTION 2 — Unit Economics ──────────────────────────────────────
     st.divider()
     st.header("Unit Economics")
 
-    def _render_cpc_block(res: SimulationResult, show_label: bool = False):
-        """Render CPC chart, table, swap economics, and TCO breakdowns."""
-        cv = next(c for c in charger_variants if c.name == res.charger_variant_id)
+    @st.cache_data(max_entries=32, ttl=600, show_spinner=False)
+    def _cpc_tables(scenario_key: str, variant_key: str, _res: SimulationResult) -> dict[str, pd.DataFrame]:
+        """Build the CPC, charger TCO and pack TCO tables for one charger variant."""
+        cpc, tco, ptco = _res.cpc_waterfall, _res.charger_tco, _res.pack_tco
+        comp_vals = np.array([getattr(cpc, field) for _, field in _CPC_COMPONENTS])
+        comp_pcts = comp_vals / cpc.total * 100 if cpc.total > 0 else np.zeros_like(comp_vals)
+        cpc_df = pd.DataFrame({
+            "Component": [name for name, _ in _CPC_COMPONENTS] + ["TOTAL"],
+            "₹ / cycle": [round(x, 4) for x in comp_vals.tolist()] + [round(cpc.total, 4)],
+            "% of total": pd.Series(comp_pcts).map("{:.1f}%".format).tolist() + ["100%"],
+        })
+        tco_rows = [
+            ("Total docks", f"{tco.total_docks}"),
+            ("Purchase cost (fleet)", f"₹{tco.purchase_cost:,.0f}"),
+            ("Scheduled hrs / yr / dock", f"{tco.scheduled_hours_per_year_per_dock:,.0f} hrs"),
+            (f"Fleet operating hours ({sim_cfg.horizon_months/12:.0f} yr)", f"{tco.fleet_operating_hours:,.0f} hrs"),
+            ("Availability  MTBF/(MTBF+MTTR)", f"{tco.availability:.4f}  ({tco.availability*100:.2f}%)"),
+            (f"Expected failures — fleet ({sim_cfg.horizon_months/12:.0f} yr)", f"{tco.expected_failures_over_horizon:.2f}"),
+            ("Total repair cost (fleet)", f"₹{tco.total_repair_cost:,.0f}"),
+            ("Full replacements (fleet)", f"{tco.num_replacements}"),
+            ("Replacement cost (fleet)", f"₹{tco.total_replacement_cost:,.0f}"),
+            ("Downtime (fleet dock-hours)", f"{tco.total_downtime_hours:.1f} hrs"),
+            ("Lost revenue (downtime)", f"₹{tco.lost_revenue_from_downtime:,.0f}"),
+            ("Spare inventory (fleet)", f"₹{tco.spare_inventory_cost:,.0f}"),
+            ("TOTAL TCO (fleet)", f"₹{tco.total_tco:,.0f}"),
+            ("Cycles served (fleet)", f"{tco.cycles_served_over_horizon:,.0f}"),
+            ("Cost per cycle", f"₹{tco.cost_per_cycle:.4f}"),
+        ]
+        ptco_rows = [
+            ("Total packs in fleet", f"{ptco.total_packs}"),
+            (f"Fleet operating hours ({sim_cfg.horizon_months/12:.0f} yr)", f"{ptco.fleet_operating_hours:,.0f} hrs"),
+            ("Availability  MTBF/(MTBF+MTTR)", f"{ptco.availability:.4f}  ({ptco.availability*100:.2f}%)"),
+            (f"Expected failures — fleet ({sim_cfg.horizon_months/12:.0f} yr)", f"{ptco.expected_failures:.2f}"),
+            ("Total repair cost (fleet)", f"₹{ptco.total_repair_cost:,.0f}"),
+            ("Full replacements (fleet)", f"{ptco.num_replacements}"),
+            ("Replacement cost (fleet)", f"₹{ptco.total_replacement_cost:,.0f}"),
+            ("Downtime (fleet pack-hours)", f"{ptco.total_downtime_hours:.1f} hrs"),
+            ("Lost revenue (downtime)", f"₹{ptco.lost_revenue_from_downtime:,.0f}"),
+            ("Spare inventory (fleet)", f"₹{ptco.spare_inventory_cost:,.0f}"),
+            ("TOTAL failure TCO (fleet)", f"₹{ptco.total_failure_tco:,.0f}"),
+            ("Failure cost per cycle", f"₹{ptco.failure_cost_per_cycle:.4f}"),
+        ]
+        return {
+            "cpc": cpc_df,
+            "tco": pd.DataFrame(tco_rows, columns=["Item", "Value"]),
+            "ptco": pd.DataFrame(ptco_rows, columns=["Item", "Value"]),
+        }
+
+    @st.fragment
+    def _render_cpc_block(res: SimulationResult, cv: ChargerVariant, show_label: bool = False):
+        """Render CPC headline cards, table, formulas, and TCO breakdowns."""
         cpc = res.cpc_waterfall
         tco = res.charger_tco
         dd = res.derived
@@ -1262,139 +1498,102 @@ with operations_tab:
         margin = rev_per_visit - cost_per_visit
         margin_color = "#00b894" if margin >= 0 else "#d63031"
 
-        h_cols = st.columns(4)
         h_cards = [
             ("💰", "Cost per Cycle", f"₹{cpc.total:.2f}", "#6c5ce7"),
             ("📈", "Revenue per Visit", f"₹{rev_per_visit:.2f}", "#00b894"),
             ("📉", "Cost per Visit", f"₹{cost_per_visit:.2f}", "#0984e3"),
             ("🎯", "Margin per Visit", f"₹{margin:.2f}", margin_color),
         ]
-        for col, (icon, label, value, accent) in zip(h_cols, h_cards):
-            col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-        st.write("")
-
-        components = [
-            ("Battery", cpc.battery), ("Charger", cpc.charger),
-            ("Electricity", cpc.electricity), ("Real estate", cpc.real_estate),
-            ("Maintenance", cpc.maintenance), ("Insurance", cpc.insurance),
-            ("Sabotage", cpc.sabotage), ("Logistics", cpc.logistics),
-            ("Overhead", cpc.overhead),
-        ]
+        st.markdown(card_row(h_cards, pad_below=True), unsafe_allow_html=True)
 
-        chart_data = {name: [val] for name, val in components}
-        st.bar_chart(chart_data, horizontal=True, height=280, y_label="₹ / cycle", use_container_width=True)
-
-        cpc_table_rows = []
-        for name, val in components:
-            pct = (val / cpc.total * 100) if cpc.total > 0 else 0
-            cpc_table_rows.append({"Component": name, "₹ / cycle": round(val, 4), "% of total": f"{pct:.1f}%"})
-        cpc_table_rows.append({"Component": "TOTAL", "₹ / cycle": round(cpc.total, 4), "% of total": "100%"})
-        st.dataframe(cpc_table_rows, use_container_width=True, hide_index=True)
-
-        with st.expander("Show CPC formulas"):
-            batt_degrad = (p.unit_cost - p.second_life_salvage_value) / dd.pack_lifetime_cycles if dd.pack_lifetime_cycles > 0 else 0.0
-            cpc_formulas = [
-                ("Battery", "`degradation + pack_failure_cost`",
-                 f"degradation = ({p.unit_cost:,.0f} − {p.second_life_salvage_value:,.0f}) / {dd.pack_lifetime_cycles:,} = ₹{batt_degrad:.4f}  \n"
-                 f"failure = pack_failure_TCO / fleet_cycles = {ptco.total_failure_tco:,.0f} / {ptco.fleet_operating_hours:,.0f} → **₹{ptco.failure_cost_per_cycle:.4f}**  \n"
-                 f"total = ₹{batt_degrad:.4f} + ₹{ptco.failure_cost_per_cycle:.4f} = **₹{cpc.battery:.4f}**"),
-                ("Charger", "`charger_TCO / cycles_served`",
-                 f"{tco.total_tco:,.0f} / {tco.cycles_served_over_horizon:,.0f} = **₹{cpc.charger:.4f}**"),
-                ("Electricity", "`(capacity / efficiency) × tariff`",
-                 f"({p.nominal_capacity_kwh} / {cv.charging_efficiency_pct}) × {opex_cfg.electricity_tariff_per_kwh} = **₹{cpc.electricity:.4f}**"),
-                ("Real estate", "`rent / cycles_per_month`",
-                 f"{opex_cfg.rent_per_month_per_station:,.0f} / {dd.cycles_per_month_per_station:,.0f} = **₹{cpc.real_estate:.4f}**"),
-                ("Maintenance", "`(prev + corr) / cycles_per_month`",
-                 f"({opex_cfg.preventive_maintenance_per_month_per_station:,.0f} + {opex_cfg.corrective_maintenance_per_month_per_station:,.0f}) / {dd.cycles_per_month_per_station:,.0f} = **₹{cpc.maintenance:.4f}**"),
-                ("Insurance", "`premium / cycles_per_month`",
-                 f"{opex_cfg.insurance_per_month_per_station:,.0f} / {dd.cycles_per_month_per_station:,.0f} = **₹{cpc.insurance:.4f}**"),
-                ("Sabotage", "`(docks × sab% × pack_cost) / cycles_per_month`",
-                 f"({station.docks_per_station} × {chaos_cfg.sabotage_pct_per_month} × {p.unit_cost:,.0f}) / {dd.cycles_per_month_per_station:,.0f} = **₹{cpc.sabotage:.4f}**"),
-                ("Logistics", "`logistics / cycles_per_month`",
-                 f"{opex_cfg.logistics_per_month_per_station:,.0f} / {dd.cycles_per_month_per_station:,.0f} = **₹{cpc.logistics:.4f}**"),
-                ("Overhead", "`overhead / network_cycles_per_month`",
-                 f"{opex_cfg.overhead_per_month:,.0f} / {dd.total_network_cycles_per_month:,.0f} = **₹{cpc.overhead:.4f}**"),
-            ]
-            for name, formula, calc in cpc_formulas:
-                st.markdown(f"**{name}** — {formula}  \n{calc}")
+        tables = _cpc_tables(_scenario_key, cv.model_dump_json(), res)
+        st.dataframe(tables["cpc"], use_container_width=True, hide_index=True)
+
+        cpc_formula_exp = st.expander("Show CPC formulas", key=f"cpc_formulas_{res.charger_variant_id}", on_change="rerun")
+        with cpc_formula_exp:
+            if not cpc_formula_exp.open:
+                st.caption("Expand to load the formula breakdown.")
+            else:
+                batt_degrad = (p.unit_cost - p.second_life_salvage_value) / dd.pack_lifetime_cycles if dd.pack_lifetime_cycles > 0 else 0.0
+                cpc_formulas = [
+                    ("Battery", "`degradation + pack_failure_cost`",
+                     f"degradation = ({p.unit_cost:,.0f} − {p.second_life_salvage_value:,.0f}) / {dd.pack_lifetime_cycles:,} = ₹{batt_degrad:.4f}  \n"
+                     f"failure = pack_failure_TCO / fleet_cycles = {ptco.total_failure_tco:,.0f} / {ptco.fleet_operating_hours:,.0f} → **₹{ptco.failure_cost_per_cycle:.4f}**  \n"
+                     f"total = ₹{batt_degrad:.4f} + ₹{ptco.failure_cost_per_cycle:.4f} = **₹{cpc.battery:.4f}**"),
+                    ("Charger", "`charger_TCO / cycles_served`",
+                     f"{tco.total_tco:,.0f} / {tco.cycles_served_over_horizon:,.0f} = **₹{cpc.charger:.4f}**"),
+                    ("Electricity", "`(capacity / efficiency) × tariff`",
+                     f"({p.nominal_capacity_kwh} / {cv.charging_efficiency_pct}) × {opex_cfg.electricity_tariff_per_kwh} = **₹{cpc.electricity:.4f}**"),
+                    ("Real estate", "`rent / cycles_per_month`",
+                     f"{opex_cfg.rent_per_month_per_station:,.0f} / {dd.cycles_per_month_per_station:,.0f} = **₹{cpc.real_estate:.4f}**"),
+                    ("Maintenance", "`(prev + corr) / cycles_per_month`",
+                     f"({opex_cfg.preventive_maintenance_per_month_per_station:,.0f} + {opex_cfg.corrective_maintenance_per_month_per_station:,.0f}) / {dd.cycles_per_month_per_station:,.0f} = **₹{cpc.maintenance:.4f}**"),
+                    ("Insurance", "`premium / cycles_per_month`",
+                     f"{opex_cfg.insurance_per_month_per_station:,.0f} / {dd.cycles_per_month_per_station:,.0f} = **₹{cpc.insurance:.4f}**"),
+                    ("Sabotage", "`(docks × sab% × pack_cost) / cycles_per_month`",
+                     f"({station.docks_per_station} × {chaos_cfg.sabotage_pct_per_month} × {p.unit_cost:,.0f}) / {dd.cycles_per_month_per_station:,.0f} = **₹{cpc.sabotage:.4f}**"),
+                    ("Logistics", "`logistics / cycles_per_month`",
+                     f"{opex_cfg.logistics_per_month_per_station:,.0f} / {dd.cycles_per_month_per_station:,.0f} = **₹{cpc.logistics:.4f}**"),
+                    ("Overhead", "`overhead / network_cycles_per_month`",
+                     f"{opex_cfg.overhead_per_month:,.0f} / {dd.total_network_cycles_per_month:,.0f} = **₹{cpc.overhead:.4f}**"),
+                ]
+                for name, formula, calc in cpc_formulas:
+                    st.markdown(f"**{name}** — {formula}  \n{calc}")
 
         with st.expander("Charger TCO breakdown (fleet-level)"):
             per_dock_hrs = tco.scheduled_hours_per_year_per_dock * sim_cfg.horizon_months / 12
             st.caption(f"MTBF is a population statistic — all figures below are for the entire fleet of **{tco.total_docks}** docks.")
-            tco_rows = [
-                {"Item": "Total docks", "Value": f"{tco.total_docks}"},
-                {"Item": "Purchase cost (fleet)", "Value": f"₹{tco.purchase_cost:,.0f}"},
-                {"Item": "Scheduled hrs / yr / dock", "Value": f"{tco.scheduled_hours_per_year_per_dock:,.0f} hrs"},
-                {"Item": f"Fleet operating hours ({sim_cfg.horizon_months/12:.0f} yr)", "Value": f"{tco.fleet_operating_hours:,.0f} hrs"},
-                {"Item": "Availability  MTBF/(MTBF+MTTR)", "Value": f"{tco.availability:.4f}  ({tco.availability*100:.2f}%)"},
-                {"Item": f"Expected failures — fleet ({sim_cfg.horizon_months/12:.0f} yr)", "Value": f"{tco.expected_failures_over_horizon:.2f}"},
-                {"Item": "Total repair cost (fleet)", "Value": f"₹{tco.total_repair_cost:,.0f}"},
-                {"Item": "Full replacements (fleet)", "Value": f"{tco.num_replacements}"},
-                {"Item": "Replacement cost (fleet)", "Value": f"₹{tco.total_replacement_cost:,.0f}"},
-                {"Item": "Downtime (fleet dock-hours)", "Value": f"{tco.total_downtime_hours:.1f} hrs"},
-                {"Item": "Lost revenue (downtime)", "Value": f"₹{tco.lost_revenue_from_downtime:,.0f}"},
-                {"Item": "Spare inventory (fleet)", "Value": f"₹{tco.spare_inventory_cost:,.0f}"},
-                {"Item": "TOTAL TCO (fleet)", "Value": f"₹{tco.total_tco:,.0f}"},
-                {"Item": "Cycles served (fleet)", "Value": f"{tco.cycles_served_over_horizon:,.0f}"},
-                {"Item": "Cost per cycle", "Value": f"₹{tco.cost_per_cycle:.4f}"},
-            ]
-            st.dataframe(tco_rows, use_container_width=True, hide_index=True)
+            st.dataframe(tables["tco"], use_container_width=True, hide_index=True)
 
-            with st.expander("Show TCO formulas"):
-                st.markdown(f"**Per-dock hours** — `hrs/day × 365 × years` = {station.operating_hours_per_day} × 365 × {sim_cfg.horizon_months/12:.0f} = **{per_dock_hrs:,.0f} hrs**")
-                st.markdown(f"**Fleet operating hours** — `per_dock × total_docks` = {per_dock_hrs:,.0f} × {tco.total_docks} = **{tco.fleet_operating_hours:,.0f} hrs**")
-                st.markdown(f"**Fleet failures** — `fleet_hours / MTBF` = {tco.fleet_operating_hours:,.0f} / {cv.mtbf_hours:,.0f} = **{tco.expected_failures_over_horizon:.2f}**")
-                st.markdown(f"**Downtime** — `failures × MTTR` = {tco.expected_failures_over_horizon:.2f} × {cv.mttr_hours} = **{tco.total_downtime_hours:.1f} dock-hrs**")
-                st.markdown(f"**Availability** — `MTBF / (MTBF + MTTR)` = {cv.mtbf_hours:,.0f} / ({cv.mtbf_hours:,.0f} + {cv.mttr_hours}) = **{tco.availability*100:.2f}%** ← steady-state statistic")
-                st.markdown(f"**Fleet repairs** — `failures × repair_cost` = {tco.expected_failures_over_horizon:.2f} × {cv.repair_cost_per_event:,.0f} = **₹{tco.total_repair_cost:,.0f}**")
-                st.markdown(f"**Fleet replacements** — `floor(failures / threshold)` = floor({tco.expected_failures_over_horizon:.2f} / {cv.replacement_threshold}) = **{tco.num_replacements}**")
+            tco_formula_exp = st.expander("Show TCO formulas", key=f"tco_formulas_{res.charger_variant_id}", on_change="rerun")
+            with tco_formula_exp:
+                if not tco_formula_exp.open:
+                    st.caption("Expand to load the formula breakdown.")
+                else:
+                    st.markdown(f"**Per-dock hours** — `hrs/day × 365 × years` = {station.operating_hours_per_day} × 365 × {sim_cfg.horizon_months/12:.0f} = **{per_dock_hrs:,.0f} hrs**")
+                    st.markdown(f"**Fleet operating hours** — `per_dock × total_docks` = {per_dock_hrs:,.0f} × {tco.total_docks} = **{tco.fleet_operating_hours:,.0f} hrs**")
+                    st.markdown(f"**Fleet failures** — `fleet_hours / MTBF` = {tco.fleet_operating_hours:,.0f} / {cv.mtbf_hours:,.0f} = **{tco.expected_failures_over_horizon:.2f}**")
+                    st.markdown(f"**Downtime** — `failures × MTTR` = {tco.expected_failures_over_horizon:.2f} × {cv.mttr_hours} = **{tco.total_downtime_hours:.1f} dock-hrs**")
+                    st.markdown(f"**Availability** — `MTBF / (MTBF + MTTR)` = {cv.mtbf_hours:,.0f} / ({cv.mtbf_hours:,.0f} + {cv.mttr_hours}) = **{tco.availability*100:.2f}%** ← steady-state statistic")
+                    st.markdown(f"**Fleet repairs** — `failures × repair_cost` = {tco.expected_failures_over_horizon:.2f} × {cv.repair_cost_per_event:,.0f} = **₹{tco.total_repair_cost:,.0f}**")
+                    st.markdown(f"**Fleet replacements** — `floor(failures / threshold)` = floor({tco.expected_failures_over_horizon:.2f} / {cv.replacement_threshold}) = **{tco.num_replacements}**")
 
         with st.expander("Pack failure TCO breakdown (fleet-level)"):
             st.caption(f"MTBF is a population statistic — all figures below are for the entire pack fleet of **{ptco.total_packs}** packs.")
-            ptco_rows = [
-                {"Item": "Total packs in fleet", "Value": f"{ptco.total_packs}"},
-                {"Item": f"Fleet operating hours ({sim_cfg.horizon_months/12:.0f} yr)", "Value": f"{ptco.fleet_operating_hours:,.0f} hrs"},
-                {"Item": "Availability  MTBF/(MTBF+MTTR)", "Value": f"{ptco.availability:.4f}  ({ptco.availability*100:.2f}%)"},
-                {"Item": f"Expected failures — fleet ({sim_cfg.horizon_months/12:.0f} yr)", "Value": f"{ptco.expected_failures:.2f}"},
-                {"Item": "Total repair cost (fleet)", "Value": f"₹{ptco.total_repair_cost:,.0f}"},
-                {"Item": "Full replacements (fleet)", "Value": f"{ptco.num_replacements}"},
-                {"Item": "Replacement cost (fleet)", "Value": f"₹{ptco.total_replacement_cost:,.0f}"},
-                {"Item": "Downtime (fleet pack-hours)", "Value": f"{ptco.total_downtime_hours:.1f} hrs"},
-                {"Item": "Lost revenue (downtime)", "Value": f"₹{ptco.lost_revenue_from_downtime:,.0f}"},
-                {"Item": "Spare inventory (fleet)", "Value": f"₹{ptco.spare_inventory_cost:,.0f}"},
-                {"Item": "TOTAL failure TCO (fleet)", "Value": f"₹{ptco.total_failure_tco:,.0f}"},
-                {"Item": "Failure cost per cycle", "Value": f"₹{ptco.failure_cost_per_cycle:.4f}"},
-            ]
-            st.dataframe(ptco_rows, use_container_width=True, hide_index=True)
+            st.dataframe(tables["ptco"], use_container_width=True, hide_index=True)
 
-            with st.expander("Show pack TCO formulas"):
-                st.markdown(f"**Fleet operating hours** — `hrs/day × 365 × years × packs` = {station.operating_hours_per_day} × 365 × {sim_cfg.horizon_months/12:.0f} × {ptco.total_packs} = **{ptco.fleet_operating_hours:,.0f} hrs**")
-                st.markdown(f"**Fleet failures** — `fleet_hours / MTBF` = {ptco.fleet_operating_hours:,.0f} / {p.mtbf_hours:,.0f} = **{ptco.expected_failures:.2f}**")
-                st.markdown(f"**Downtime** — `failures × MTTR` = {ptco.expected_failures:.2f} × {p.mttr_hours} = **{ptco.total_downtime_hours:.1f} pack-hrs**")
-                st.markdown(f"**Availability** — `MTBF / (MTBF + MTTR)` = {p.mtbf_hours:,.0f} / ({p.mtbf_hours:,.0f} + {p.mttr_hours}) = **{ptco.availability*100:.2f}%**")
-                st.markdown(f"**Fleet repairs** — `failures × repair_cost` = {ptco.expected_failures:.2f} × {p.repair_cost_per_event:,.0f} = **₹{ptco.total_repair_cost:,.0f}**")
-                st.markdown(f"**Fleet replacements** — `floor(failures / threshold)` = floor({ptco.expected_failures:.2f} / {p.replacement_threshold}) = **{ptco.num_replacements}**")
+            ptco_formula_exp = st.expander("Show pack TCO formulas", key=f"ptco_formulas_{res.charger_variant_id}", on_change="rerun")
+            with ptco_formula_exp:
+                if not ptco_formula_exp.open:
+                    st.caption("Expand to load the formula breakdown.")
+                else:
+                    st.markdown(f"**Fleet operating hours** — `hrs/day × 365 × years × packs` = {station.operating_hours_per_day} × 365 × {sim_cfg.horizon_months/12:.0f} × {ptco.total_packs} = **{ptco.fleet_operating_hours:,.0f} hrs**")
+                    st.markdown(f"**Fleet failures** — `fleet_hours / MTBF` = {ptco.fleet_operating_hours:,.0f} / {p.mtbf_hours:,.0f} = **{ptco.expected_failures:.2f}**")
+                    st.markdown(f"**Downtime** — `failures × MTTR` = {ptco.expected_failures:.2f} × {p.mttr_hours} = **{ptco.total_downtime_hours:.1f} pack-hrs**")
+                    st.markdown(f"**Availability** — `MTBF / (MTBF + MTTR)` = {p.mtbf_hours:,.0f} / ({p.mtbf_hours:,.0f} + {p.mttr_hours}) = **{ptco.availability*100:.2f}%**")
+                    st.markdown(f"**Fleet repairs** — `failures × repair_cost` = {ptco.expected_failures:.2f} × {p.repair_cost_per_event:,.0f} = **₹{ptco.total_repair_cost:,.0f}**")
+                    st.markdown(f"**Fleet replacements** — `floor(failures / threshold)` = floor({ptco.expected_failures:.2f} / {p.replacement_threshold}) = **{ptco.num_replacements}**")
+
+    # One stacked CPC bar per variant in a single chart, outside the per-variant tabs.
+    cpc_chart = pd.DataFrame(
+        _f32(_cpc_matrix),
+        index=[r.charger_variant_id for r in results], columns=[name for name, _ in _CPC_COMPONENTS],
+    )
+    st.bar_chart(cpc_chart, horizontal=True, height=280, y_label="₹ / cycle", use_container_width=True)
 
-    if multi_charger:
-        cpc_tabs = st.tabs([r.charger_variant_id for r in results])
-        for cpc_tab, res in zip(cpc_tabs, results):
-            with cpc_tab:
-                _render_cpc_block(res)
-    else:
-        _render_cpc_block(results[0])
+    _render_per_variant("cpc_variant", results, _render_cpc_block, _cv_by_name)
 
     # ── SECTION 3 — Cash Flow Timeline ──────────────────────────────────
     st.divider()
     st.header("Cash Flow Timeline")
 
-    if multi_charger:
-        cf_chart_data = {}
-        for res in results:
-            cf_chart_data[res.charger_variant_id] = [s.cumulative_cash_flow for s in res.months]
-        st.line_chart(cf_chart_data, y_label="Cumulative Cash Flow (₹)", x_label="Month", height=320, use_container_width=True)
-    else:
-        cf_chart_data = {"Cumulative CF": [s.cumulative_cash_flow for s in results[0].months]}
-        st.line_chart(cf_chart_data, y_label="Cumulative Cash Flow (₹)", x_label="Month", height=320, use_container_width=True)
+    # One month-indexed frame over the cached column arrays feeds the chart;
+    # kept float64 — see _f32 on cumulative ₹ series.
+    cf_chart_data = (
+        {res.charger_variant_id: _month_cols[id(res)]["cumulative_cash_flow"] for res in results}
+        if multi_charger else {"Cumulative CF": _month_cols[id(results[0])]["cumulative_cash_flow"]}
+    )
+    st.line_chart(_monthly(cf_chart_data), y_label="Cumulative Cash Flow (₹)", x_label="Month", height=320, use_container_width=True)
 
     if multi_charger:
         be_cols = st.columns(len(results))
@@ -1412,74 +1611,80 @@ with operations_tab:
         else:
             st.warning(f"No break-even within {sim_cfg.horizon_months} months")
 
+    @st.cache_data(max_entries=32, ttl=600, show_spinner=False)
+    def _cf_table(scenario_key: str, variant_key: str, _res: SimulationResult) -> pa.Table:
+        """Build the month-by-month cash-flow table for one charger variant.
+
+        Returned as an Arrow table: ``st.dataframe`` serialises it as-is,
+        without the pandas → Arrow conversion a DataFrame goes through.
+        """
+        mcols = _month_cols[id(_res)]
+        whole = {f: np.rint(mcols[f]).astype(np.int64) for f in (
+            "revenue", "opex_total", "capex_this_month", "net_cash_flow", "cumulative_cash_flow",
+        )}
+        cf_cols = {
+            "Month": mcols["month"], "Fleet": mcols["fleet_size"],
+            "Visits": mcols["swap_visits"], "Cycles": mcols["total_cycles"],
+            "Revenue (₹)": whole["revenue"],
+            "OpEx (₹)": whole["opex_total"],
+            "CapEx (₹)": whole["capex_this_month"],
+            "Net CF (₹)": whole["net_cash_flow"],
+            "Cum. CF (₹)": whole["cumulative_cash_flow"],
+        }
+        if _res.engine_type == "stochastic":
+            soh = pd.Series(_columns(_res.months, "avg_soh")["avg_soh"], dtype=float)
+            cf_cols["SOH"] = soh.map("{:.2%}".format).where(soh.notna(), "—").tolist()
+            cf_cols["Retired"] = mcols["packs_retired_this_month"]
+            cf_cols["Repl. CapEx (₹)"] = np.rint(mcols["replacement_capex_this_month"]).astype(np.int64)
+            cf_cols["Chrg Fails"] = mcols["charger_failures_this_month"]
+        return pa.table(cf_cols)
+
+    @st.fragment
     def _render_cf_block(res: SimulationResult):
-        cf_rows = []
-        is_stoch = res.engine_type == "stochastic"
-        for s in res.months:
-            row = {
-                "Month": s.month, "Fleet": s.fleet_size,
-                "Visits": s.swap_visits, "Cycles": s.total_cycles,
-                "Revenue (₹)": round(s.revenue),
-                "OpEx (₹)": round(s.opex_total),
-                "CapEx (₹)": round(s.capex_this_month),
-                "Net CF (₹)": round(s.net_cash_flow),
-                "Cum. CF (₹)": round(s.cumulative_cash_flow),
-            }
-            if is_stoch:
-                row["SOH"] = f"{s.avg_soh:.2%}" if s.avg_soh is not None else "—"
-                row["Retired"] = s.packs_retired_this_month or 0
-                row["Repl. CapEx (₹)"] = round(s.replacement_capex_this_month or 0)
-                row["Chrg Fails"] = s.charger_failures_this_month or 0
-            cf_rows.append(row)
-        st.dataframe(cf_rows, use_container_width=True, hide_index=True, height=min(400, 35 * len(cf_rows) + 38))
+        cf_df = _cf_table(_scenario_key, _cv_by_name[res.charger_variant_id].model_dump_json(), res)
+        st.dataframe(cf_df, use_container_width=True, hide_index=True, height=min(400, 35 * cf_df.num_rows + 38))
 
         sm = res.summary
         ncf_color = "#00b894" if sm.total_net_cash_flow >= 0 else "#d63031"
-        sm_cols = st.columns(4)
         sm_cards = [
-            ("📈", "Cumulative Revenue", _fmt_inr(sm.total_revenue), "#00b894"),
-            ("💸", "Cumulative OpEx", _fmt_inr(sm.total_opex), "#e17055"),
-            ("🏗️", "Cumulative CapEx", _fmt_inr(sm.total_capex), "#0984e3"),
-            ("💎", "Net Cash Flow", _fmt_inr(sm.total_net_cash_flow), ncf_color),
+            ("📈", "Cumulative Revenue", fmt_inr(sm.total_revenue), "#00b894"),
+            ("💸", "Cumulative OpEx", fmt_inr(sm.total_opex), "#e17055"),
+            ("🏗️", "Cumulative CapEx", fmt_inr(sm.total_capex), "#0984e3"),
+            ("💎", "Net Cash Flow", fmt_inr(sm.total_net_cash_flow), ncf_color),
         ]
-        for col, (icon, label, value, accent) in zip(sm_cols, sm_cards):
-            col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
+        st.markdown(card_row(sm_cards), unsafe_allow_html=True)
 
-    if multi_charger:
-        cf_tabs = st.tabs([r.charger_variant_id for r in results])
-        for cf_tab, res in zip(cf_tabs, results):
-            with cf_tab:
-                _render_cf_block(res)
-    else:
-        _render_cf_block(results[0])
+    _render_per_variant("cf_variant", results, _render_cf_block)
 
     # ── SECTION 4 — Charger Comparison ──────────────────────────────────
     if multi_charger:
         st.divider()
         st.header("Charger Variant Comparison")
-        best = min(results, key=lambda r: r.cpc_waterfall.total)
-        comp_rows = []
-        for res in results:
-            cv = next(c for c in charger_variants if c.name == res.charger_variant_id)
-            cpc = res.cpc_waterfall
-            dd = res.derived
-            cost_per_visit = cpc.total * v.packs_per_vehicle
-            rev_per_visit = revenue_cfg.price_per_swap
-            comp_rows.append({
-                "Charger": cv.name,
-                "Cost / slot (₹)": f"{cv.purchase_cost_per_slot:,.0f}",
-                "MTBF (hrs)": f"{cv.mtbf_hours:,.0f}",
-                "Charge time": f"{dd.charge_time_minutes:.1f} min",
-                "C-rate": f"{dd.effective_c_rate:.2f}",
-                "Fleet TCO (₹)": _fmt_inr(res.charger_tco.total_tco),
-                "CPC (₹/cycle)": f"{cpc.total:.2f}",
-                "Charger CPC (₹)": f"{cpc.charger:.4f}",
-                "Cost / visit (₹)": f"{cost_per_visit:.2f}",
-                "Margin / visit (₹)": f"{rev_per_visit - cost_per_visit:.2f}",
-                "Break-even": f"Mo. {res.summary.break_even_month}" if res.summary.break_even_month else "Never",
-                f"Net CF ({sim_cfg.horizon_months//12}yr)": _fmt_inr(res.summary.total_net_cash_flow),
-            })
-        st.dataframe(comp_rows, use_container_width=True, hide_index=True)
+        best = results[int(np.argmin(_cpc_totals))]
+        cmp_cvs = [_cv_by_name[r.charger_variant_id] for r in results]
+        slot_costs = np.fromiter((cv.purchase_cost_per_slot for cv in cmp_cvs), dtype=np.float64, count=len(cmp_cvs))
+        mtbfs = np.fromiter((cv.mtbf_hours for cv in cmp_cvs), dtype=np.float64, count=len(cmp_cvs))
+        charge_mins = np.fromiter((r.derived.charge_time_minutes for r in results), dtype=np.float64, count=len(results))
+        c_rates = np.fromiter((r.derived.effective_c_rate for r in results), dtype=np.float64, count=len(results))
+        fleet_tcos = np.fromiter((r.charger_tco.total_tco for r in results), dtype=np.float64, count=len(results))
+        net_cfs = np.fromiter((r.summary.total_net_cash_flow for r in results), dtype=np.float64, count=len(results))
+        cost_per_visit = _cpc_totals * v.packs_per_vehicle
+        margin_per_visit = revenue_cfg.price_per_swap - cost_per_visit
+        _fmt_2f = "{:.2f}".format
+        st.dataframe(pd.DataFrame({
+            "Charger": [cv.name for cv in cmp_cvs],
+            "Cost / slot (₹)": list(map("{:,.0f}".format, slot_costs.tolist())),
+            "MTBF (hrs)": list(map("{:,.0f}".format, mtbfs.tolist())),
+            "Charge time": list(map("{:.1f} min".format, charge_mins.tolist())),
+            "C-rate": list(map(_fmt_2f, c_rates.tolist())),
+            "Fleet TCO (₹)": list(map(fmt_inr, fleet_tcos.tolist())),
+            "CPC (₹/cycle)": list(map(_fmt_2f, _cpc_totals.tolist())),
+            "Charger CPC (₹)": list(map("{:.4f}".format, _cpc_matrix[:, 1].tolist())),  # "Charger" column
+            "Cost / visit (₹)": list(map(_fmt_2f, cost_per_visit.tolist())),
+            "Margin / visit (₹)": list(map(_fmt_2f, margin_per_visit.tolist())),
+            "Break-even": [_fmt_be(r.summary.break_even_month) for r in results],
+            f"Net CF ({sim_cfg.horizon_months//12}yr)": list(map(fmt_inr, net_cfs.tolist())),
+        }), use_container_width=True, hide_index=True)
         st.success(f"✅ **{best.charger_variant_id}** has the lowest cost per cycle at **₹{best.cpc_waterfall.total:.2f}**.")
 
     # ── Phase 2 dynamic sections ────────────────────────────────────────
@@ -1491,22 +1696,19 @@ with operations_tab:
         _next_section += 1
         st.header("Monte Carlo Analysis")
 
+        @st.fragment
         def _render_mc_block(res: SimulationResult):
             mc = res.monte_carlo
             if mc is None:
                 return
             st.markdown(f"**{res.charger_variant_id}** — {mc.num_runs} simulations")
             st.subheader("Net Cash Flow Distribution")
-            mc_cols = st.columns(3)
             mc_ncf_cards = [
-                ("📉", "P10 — Pessimistic", _fmt_inr(mc.ncf_p10), "#d63031"),
-                ("📊", "P50 — Median", _fmt_inr(mc.ncf_p50), "#6c5ce7"),
-                ("📈", "P90 — Optimistic", _fmt_inr(mc.ncf_p90), "#00b894"),
+                ("📉", "P10 — Pessimistic", fmt_inr(mc.ncf_p10), "#d63031"),
+                ("📊", "P50 — Median", fmt_inr(mc.ncf_p50), "#6c5ce7"),
+                ("📈", "P90 — Optimistic", fmt_inr(mc.ncf_p90), "#00b894"),
             ]
-            for col, (icon, label, value, accent) in zip(mc_cols, mc_ncf_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-            st.write("")
-            mc_cols2 = st.columns(4)
+            st.markdown(card_row(mc_ncf_cards, pad_below=True), unsafe_allow_html=True)
             be_p10_str = f"Month {mc.break_even_p10}" if mc.break_even_p10 else "Never"
             be_p50_str = f"Month {mc.break_even_p50}" if mc.break_even_p50 else "Never"
             be_p90_str = f"Month {mc.break_even_p90}" if mc.break_even_p90 else "Never"
@@ -1516,26 +1718,16 @@ with operations_tab:
                 ("💰", "CPC — Median", f"₹{mc.cpc_p50:.2f}", "#6c5ce7"),
                 ("📊", "CPC — Range", f"₹{mc.cpc_p10:.2f} – ₹{mc.cpc_p90:.2f}", "#0984e3"),
             ]
-            for col, (icon, label, value, accent) in zip(mc_cols2, mc_detail_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-            st.write("")
-            mc_cols3 = st.columns(4)
+            st.markdown(card_row(mc_detail_cards, pad_below=True), unsafe_allow_html=True)
             mc_fleet_cards = [
                 ("🔋", "Avg Packs Retired", f"{mc.avg_packs_retired:.0f}", "#e17055"),
                 ("🔋", "Max Packs Retired", f"{mc.max_packs_retired}", "#d63031"),
                 ("⚡", "Avg Charger Failures", f"{mc.avg_charger_failures:.0f}", "#fdcb6e"),
                 ("🚫", "Worst-Case Unserved", f"{mc.max_failure_to_serve}", "#d63031"),
             ]
-            for col, (icon, label, value, accent) in zip(mc_cols3, mc_fleet_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
+            st.markdown(card_row(mc_fleet_cards), unsafe_allow_html=True)
 
-        if multi_charger:
-            mc_tabs = st.tabs([r.charger_variant_id for r in results])
-            for mc_tab, res in zip(mc_tabs, results):
-                with mc_tab:
-                    _render_mc_block(res)
-        else:
-            _render_mc_block(results[0])
+        _render_per_variant("mc_variant", results, _render_mc_block)
 
     if _is_stochastic:
         st.divider()
@@ -1543,63 +1735,69 @@ with operations_tab:
         _next_section += 1
         st.header("Battery Health Tracker")
 
+        @st.fragment
         def _render_health_block(res: SimulationResult):
             months_data = res.months
             if not months_data or months_data[0].avg_soh is None:
                 st.info("No battery health data for this run.")
                 return
             sm = res.summary
-            h_cols = st.columns(4)
             h_cards = [
                 ("🔋", "Final Fleet SOH", f"{sm.mean_soh_at_end:.1%}" if sm.mean_soh_at_end else "—", "#00b894"),
-                ("♻️", "Packs Retired", f"{sm.total_packs_retired or 0:,}", "#e17055"),
-                ("💰", "Replacement Cost", _fmt_inr(sm.total_replacement_capex or 0), "#d63031"),
-                ("🔄", "Salvage Recovery", _fmt_inr(sm.total_salvage_credit or 0), "#fdcb6e"),
+                ("♻️", "Packs Retired", fmt_count(sm.total_packs_retired or 0), "#e17055"),
+                ("💰", "Replacement Cost", fmt_inr(sm.total_replacement_capex or 0), "#d63031"),
+                ("🔄", "Salvage Recovery", fmt_inr(sm.total_salvage_credit or 0), "#fdcb6e"),
             ]
-            for col, (icon, label, value, accent) in zip(h_cols, h_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-            st.write("")
+            st.markdown(card_row(h_cards, pad_below=True), unsafe_allow_html=True)
             st.subheader("Average SOH Trend")
-            soh_data = {"SOH": [m.avg_soh for m in months_data]}
-            st.line_chart(soh_data, y_label="State of Health", x_label="Month", height=280, use_container_width=True)
+            soh_data = {"SOH": _f32([m.avg_soh for m in months_data])}
+            st.line_chart(_monthly(soh_data), y_label="State of Health", x_label="Month", height=280, use_container_width=True)
             st.subheader("Replacement CapEx Timeline")
-            capex_data = {"Replacement CapEx (₹)": [m.replacement_capex_this_month or 0 for m in months_data]}
-            st.bar_chart(capex_data, y_label="₹", x_label="Month", height=280, use_container_width=True, color=["#e17055"])
+            hc = _month_cols[id(res)]
+            capex_data = {"Replacement CapEx (₹)": hc["replacement_capex_this_month"]}
+            st.bar_chart(_monthly(capex_data), y_label="₹", x_label="Month", height=280, use_container_width=True, color=["#e17055"])
             st.caption("Spikes represent cohort retirements — the real cash flow pattern investors must plan for.")
-            retirement_months = [m for m in months_data if (m.packs_retired_this_month or 0) > 0]
-            if retirement_months:
-                with st.expander(f"Retirement events ({len(retirement_months)} months)"):
-                    ret_rows = []
-                    for m in retirement_months:
-                        ret_rows.append({
-                            "Month": m.month,
-                            "Packs Retired": m.packs_retired_this_month,
-                            "Replacement CapEx (₹)": f"₹{m.replacement_capex_this_month:,.0f}" if m.replacement_capex_this_month else "₹0",
-                            "Salvage Credit (₹)": f"₹{m.salvage_credit_this_month:,.0f}" if m.salvage_credit_this_month else "₹0",
-                            "Fleet SOH": f"{m.avg_soh:.1%}" if m.avg_soh else "—",
+            ret_idx = np.flatnonzero(hc["packs_retired_this_month"] > 0)
+            if ret_idx.size:
+                ret_exp = st.expander(f"Retirement events ({ret_idx.size} months)", key=f"retirements_{res.charger_variant_id}", on_change="rerun")
+                with ret_exp:
+                    if not ret_exp.open:
+                        st.caption("Expand to load the retirement events.")
+                    else:
+                        ret_soh = hc["avg_soh"][ret_idx]
+                        ret_df = pd.DataFrame({
+                            "Month": hc["month"][ret_idx],
+                            "Packs Retired": hc["packs_retired_this_month"][ret_idx],
+                            "Replacement CapEx (₹)": rupees(hc["replacement_capex_this_month"][ret_idx]),
+                            "Salvage Credit (₹)": rupees(hc["salvage_credit_this_month"][ret_idx]),
+                            "Fleet SOH": np.where(ret_soh != 0, pd.Series(ret_soh).map("{:.1%}".format), "—"),
                         })
-                    st.dataframe(ret_rows, use_container_width=True, hide_index=True)
+                        st.dataframe(ret_df, use_container_width=True, hide_index=True)
             if res.cohort_history and len(res.cohort_history) > 0:
                 final_cohorts = res.cohort_history[-1]
-                with st.expander(f"Pack cohorts at month {len(months_data)} ({len(final_cohorts)} cohorts)"):
-                    cohort_rows = []
-                    for c in final_cohorts:
-                        cohort_rows.append({
-                            "Cohort": c.cohort_id, "Born": f"Month {c.born_month}",
-                            "Packs": c.pack_count, "SOH": f"{c.current_soh:.1%}",
-                            "Cycles": f"{c.cumulative_cycles:,}",
-                            "Status": "🔴 Retired" if c.is_retired else "🟢 Active",
-                            "Retired at": f"Month {c.retired_month}" if c.retired_month else "—",
-                        })
-                    st.dataframe(cohort_rows, use_container_width=True, hide_index=True)
-
-        if multi_charger:
-            h_tabs = st.tabs([r.charger_variant_id for r in results])
-            for h_tab, res in zip(h_tabs, results):
-                with h_tab:
-                    _render_health_block(res)
-        else:
-            _render_health_block(results[0])
+                cohort_exp = st.expander(
+                    f"Pack cohorts at month {len(months_data)} ({len(final_cohorts)} cohorts)",
+                    key=f"cohorts_{res.charger_variant_id}", on_change="rerun",
+                )
+                with cohort_exp:
+                    if not cohort_exp.open:
+                        st.caption("Expand to load the cohort listing.")
+                    else:
+                        cc = _columns(
+                            final_cohorts, "cohort_id", "born_month", "pack_count",
+                            "current_soh", "cumulative_cycles", "is_retired",
+                        )
+                        st.dataframe(pd.DataFrame({
+                            "Cohort": cc["cohort_id"],
+                            "Born": list(map("Month {}".format, cc["born_month"].tolist())),
+                            "Packs": cc["pack_count"],
+                            "SOH": list(map("{:.1%}".format, cc["current_soh"].tolist())),
+                            "Cycles": list(map("{:,}".format, cc["cumulative_cycles"].tolist())),
+                            "Status": np.where(cc["is_retired"], "🔴 Retired", "🟢 Active").astype(object),
+                            "Retired at": [f"Month {c.retired_month}" if c.retired_month else "—" for c in final_cohorts],
+                        }), use_container_width=True, hide_index=True)
+
+        _render_per_variant("health_variant", results, _render_health_block)
 
     if _is_stochastic:
         st.divider()
@@ -1607,38 +1805,29 @@ with operations_tab:
         _next_section += 1
         st.header("Charger Reliability")
 
-        def _render_reliability_block(res: SimulationResult):
+        @st.fragment
+        def _render_reliability_block(res: SimulationResult, cv: ChargerVariant):
             months_data = res.months
             if not months_data or months_data[0].charger_failures_this_month is None:
                 st.info("No charger failure data for this run.")
                 return
             sm = res.summary
-            cv = next(c for c in charger_variants if c.name == res.charger_variant_id)
-            r_cols = st.columns(4)
             r_cards = [
-                ("⚡", "Total Failures", f"{sm.total_charger_failures or 0:,}", "#e17055"),
+                ("⚡", "Total Failures", fmt_count(sm.total_charger_failures or 0), "#e17055"),
                 ("🛠️", "Mean Time Between Failures", f"{cv.mtbf_hours:,.0f} hrs", "#0984e3"),
                 ("⏱️", "Mean Time to Repair", f"{cv.mttr_hours:.0f} hrs", "#fdcb6e"),
                 ("📊", "Failure Distribution", cv.failure_distribution.title(), "#6c5ce7"),
             ]
-            for col, (icon, label, value, accent) in zip(r_cols, r_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-            st.write("")
+            st.markdown(card_row(r_cards, pad_below=True), unsafe_allow_html=True)
             st.subheader("Monthly Failure Events")
-            fail_data = {"Failures": [m.charger_failures_this_month or 0 for m in months_data]}
-            st.bar_chart(fail_data, y_label="Failures", x_label="Month", height=250, use_container_width=True, color=["#fdcb6e"])
+            fail_data = {"Failures": _month_cols[id(res)]["charger_failures_this_month"]}
+            st.bar_chart(_monthly(fail_data), y_label="Failures", x_label="Month", height=250, use_container_width=True, color=["#fdcb6e"])
             if cv.failure_distribution == "weibull" and cv.weibull_shape > 1:
                 st.caption(f"Weibull β = {cv.weibull_shape} → wear-out pattern: failures increase with charger age.")
             elif cv.failure_distribution == "weibull" and cv.weibull_shape < 1:
                 st.caption(f"Weibull β = {cv.weibull_shape} → infant mortality: failures decrease as early defects are weeded out.")
 
-        if multi_charger:
-            rel_tabs = st.tabs([r.charger_variant_id for r in results])
-            for rel_tab, res in zip(rel_tabs, results):
-                with rel_tab:
-                    _render_reliability_block(res)
-        else:
-            _render_reliability_block(results[0])
+        _render_per_variant("rel_variant", results, _render_reliability_block, _cv_by_name)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1651,8 +1840,10 @@ with finance_tab:
     st.caption("DCF · Debt Schedule · DSCR · P&L · Cash Flow Statement")
 
     # ── Compute finance for first charger (or primary) ──────────────────
-    def _compute_finance(res: SimulationResult, cv: ChargerVariant):
+    @st.cache_data(max_entries=32, ttl=600, show_spinner=False)
+    def _compute_finance(scenario_key: str, variant_key: str, _res: SimulationResult, _cv: ChargerVariant):
         """Run all Phase 3 finance modules for one charger variant."""
+        res, cv = _res, _cv
         d = res.derived
         per_station_capex = (
             station.cabinet_cost + station.site_prep_cost
@@ -1663,114 +1854,140 @@ with finance_tab:
             + cv.purchase_cost_per_slot * d.total_docks
             + p.unit_cost * d.total_packs
         )
-        total_salvage = d.total_packs * p.second_life_salvage_value
-
-        dcf = build_dcf_table(
-            res.months, res.summary, finance_cfg,
-            sim_cfg.discount_rate_annual, total_salvage,
+        total_salvage, dcf = _salvage_and_dcf(
+            res, finance_cfg, sim_cfg.discount_rate_annual, p.second_life_salvage_value,
         )
         debt = build_debt_schedule(total_initial_capex, finance_cfg, sim_cfg.horizon_months)
         dscr = compute_dscr(res.months, debt, finance_cfg, total_salvage)
         stmts = build_financial_statements(
             res.months, debt, finance_cfg, opex_cfg, station, p, cv, total_initial_capex,
         )
-        charger_npv = compute_charger_npv(cv, res.charger_tco, d, sim_cfg, station)
+        charger_npv = _cached_charger_npv(cv, res)
 
         return total_initial_capex, dcf, debt, dscr, stmts, charger_npv
 
+    @st.cache_data(max_entries=64, ttl=600, show_spinner=False)
+    def _charger_npv_for(
+        cv_key: str, tco_key: str, horizon_months: int, discount_rate: float,
+        _cv: ChargerVariant, _res: SimulationResult,
+    ):
+        """compute_charger_npv, keyed only on the inputs it reads.
+
+        Those are the variant, its TCO breakdown, the horizon and the
+        discount rate. Finance-only edits (debt, tax, …) hit the cache.
+        """
+        return compute_charger_npv(_cv, _res.charger_tco, _res.derived, sim_cfg, station)
+
+    def _cached_charger_npv(cv: ChargerVariant, res: SimulationResult):
+        return _charger_npv_for(
+            cv.model_dump_json(), res.charger_tco.model_dump_json(),
+            sim_cfg.horizon_months, sim_cfg.discount_rate_annual, cv, res,
+        )
+
+    def _compute_cnpv_all(all_results: list[SimulationResult]):
+        """Charger NPV for every variant, for the cross-variant comparison."""
+        cnpv_all = []
+        for res in all_results:
+            cv = _cv_by_name[res.charger_variant_id]
+            cnpv_all.append((cv, _cached_charger_npv(cv, res)))
+        return cnpv_all
+
     # ── Render finance for one variant ──────────────────────────────────
+    @st.fragment
     def _render_finance_block(res: SimulationResult, cv: ChargerVariant):
-        total_capex, dcf, debt, dscr, stmts, cnpv = _compute_finance(res, cv)
+        total_capex, dcf, debt, dscr, stmts, cnpv = _compute_finance(
+            _scenario_key, cv.model_dump_json(), res, cv,
+        )
 
         # ── DCF headline metrics ────────────────────────────────────────
         st.subheader("Discounted Cash Flow (DCF)")
-        dcf_cols = st.columns(4)
         npv_color = "#00b894" if dcf.npv >= 0 else "#d63031"
         irr_str = f"{dcf.irr:.1%}" if dcf.irr is not None else "N/A"
         payback_str = f"Month {dcf.discounted_payback_month}" if dcf.discounted_payback_month else "Never"
         dcf_cards = [
-            ("💎", "Net Present Value", _fmt_inr(dcf.npv), npv_color),
+            ("💎", "Net Present Value", fmt_inr(dcf.npv), npv_color),
             ("📈", "IRR (Annual)", irr_str, "#6c5ce7"),
             ("⏱️", "Payback Period", payback_str, "#0984e3"),
-            ("🏗️", "Terminal Value", _fmt_inr(dcf.terminal_value), "#fdcb6e"),
+            ("🏗️", "Terminal Value", fmt_inr(dcf.terminal_value), "#fdcb6e"),
         ]
-        for col, (icon, label, value, accent) in zip(dcf_cols, dcf_cards):
-            col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-        st.write("")
+        st.markdown(card_row(dcf_cards, pad_below=True), unsafe_allow_html=True)
 
         # PV cash flow chart
         st.subheader("Cumulative Present Value")
         pv_data = {"Cumulative PV (₹)": [r.cumulative_pv for r in dcf.monthly_dcf]}
-        st.line_chart(pv_data, y_label="₹ (Present Value)", x_label="Month", height=300, use_container_width=True)
+        st.line_chart(_monthly(pv_data), y_label="₹ (Present Value)", x_label="Month", height=300, use_container_width=True)
 
         with st.expander("Show DCF formulas"):
             r_m = (1 + sim_cfg.discount_rate_annual) ** (1/12) - 1
             st.markdown(f"**Annual discount rate** = {sim_cfg.discount_rate_annual:.1%}")
             st.markdown(f"**Monthly rate** = (1 + {sim_cfg.discount_rate_annual:.2f})^(1/12) − 1 = **{r_m:.6f}** ({r_m*100:.4f}%)")
-            st.markdown(f"**NPV** = Σ CF_t / (1 + r)^t + TV = **{_fmt_inr(dcf.npv)}**")
+            st.markdown(f"**NPV** = Σ CF_t / (1 + r)^t + TV = **{fmt_inr(dcf.npv)}**")
             if dcf.irr is not None:
                 st.markdown(f"**IRR** = rate where NPV = 0 → **{dcf.irr:.2%}** annual")
             st.markdown(f"**Terminal value method** = `{finance_cfg.terminal_value_method}`")
-            st.markdown(f"**Undiscounted total CF** = {_fmt_inr(dcf.undiscounted_total)}")
-
-        with st.expander("Monthly DCF table"):
-            dcf_rows = []
-            for r in dcf.monthly_dcf:
-                dcf_rows.append({
-                    "Month": r.month,
-                    "Discount Factor": f"{r.discount_factor:.6f}",
-                    "Nominal CF (₹)": f"₹{r.nominal_net_cf:,.0f}",
-                    "PV CF (₹)": f"₹{r.pv_net_cf:,.0f}",
-                    "Cumulative PV (₹)": f"₹{r.cumulative_pv:,.0f}",
+            st.markdown(f"**Undiscounted total CF** = {fmt_inr(dcf.undiscounted_total)}")
+
+        dcf_exp = st.expander("Monthly DCF table", key=f"dcf_table_{res.charger_variant_id}", on_change="rerun")
+        with dcf_exp:
+            if not dcf_exp.open:
+                st.caption("Expand to load the monthly DCF table.")
+            else:
+                dc = _columns(dcf.monthly_dcf, "month", "discount_factor", "nominal_net_cf", "pv_net_cf", "cumulative_pv")
+                dcf_df = pd.DataFrame({
+                    "Month": dc["month"],
+                    "Discount Factor": pd.Series(dc["discount_factor"]).map("{:.6f}".format),
+                    "Nominal CF (₹)": rupees(dc["nominal_net_cf"]),
+                    "PV CF (₹)": rupees(dc["pv_net_cf"]),
+                    "Cumulative PV (₹)": rupees(dc["cumulative_pv"]),
                 })
-            st.dataframe(dcf_rows, use_container_width=True, hide_index=True, height=min(400, 35 * len(dcf_rows) + 38))
+                st.dataframe(dcf_df, use_container_width=True, hide_index=True, height=min(400, 35 * len(dcf_df) + 38))
 
         # ── Debt Schedule ───────────────────────────────────────────────
         st.divider()
         st.subheader("Debt Schedule")
 
         if debt.loan_amount > 0:
-            debt_cols = st.columns(4)
             debt_cards = [
-                ("💰", "Loan Amount", _fmt_inr(debt.loan_amount), "#6c5ce7"),
+                ("💰", "Loan Amount", fmt_inr(debt.loan_amount), "#6c5ce7"),
                 ("📊", "Monthly Interest Rate", f"{debt.monthly_rate*100:.3f}%", "#0984e3"),
-                ("💸", "Total Interest Paid", _fmt_inr(debt.total_interest_paid), "#e17055"),
-                ("🏗️", "Total Principal Paid", _fmt_inr(debt.total_principal_paid), "#00b894"),
+                ("💸", "Total Interest Paid", fmt_inr(debt.total_interest_paid), "#e17055"),
+                ("🏗️", "Total Principal Paid", fmt_inr(debt.total_principal_paid), "#00b894"),
             ]
-            for col, (icon, label, value, accent) in zip(debt_cols, debt_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-            st.write("")
+            st.markdown(card_row(debt_cards, pad_below=True), unsafe_allow_html=True)
 
             with st.expander("Show debt formulas"):
-                st.markdown(f"**Loan** = CapEx × debt_pct = {_fmt_inr(total_capex)} × {finance_cfg.debt_pct_of_capex:.0%} = **{_fmt_inr(debt.loan_amount)}**")
+                st.markdown(f"**Loan** = CapEx × debt_pct = {fmt_inr(total_capex)} × {finance_cfg.debt_pct_of_capex:.0%} = **{fmt_inr(debt.loan_amount)}**")
                 st.markdown(f"**Monthly rate** = {finance_cfg.interest_rate_annual:.1%} / 12 = **{debt.monthly_rate*100:.3f}%**")
                 st.markdown(f"**Grace period** = {finance_cfg.grace_period_months} months (interest-only)")
                 amort = finance_cfg.loan_tenor_months - finance_cfg.grace_period_months
                 st.markdown(f"**Amortization** = {finance_cfg.loan_tenor_months} − {finance_cfg.grace_period_months} = **{amort} months**")
                 if debt.rows:
                     emi = debt.rows[finance_cfg.grace_period_months].emi if len(debt.rows) > finance_cfg.grace_period_months else 0
-                    st.markdown(f"**EMI** = P × r × (1+r)^n / ((1+r)^n − 1) = **{_fmt_inr(emi)}/month**")
+                    st.markdown(f"**EMI** = P × r × (1+r)^n / ((1+r)^n − 1) = **{fmt_inr(emi)}/month**")
 
             # EMI waterfall chart
             emi_int = [r.interest for r in debt.rows]
             emi_prin = [r.principal for r in debt.rows]
             st.subheader("EMI Breakdown")
             emi_chart = {"Interest": emi_int, "Principal": emi_prin}
-            st.bar_chart(emi_chart, y_label="₹", x_label="Month", height=280, use_container_width=True,
+            st.bar_chart(_monthly(emi_chart), y_label="₹", x_label="Month", height=280, use_container_width=True,
                          color=["#e17055", "#00b894"], stack=True)
 
-            with st.expander("Amortization schedule"):
-                debt_rows_display = []
-                for r in debt.rows:
-                    debt_rows_display.append({
-                        "Month": r.month,
-                        "Opening (₹)": f"₹{r.opening_balance:,.0f}",
-                        "Interest (₹)": f"₹{r.interest:,.0f}",
-                        "Principal (₹)": f"₹{r.principal:,.0f}",
-                        "EMI (₹)": f"₹{r.emi:,.0f}",
-                        "Closing (₹)": f"₹{r.closing_balance:,.0f}",
+            amort_exp = st.expander("Amortization schedule", key=f"amort_{res.charger_variant_id}", on_change="rerun")
+            with amort_exp:
+                if not amort_exp.open:
+                    st.caption("Expand to load the month-by-month schedule.")
+                else:
+                    dbc = _columns(debt.rows, "month", "opening_balance", "interest", "principal", "emi", "closing_balance")
+                    debt_df = pd.DataFrame({
+                        "Month": dbc["month"],
+                        "Opening (₹)": rupees(dbc["opening_balance"]),
+                        "Interest (₹)": rupees(dbc["interest"]),
+                        "Principal (₹)": rupees(dbc["principal"]),
+                        "EMI (₹)": rupees(dbc["emi"]),
+                        "Closing (₹)": rupees(dbc["closing_balance"]),
                     })
-                st.dataframe(debt_rows_display, use_container_width=True, hide_index=True, height=min(400, 35 * len(debt_rows_display) + 38))
+                    st.dataframe(debt_df, use_container_width=True, hide_index=True, height=min(400, 35 * len(debt_df) + 38))
         else:
             st.info("No debt configured (debt % = 0). The project is fully equity-funded.")
 
@@ -1779,7 +1996,6 @@ with finance_tab:
         st.subheader("Debt Service Coverage Ratio")
 
         if debt.loan_amount > 0:
-            dscr_cols = st.columns(4)
             min_dscr_color = "#00b894" if dscr.min_dscr >= finance_cfg.dscr_covenant_threshold else "#d63031"
             avg_dscr_color = "#00b894" if dscr.avg_dscr >= finance_cfg.dscr_covenant_threshold else "#d63031"
             dscr_cards = [
@@ -1788,20 +2004,25 @@ with finance_tab:
                 ("⚠️", "Covenant Threshold", f"{dscr.covenant_threshold:.2f}×", "#fdcb6e"),
                 ("🚨", "Covenant Breaches", f"{len(dscr.breach_months)}", "#d63031" if dscr.breach_months else "#00b894"),
             ]
-            for col, (icon, label, value, accent) in zip(dscr_cols, dscr_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-            st.write("")
+            st.markdown(card_row(dscr_cards, pad_below=True), unsafe_allow_html=True)
 
             if dscr.asset_cover_ratio is not None:
                 st.metric("Asset Cover Ratio", f"{dscr.asset_cover_ratio:.2f}×",
                           help="Remaining asset value ÷ outstanding loan balance at horizon end")
 
             # DSCR chart
-            import math as _math
-            finite_dscr = [d if not _math.isinf(d) else None for d in dscr.monthly_dscr]
-            dscr_chart = {"DSCR": finite_dscr}
-            st.line_chart(dscr_chart, y_label="DSCR", x_label="Month", height=280, use_container_width=True)
-            st.caption(f"Red zone = DSCR < {finance_cfg.dscr_covenant_threshold:.2f}× covenant threshold")
+            dscr_arr = np.asarray(dscr.monthly_dscr, dtype=np.float64)
+            dscr_arr[np.isinf(dscr_arr)] = np.nan  # NaN → gap
+            breach_mask = np.zeros(dscr_arr.size, dtype=bool)
+            breach_mask[np.asarray(dscr.breach_months, dtype=np.int64) - 1] = True
+            dscr_chart = {
+                "DSCR": _f32(dscr_arr),
+                "Covenant": np.full(dscr_arr.size, dscr.covenant_threshold, dtype=np.float32),
+                "Breach": _f32(np.where(breach_mask, dscr_arr, np.nan)),
+            }
+            st.line_chart(_monthly(dscr_chart), y_label="DSCR", x_label="Month", height=280, use_container_width=True,
+                          color=["#0984e3", "#fdcb6e", "#d63031"])
+            st.caption(f"Red = DSCR < {dscr.covenant_threshold:.2f}× covenant threshold")
 
             with st.expander("Show DSCR formula"):
                 st.markdown("**DSCR** = Net Operating Income / Debt Service")
@@ -1818,44 +2039,46 @@ with finance_tab:
         st.divider()
         st.subheader("Profit & Loss Statement")
 
+        _pnl_fields = {
+            "Revenue": "revenue",
+            "Elec.": "electricity_cost",
+            "Labor": "labor_cost",
+            "Gross": "gross_profit",
+            "Stn OpEx": "station_opex",
+            "EBITDA": "ebitda",
+            "Deprec.": "depreciation",
+            "EBIT": "ebit",
+            "Interest": "interest",
+            "EBT": "ebt",
+            "Tax": "tax",
+            "Net Inc.": "net_income",
+        }
+        pc = _columns(stmts.pnl, "month", *_pnl_fields.values())
+
         # EBITDA timeline
-        ebitda_data = {"EBITDA": [r.ebitda for r in stmts.pnl], "Net Income": [r.net_income for r in stmts.pnl]}
-        st.line_chart(ebitda_data, y_label="₹", x_label="Month", height=280, use_container_width=True)
+        ebitda_data = {"EBITDA": pc["ebitda"], "Net Income": pc["net_income"]}
+        st.line_chart(_monthly(ebitda_data), y_label="₹", x_label="Month", height=280, use_container_width=True)
 
         # Summary metrics
-        total_revenue = sum(r.revenue for r in stmts.pnl)
-        total_ebitda = sum(r.ebitda for r in stmts.pnl)
-        total_net_income = sum(r.net_income for r in stmts.pnl)
-        total_tax = sum(r.tax for r in stmts.pnl)
-        pnl_cols = st.columns(4)
+        total_revenue = float(pc["revenue"].sum())
+        total_ebitda = float(pc["ebitda"].sum())
+        total_net_income = float(pc["net_income"].sum())
+        total_tax = float(pc["tax"].sum())
         pnl_cards = [
-            ("📈", "Cumulative Revenue", _fmt_inr(total_revenue), "#00b894"),
-            ("💰", "Cumulative EBITDA", _fmt_inr(total_ebitda), "#6c5ce7"),
-            ("💸", "Cumulative Tax", _fmt_inr(total_tax), "#e17055"),
-            ("🎯", "Net Income", _fmt_inr(total_net_income), "#00b894" if total_net_income >= 0 else "#d63031"),
+            ("📈", "Cumulative Revenue", fmt_inr(total_revenue), "#00b894"),
+            ("💰", "Cumulative EBITDA", fmt_inr(total_ebitda), "#6c5ce7"),
+            ("💸", "Cumulative Tax", fmt_inr(total_tax), "#e17055"),
+            ("🎯", "Net Income", fmt_inr(total_net_income), "#00b894" if total_net_income >= 0 else "#d63031"),
         ]
-        for col, (icon, label, value, accent) in zip(pnl_cols, pnl_cards):
-            col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-
-        with st.expander("Monthly P&L detail"):
-            pnl_rows = []
-            for r in stmts.pnl:
-                pnl_rows.append({
-                    "Mo": r.month,
-                    "Revenue": f"₹{r.revenue:,.0f}",
-                    "Elec.": f"₹{r.electricity_cost:,.0f}",
-                    "Labor": f"₹{r.labor_cost:,.0f}",
-                    "Gross": f"₹{r.gross_profit:,.0f}",
-                    "Stn OpEx": f"₹{r.station_opex:,.0f}",
-                    "EBITDA": f"₹{r.ebitda:,.0f}",
-                    "Deprec.": f"₹{r.depreciation:,.0f}",
-                    "EBIT": f"₹{r.ebit:,.0f}",
-                    "Interest": f"₹{r.interest:,.0f}",
-                    "EBT": f"₹{r.ebt:,.0f}",
-                    "Tax": f"₹{r.tax:,.0f}",
-                    "Net Inc.": f"₹{r.net_income:,.0f}",
-                })
-            st.dataframe(pnl_rows, use_container_width=True, hide_index=True, height=min(400, 35 * len(pnl_rows) + 38))
+        st.markdown(card_row(pnl_cards), unsafe_allow_html=True)
+
+        pnl_exp = st.expander("Monthly P&L detail", key=f"pnl_detail_{res.charger_variant_id}", on_change="rerun")
+        with pnl_exp:
+            if not pnl_exp.open:
+                st.caption("Expand to load the monthly P&L.")
+            else:
+                pnl_df = pd.DataFrame({"Mo": pc["month"], **{lab: rupees(pc[f]) for lab, f in _pnl_fields.items()}})
+                st.dataframe(pnl_df, use_container_width=True, hide_index=True, height=min(400, 35 * len(pnl_df) + 38))
 
         with st.expander("Show P&L formulas"):
             st.markdown("**Gross Profit** = Revenue − Electricity − Labor")
@@ -1870,39 +2093,36 @@ with finance_tab:
         st.divider()
         st.subheader("Cash Flow Statement")
 
-        cf_op = [r.operating_cf for r in stmts.cash_flow]
-        cf_inv = [r.investing_cf for r in stmts.cash_flow]
-        cf_fin = [r.financing_cf for r in stmts.cash_flow]
-        cf_cum = [r.cumulative_cf for r in stmts.cash_flow]
+        cc = _columns(stmts.cash_flow, "month", "operating_cf", "investing_cf", "financing_cf", "net_cf", "cumulative_cf")
 
         st.subheader("Cumulative Cash Flow (Financed)")
-        st.line_chart({"Cumulative CF (financed)": cf_cum}, y_label="₹", x_label="Month", height=280, use_container_width=True)
+        st.line_chart(_monthly({"Cumulative CF (financed)": cc["cumulative_cf"]}), y_label="₹", x_label="Month", height=280, use_container_width=True)
 
-        total_op = sum(cf_op)
-        total_inv = sum(cf_inv)
-        total_fin = sum(cf_fin)
-        cf_cols = st.columns(4)
+        total_op = float(cc["operating_cf"].sum())
+        total_inv = float(cc["investing_cf"].sum())
+        total_fin = float(cc["financing_cf"].sum())
         cf_cards = [
-            ("🔄", "Operating Cash Flow", _fmt_inr(total_op), "#00b894"),
-            ("🏗️", "Investing Cash Flow", _fmt_inr(total_inv), "#0984e3"),
-            ("🏦", "Financing Cash Flow", _fmt_inr(total_fin), "#6c5ce7"),
-            ("💎", "Net Cash Flow", _fmt_inr(total_op + total_inv + total_fin), "#00b894" if (total_op + total_inv + total_fin) >= 0 else "#d63031"),
+            ("🔄", "Operating Cash Flow", fmt_inr(total_op), "#00b894"),
+            ("🏗️", "Investing Cash Flow", fmt_inr(total_inv), "#0984e3"),
+            ("🏦", "Financing Cash Flow", fmt_inr(total_fin), "#6c5ce7"),
+            ("💎", "Net Cash Flow", fmt_inr(total_op + total_inv + total_fin), "#00b894" if (total_op + total_inv + total_fin) >= 0 else "#d63031"),
         ]
-        for col, (icon, label, value, accent) in zip(cf_cols, cf_cards):
-            col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-
-        with st.expander("Monthly cash flow detail"):
-            cfs_rows = []
-            for r in stmts.cash_flow:
-                cfs_rows.append({
-                    "Mo": r.month,
-                    "Operating (₹)": f"₹{r.operating_cf:,.0f}",
-                    "Investing (₹)": f"₹{r.investing_cf:,.0f}",
-                    "Financing (₹)": f"₹{r.financing_cf:,.0f}",
-                    "Net CF (₹)": f"₹{r.net_cf:,.0f}",
-                    "Cumulative (₹)": f"₹{r.cumulative_cf:,.0f}",
+        st.markdown(card_row(cf_cards), unsafe_allow_html=True)
+
+        cfs_exp = st.expander("Monthly cash flow detail", key=f"cf_detail_{res.charger_variant_id}", on_change="rerun")
+        with cfs_exp:
+            if not cfs_exp.open:
+                st.caption("Expand to load the monthly cash flow statement.")
+            else:
+                cfs_df = pd.DataFrame({
+                    "Mo": cc["month"],
+                    "Operating (₹)": rupees(cc["operating_cf"]),
+                    "Investing (₹)": rupees(cc["investing_cf"]),
+                    "Financing (₹)": rupees(cc["financing_cf"]),
+                    "Net CF (₹)": rupees(cc["net_cf"]),
+                    "Cumulative (₹)": rupees(cc["cumulative_cf"]),
                 })
-            st.dataframe(cfs_rows, use_container_width=True, hide_index=True, height=min(400, 35 * len(cfs_rows) + 38))
+                st.dataframe(cfs_df, use_container_width=True, hide_index=True, height=min(400, 35 * len(cfs_df) + 38))
 
         with st.expander("Show cash flow formulas"):
             st.markdown("**Operating CF** = Revenue − Cash OpEx (no depreciation)")
@@ -1914,201 +2134,212 @@ with finance_tab:
         st.divider()
         st.subheader("Charger TCO Comparison (NPV)")
 
-        cnpv_results = []
-        for res in results:
-            cv = next(c for c in charger_variants if c.name == res.charger_variant_id)
-            cnpv = compute_charger_npv(cv, res.charger_tco, res.derived, sim_cfg, station)
-            cnpv_results.append((cv, cnpv))
+        cnpv_results = _compute_cnpv_all(results)
 
         if len(cnpv_results) > 1:
             # Comparison table
-            cnpv_rows = []
-            for cv, cnpv in cnpv_results:
-                cnpv_rows.append({
-                    "Charger": cnpv.charger_name,
-                    "Undiscounted TCO": _fmt_inr(cnpv.undiscounted_tco),
-                    "NPV(TCO)": _fmt_inr(cnpv.npv_tco),
-                    "PV(Purchase)": _fmt_inr(cnpv.pv_purchase),
-                    "PV(Repairs)": _fmt_inr(cnpv.pv_repairs),
-                    "PV(Replacements)": _fmt_inr(cnpv.pv_replacements),
-                    "PV(Lost Rev)": _fmt_inr(cnpv.pv_lost_revenue),
-                    "Disc. CPC (₹)": f"₹{cnpv.discounted_cpc:.4f}",
-                })
-            st.dataframe(cnpv_rows, use_container_width=True, hide_index=True)
+            nc = _columns(
+                [cnpv for _, cnpv in cnpv_results], "charger_name", "undiscounted_tco", "npv_tco",
+                "pv_purchase", "pv_repairs", "pv_replacements", "pv_lost_revenue", "discounted_cpc",
+            )
+            st.dataframe(pd.DataFrame({
+                "Charger": nc["charger_name"].astype(object),
+                "Undiscounted TCO": list(map(fmt_inr, nc["undiscounted_tco"].tolist())),
+                "NPV(TCO)": list(map(fmt_inr, nc["npv_tco"].tolist())),
+                "PV(Purchase)": list(map(fmt_inr, nc["pv_purchase"].tolist())),
+                "PV(Repairs)": list(map(fmt_inr, nc["pv_repairs"].tolist())),
+                "PV(Replacements)": list(map(fmt_inr, nc["pv_replacements"].tolist())),
+                "PV(Lost Rev)": list(map(fmt_inr, nc["pv_lost_revenue"].tolist())),
+                "Disc. CPC (₹)": list(map("₹{:.4f}".format, nc["discounted_cpc"].tolist())),
+            }), use_container_width=True, hide_index=True)
 
             best_cnpv = min(cnpv_results, key=lambda x: x[1].npv_tco)
-            st.success(f"✅ **{best_cnpv[1].charger_name}** has the lowest discounted TCO at **{_fmt_inr(best_cnpv[1].npv_tco)}** (NPV).")
+            st.success(f"✅ **{best_cnpv[1].charger_name}** has the lowest discounted TCO at **{fmt_inr(best_cnpv[1].npv_tco)}** (NPV).")
 
             # Discounted CPC trajectory
             st.subheader("Discounted Cost per Cycle Trend")
             dcpc_chart = {}
             for cv, cnpv in cnpv_results:
-                dcpc_chart[cnpv.charger_name] = cnpv.monthly_discounted_cpc
-            st.line_chart(dcpc_chart, y_label="₹ / cycle (discounted)", x_label="Month", height=280, use_container_width=True)
+                dcpc_chart[cnpv.charger_name] = _f32(cnpv.monthly_discounted_cpc)
+            st.line_chart(_monthly(dcpc_chart), y_label="₹ / cycle (discounted)", x_label="Month", height=280, use_container_width=True)
         else:
             cv, cnpv = cnpv_results[0]
-            cnpv_cols = st.columns(4)
             cnpv_cards = [
-                ("💰", "NPV of Total Cost", _fmt_inr(cnpv.npv_tco), "#6c5ce7"),
+                ("💰", "NPV of Total Cost", fmt_inr(cnpv.npv_tco), "#6c5ce7"),
                 ("📊", "Discounted CPC", f"₹{cnpv.discounted_cpc:.4f}", "#0984e3"),
-                ("🔧", "PV of Repairs", _fmt_inr(cnpv.pv_repairs), "#e17055"),
-                ("♻️", "PV of Replacements", _fmt_inr(cnpv.pv_replacements), "#fdcb6e"),
+                ("🔧", "PV of Repairs", fmt_inr(cnpv.pv_repairs), "#e17055"),
+                ("♻️", "PV of Replacements", fmt_inr(cnpv.pv_replacements), "#fdcb6e"),
             ]
-            for col, (icon, label, value, accent) in zip(cnpv_cols, cnpv_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-            st.write("")
+            st.markdown(card_row(cnpv_cards, pad_below=True), unsafe_allow_html=True)
 
             with st.expander("Show charger NPV formulas"):
                 st.markdown(f"**NPV(TCO)** = PV(purchase) + PV(repairs) + PV(replacements) + PV(lost_rev) + PV(spares)")
-                st.markdown(f"= {_fmt_inr(cnpv.pv_purchase)} + {_fmt_inr(cnpv.pv_repairs)} + {_fmt_inr(cnpv.pv_replacements)} + {_fmt_inr(cnpv.pv_lost_revenue)} + {_fmt_inr(cnpv.pv_spares)} = **{_fmt_inr(cnpv.npv_tco)}**")
+                st.markdown(f"= {fmt_inr(cnpv.pv_purchase)} + {fmt_inr(cnpv.pv_repairs)} + {fmt_inr(cnpv.pv_replacements)} + {fmt_inr(cnpv.pv_lost_revenue)} + {fmt_inr(cnpv.pv_spares)} = **{fmt_inr(cnpv.npv_tco)}**")
                 st.markdown(f"**Discounted CPC** = NPV(TCO) / PV(cycles_served) = **₹{cnpv.discounted_cpc:.4f}**")
 
     # ── Render per charger variant ──────────────────────────────────────
-    if multi_charger:
-        fin_tabs = st.tabs([r.charger_variant_id for r in results])
-        for fin_tab, res in zip(fin_tabs, results):
-            cv = next(c for c in charger_variants if c.name == res.charger_variant_id)
-            with fin_tab:
-                _render_finance_block(res, cv)
-    else:
-        cv0 = next(c for c in charger_variants if c.name == results[0].charger_variant_id)
-        _render_finance_block(results[0], cv0)
+    _render_per_variant("fin_variant", results, _render_finance_block, _cv_by_name)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # ==================  INTELLIGENCE TAB  ====================================
 # ═══════════════════════════════════════════════════════════════════════════
+_INTEL_WIDGET_KEYS = (
+    "ps_target", "ps_conf", "ps_min", "ps_max", "ps_be", "ps_iter", "ps_cv",
+    "fd_cv", "at_conf",
+)
+
 with intelligence_tab:
 
-    st.divider()
-    st.header("Pilot Sizing Optimizer")
-    st.caption("Find the minimum fleet size to achieve your financial target")
-
-    # ── Pilot sizing controls ─────────────────────────────────────────
-    ps_cols = st.columns([1, 1, 1, 1])
-    _TARGET_OPTS = ["positive_npv", "positive_ncf", "break_even_within"]
-    _TARGET_LABELS = {
-        "positive_npv": "Positive NPV",
-        "positive_ncf": "Positive Net Cash Flow",
-        "break_even_within": "Break-even within N months",
-    }
-    ps_target = ps_cols[0].selectbox(
-        "Target metric", _TARGET_OPTS,
-        format_func=lambda x: _TARGET_LABELS[x],
-        key="ps_target",
-    )
-    ps_confidence = ps_cols[1].number_input(
-        "Confidence %", 10.0, 99.0, 50.0, 10.0,
-        key="ps_conf",
-        help="For stochastic: 50 = median must pass, 90 = P10 must pass",
-    )
-    ps_min = ps_cols[2].number_input("Min fleet", 10, 10000, 10, 10, key="ps_min")
-    ps_max = ps_cols[3].number_input("Max fleet", 50, 50000, 2000, 100, key="ps_max")
+    # Only the CSV uploaders are built while this tab is closed (so uploads
+    # survive a tab switch).  The other inputs are skipped, and re-assigning
+    # their keys keeps Streamlit from dropping the user's values meanwhile.
+    if not intelligence_tab.open:
+        for _k in _INTEL_WIDGET_KEYS:
+            if _k in st.session_state:
+                st.session_state[_k] = st.session_state[_k]
+    else:
+        # Phase 4 engines are only needed here, so they load on the first
+        # visit rather than at app start.
+        from zng_simulator.engine.field_data import (
+            apply_tuned_parameters,
+            auto_tune_parameters,
+            compute_variance_report,
+            ingest_bms_csv,
+            ingest_charger_csv,
+        )
+        from zng_simulator.engine.optimizer import find_minimum_fleet_size, find_optimal_scale
 
-    ps_extra_cols = st.columns([1, 1, 2])
-    ps_be_target = ps_extra_cols[0].number_input(
-        "Break-even target (months)", 6, 240, sim_cfg.horizon_months, 6,
-        key="ps_be", disabled=(ps_target != "break_even_within"),
-    )
-    ps_max_iter = ps_extra_cols[1].number_input(
-        "Max search steps", 3, 30, 15, 1, key="ps_iter",
-    )
-    ps_charger_idx = 0
-    if multi_charger:
-        ps_charger_idx = ps_extra_cols[2].selectbox(
-            "Charger variant", range(len(charger_variants)),
-            format_func=lambda i: charger_variants[i].name,
-            key="ps_cv",
+    @st.fragment
+    def _render_pilot_sizing():
+        """Pilot-sizing controls and results, rerun on their own widgets only."""
+        st.divider()
+        st.header("Pilot Sizing Optimizer")
+        st.caption("Find the minimum fleet size to achieve your financial target")
+
+        # ── Pilot sizing controls ─────────────────────────────────────────
+        ps_cols = st.columns([1, 1, 1, 1])
+        _TARGET_OPTS = ["positive_npv", "positive_ncf", "break_even_within"]
+        _TARGET_LABELS = {
+            "positive_npv": "Positive NPV",
+            "positive_ncf": "Positive Net Cash Flow",
+            "break_even_within": "Break-even within N months",
+        }
+        ps_target = ps_cols[0].selectbox(
+            "Target metric", _TARGET_OPTS,
+            format_func=lambda x: _TARGET_LABELS[x],
+            key="ps_target",
+        )
+        ps_confidence = ps_cols[1].number_input(
+            "Confidence %", 10.0, 99.0, 50.0, 10.0,
+            key="ps_conf",
+            help="For stochastic: 50 = median must pass, 90 = P10 must pass",
         )
+        ps_min = ps_cols[2].number_input("Min fleet", 10, 10000, 10, 10, key="ps_min")
+        ps_max = ps_cols[3].number_input("Max fleet", 50, 50000, 2000, 100, key="ps_max")
 
-    _ps_mode_cols = st.columns(2)
-    ps_run_binary = _ps_mode_cols[0].button(
-        "🔍  Binary Search (min fleet)", type="primary", key="ps_run_bin",
-    )
-    ps_run_eval = _ps_mode_cols[1].button(
-        "📊  Evaluate Specific Sizes", key="ps_run_eval",
-    )
+        ps_extra_cols = st.columns([1, 1, 2])
+        ps_be_target = ps_extra_cols[0].number_input(
+            "Break-even target (months)", 6, 240, sim_cfg.horizon_months, 6,
+            key="ps_be", disabled=(ps_target != "break_even_within"),
+        )
+        ps_max_iter = ps_extra_cols[1].number_input(
+            "Max search steps", 3, 30, 15, 1, key="ps_iter",
+        )
+        ps_charger_idx = 0
+        if multi_charger:
+            ps_charger_idx = _cv_index_by_name[ps_extra_cols[2].selectbox(
+                "Charger variant", list(_cv_index_by_name), key="ps_cv",
+            )]
 
-    if ps_run_binary:
-        with st.spinner("Searching for minimum viable fleet size…"):
-            ps_result = find_minimum_fleet_size(
-                scenario, charger_variants[ps_charger_idx],
-                target_metric=ps_target,
-                target_confidence_pct=ps_confidence,
-                min_fleet=ps_min, max_fleet=ps_max,
-                max_iterations=ps_max_iter,
-                break_even_target_months=ps_be_target if ps_target == "break_even_within" else None,
-            )
-        st.session_state["ps_result"] = ps_result
-
-    if ps_run_eval:
-        # Build fleet sizes to evaluate: from min to max in 5–8 steps
-        _step = max(1, (ps_max - ps_min) // 7)
-        _fleet_sizes = list(range(ps_min, ps_max + 1, _step))
-        if ps_max not in _fleet_sizes:
-            _fleet_sizes.append(ps_max)
-        with st.spinner(f"Evaluating {len(_fleet_sizes)} fleet sizes…"):
-            ps_result = find_optimal_scale(
-                scenario, charger_variants[ps_charger_idx],
-                fleet_sizes=_fleet_sizes,
-                target_metric=ps_target,
-                target_confidence_pct=ps_confidence,
-            )
-        st.session_state["ps_result"] = ps_result
+        _ps_mode_cols = st.columns(2)
+        ps_run_binary = _ps_mode_cols[0].button(
+            "🔍  Binary Search (min fleet)", type="primary", key="ps_run_bin",
+        )
+        ps_run_eval = _ps_mode_cols[1].button(
+            "📊  Evaluate Specific Sizes", key="ps_run_eval",
+        )
+
+        # Each stochastic evaluation is a full Monte-Carlo run, which easily repays
+        # worker start-up; static evaluations are too cheap to be worth a pool.
+        _ps_workers = max(1, (os.cpu_count() or 2) // 2) if sim_engine == "stochastic" else None
+
+        if ps_run_binary:
+            with st.spinner("Searching for minimum viable fleet size…"):
+                ps_result = find_minimum_fleet_size(
+                    scenario, charger_variants[ps_charger_idx],
+                    target_metric=ps_target,
+                    target_confidence_pct=ps_confidence,
+                    min_fleet=ps_min, max_fleet=ps_max,
+                    max_iterations=ps_max_iter,
+                    break_even_target_months=ps_be_target if ps_target == "break_even_within" else None,
+                    max_workers=_ps_workers,
+                )
+            st.session_state["ps_result"] = ps_result
+
+        if ps_run_eval:
+            # Build fleet sizes to evaluate: from min to max in 5–8 steps
+            _step = max(1, (ps_max - ps_min) // 7)
+            _fleet_sizes = list(range(ps_min, ps_max + 1, _step))
+            if ps_max not in _fleet_sizes:
+                _fleet_sizes.append(ps_max)
+            with st.spinner(f"Evaluating {len(_fleet_sizes)} fleet sizes…"):
+                ps_result = find_optimal_scale(
+                    scenario, charger_variants[ps_charger_idx],
+                    fleet_sizes=_fleet_sizes,
+                    target_metric=ps_target,
+                    target_confidence_pct=ps_confidence,
+                    max_workers=_ps_workers,
+                )
+            st.session_state["ps_result"] = ps_result
 
-    if "ps_result" in st.session_state:
-        psr = st.session_state["ps_result"]
+        if "ps_result" in st.session_state:
+            psr = st.session_state["ps_result"]
 
-        if psr.achieved:
-            st.success(f"✅ Target achievable! Recommended fleet: **{psr.recommended_fleet_size:,} vehicles**")
-        else:
-            st.warning(f"⚠️ Target not achievable within search range ({ps_min:,}–{ps_max:,} vehicles)")
-
-        ps_card_cols = st.columns(4)
-        ps_cards = [
-            ("🚗", "Recommended Fleet Size", f"{psr.recommended_fleet_size:,}", "#6c5ce7"),
-            ("💎", "Projected NPV", _fmt_inr(psr.best_npv) if psr.best_npv is not None else "N/A",
-             "#00b894" if psr.best_npv and psr.best_npv > 0 else "#d63031"),
-            ("⏱️", "Break-even Month", f"Mo. {psr.best_break_even_month}" if psr.best_break_even_month else "Never", "#0984e3"),
-            ("📊", "Monthly Net CF", _fmt_inr(psr.best_monthly_ncf_at_target) if psr.best_monthly_ncf_at_target else "N/A", "#fdcb6e"),
-        ]
-        for col, (icon, label, value, accent) in zip(ps_card_cols, ps_cards):
-            col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-        st.write("")
-
-        st.markdown(f"**Search iterations**: {psr.search_iterations} · "
-                    f"**Target**: {_TARGET_LABELS.get(psr.target_metric, psr.target_metric)} · "
-                    f"**Confidence**: {psr.target_confidence_pct:.0f}%")
-
-        if psr.search_log:
-            with st.expander(f"Search log ({len(psr.search_log)} evaluations)"):
-                log_rows = []
-                for entry in psr.search_log:
-                    npv_val = entry.get("npv")
-                    ncf_val = entry.get("ncf")
-                    log_rows.append({
-                        "Fleet Size": entry["fleet_size"],
-                        "NPV": _fmt_inr(npv_val) if npv_val is not None else "N/A",
-                        "NCF": _fmt_inr(ncf_val) if ncf_val is not None else "N/A",
-                        "Break-even": f"Mo. {entry['break_even_month']}" if entry.get("break_even_month") else "Never",
-                        "Passed": "✅" if entry.get("passed") else "❌",
+            if psr.achieved:
+                st.success(f"✅ Target achievable! Recommended fleet: **{psr.recommended_fleet_size:,} vehicles**")
+            else:
+                st.warning(f"⚠️ Target not achievable within search range ({ps_min:,}–{ps_max:,} vehicles)")
+
+            ps_cards = [
+                ("🚗", "Recommended Fleet Size", fmt_count(psr.recommended_fleet_size), "#6c5ce7"),
+                ("💎", "Projected NPV", fmt_inr(psr.best_npv) if psr.best_npv is not None else "N/A",
+                 "#00b894" if psr.best_npv and psr.best_npv > 0 else "#d63031"),
+                ("⏱️", "Break-even Month", _fmt_be(psr.best_break_even_month), "#0984e3"),
+                ("📊", "Monthly Net CF", fmt_inr(psr.best_monthly_ncf_at_target) if psr.best_monthly_ncf_at_target else "N/A", "#fdcb6e"),
+            ]
+            st.markdown(card_row(ps_cards, pad_below=True), unsafe_allow_html=True)
+
+            st.markdown(f"**Search iterations**: {psr.search_iterations} · "
+                        f"**Target**: {_TARGET_LABELS.get(psr.target_metric, psr.target_metric)} · "
+                        f"**Confidence**: {psr.target_confidence_pct:.0f}%")
+
+            if psr.search_log:
+                log_df = pd.DataFrame.from_records(
+                    psr.search_log, columns=["fleet_size", "npv", "ncf", "break_even_month", "passed"],
+                )
+                with st.expander(f"Search log ({len(psr.search_log)} evaluations)"):
+                    be = log_df["break_even_month"].fillna(0).astype(np.int64)
+                    log_table = pd.DataFrame({
+                        "Fleet Size": log_df["fleet_size"],
+                        "NPV": log_df["npv"].map(fmt_inr, na_action="ignore").fillna("N/A"),
+                        "NCF": log_df["ncf"].map(fmt_inr, na_action="ignore").fillna("N/A"),
+                        "Break-even": np.where(be > 0, "Mo. " + be.astype(str), "Never"),
+                        "Passed": np.where(log_df["passed"].fillna(False).astype(bool), "✅", "❌"),
                     })
-                st.dataframe(log_rows, use_container_width=True, hide_index=True)
-
-            # NPV vs fleet size chart
-            fleet_sizes_log = [e["fleet_size"] for e in psr.search_log]
-            npvs_log = [e.get("npv", 0) or 0 for e in psr.search_log]
-            if len(fleet_sizes_log) > 1:
-                # Sort by fleet size for chart
-                sorted_pairs = sorted(zip(fleet_sizes_log, npvs_log))
-                st.subheader("NPV vs Fleet Size")
-                chart_data = {"NPV (₹)": [p[1] for p in sorted_pairs]}
-                st.bar_chart(chart_data, y_label="NPV (₹)", x_label="Fleet Size", height=280,
-                             use_container_width=True)
-                st.caption("Fleet sizes evaluated: " + ", ".join(str(p[0]) for p in sorted_pairs))
-
-        with st.expander("Show methodology"):
-            st.markdown("""
+                    st.dataframe(log_table, use_container_width=True, hide_index=True)
+
+                # NPV vs fleet size chart
+                by_fleet = psr.search_log_by_fleet_size
+                if len(by_fleet) > 1:
+                    st.subheader("NPV vs Fleet Size")
+                    chart_data = {"NPV (₹)": psr.npv_by_fleet_size}
+                    st.bar_chart(chart_data, y_label="NPV (₹)", x_label="Fleet Size", height=280,
+                                 use_container_width=True)
+                    st.caption("Fleet sizes evaluated: " + ", ".join(str(e["fleet_size"]) for e in by_fleet))
+
+            with st.expander("Show methodology"):
+                st.markdown("""
 **Binary search**: Finds the *minimum* fleet size in `[min, max]` that meets the target.
 Each step evaluates the midpoint fleet size by running a full simulation + DCF.
 
@@ -2126,371 +2357,437 @@ the one with the highest NPV that meets the target.
 - **Break-even within**: Project breaks even within N months
 """)
 
+    if intelligence_tab.open:
+        _render_pilot_sizing()
+
     # ── SECTION 2 — Field Data Upload ──────────────────────────────────
-    st.divider()
-    st.header("Field Data Upload")
-    st.caption("Upload real-world BMS telemetry and charger failure logs to compare against model predictions")
+    def _upload_digest(*files) -> str:
+        """Content hash of the uploaded CSVs, recomputed only when an upload changes."""
+        file_ids = tuple(f.file_id if f is not None else None for f in files)
+        cached = st.session_state.get("fd_upload_digest")
+        if cached is not None and cached[0] == file_ids:
+            return cached[1]
+        h = hashlib.blake2b(digest_size=16)
+        for f in files:
+            buf = f.getbuffer() if f is not None else b""
+            h.update(len(buf).to_bytes(8, "little"))
+            h.update(buf)
+        digest = h.hexdigest()
+        st.session_state["fd_upload_digest"] = (file_ids, digest)
+        return digest
+
+    @st.cache_data(max_entries=16, show_spinner=False)
+    def _cached_auto_tune(
+        upload_digest: str, scenario_key: str, cv_key: str, min_confidence: float,
+        _field_data: FieldDataSet, _scenario: Scenario, _cv: ChargerVariant,
+    ) -> AutoTuneResult:
+        """Auto-tune keyed on upload content + inputs; repeat runs are a lookup."""
+        return auto_tune_parameters(_field_data, _scenario, _cv, min_confidence=min_confidence)
+
+    @st.cache_data(max_entries=16, show_spinner=False)
+    def _cached_tuned_rerun(
+        scenario_key: str, cv_key: str, tune_key: str,
+        _scenario: Scenario, _cv: ChargerVariant, _tune: AutoTuneResult,
+    ) -> tuple[SimulationResult, DCFResult]:
+        """Apply tuned parameters, re-run the engine and discount the result."""
+        tuned_scenario, tuned_charger = apply_tuned_parameters(_scenario, _cv, _tune)
+        tuned_result = run_engine(tuned_scenario, tuned_charger)
+        _, tuned_dcf = _salvage_and_dcf(
+            tuned_result, tuned_scenario.finance,
+            tuned_scenario.simulation.discount_rate_annual, tuned_scenario.pack.second_life_salvage_value,
+        )
+        return tuned_result, tuned_dcf
 
-    fd_col1, fd_col2 = st.columns(2)
+    @st.fragment
+    def _render_field_data():
+        """Field-data upload, variance analysis and auto-calibration."""
+        st.divider()
+        st.header("Field Data Upload")
+        st.caption("Upload real-world BMS telemetry and charger failure logs to compare against model predictions")
 
-    with fd_col1:
-        st.subheader("BMS Telemetry")
-        st.markdown("""
+        fd_col1, fd_col2 = st.columns(2)
+
+        with fd_col1:
+            st.subheader("BMS Telemetry")
+            st.markdown("""
         <div style="font-family: 'Inter', sans-serif; font-size: 0.72rem; color: rgba(255,255,255,0.40); margin-bottom: 6px; line-height: 1.5;">
         Required: <code>pack_id, month, soh, cumulative_cycles</code><br>
         Optional: <code>temperature_avg_c</code>
         </div>
         """, unsafe_allow_html=True)
-        bms_file = st.file_uploader("Upload BMS CSV", type=["csv"], key="bms_upload")
+            bms_file = st.file_uploader("Upload BMS CSV", type=["csv"], key="bms_upload")
 
-    with fd_col2:
-        st.subheader("Charger Failure Log")
-        st.markdown("""
+        with fd_col2:
+            st.subheader("Charger Failure Log")
+            st.markdown("""
         <div style="font-family: 'Inter', sans-serif; font-size: 0.72rem; color: rgba(255,255,255,0.40); margin-bottom: 6px; line-height: 1.5;">
         Required: <code>dock_id, failure_month, downtime_hours</code><br>
         Optional: <code>charger_variant_name, repair_cost, was_replaced</code>
         </div>
         """, unsafe_allow_html=True)
-        charger_file = st.file_uploader("Upload Charger CSV", type=["csv"], key="charger_upload")
-
-    # Parse uploaded files
-    bms_records = []
-    charger_fail_records = []
+            charger_file = st.file_uploader("Upload Charger CSV", type=["csv"], key="charger_upload")
 
-    if bms_file is not None:
-        bms_content = bms_file.getvalue().decode("utf-8")
-        bms_records = ingest_bms_csv(io.StringIO(bms_content))
+        if not intelligence_tab.open:
+            return
 
-    if charger_file is not None:
-        charger_content = charger_file.getvalue().decode("utf-8")
-        charger_fail_records = ingest_charger_csv(io.StringIO(charger_content))
+        # Parse uploaded files (UploadedFile is a BytesIO — handed over undecoded)
+        bms_records = []
+        charger_fail_records = []
 
-    field_data = FieldDataSet(bms_records=bms_records, charger_failure_records=charger_fail_records)
+        if bms_file is not None:
+            bms_records = ingest_bms_csv(bms_file)
 
-    has_field_data = len(bms_records) > 0 or len(charger_fail_records) > 0
+        if charger_file is not None:
+            charger_fail_records = ingest_charger_csv(charger_file)
 
-    if has_field_data:
-        # Data summary cards
-        fd_summary_cols = st.columns(4)
-        fd_cards = [
-            ("🔋", "BMS Records", f"{len(bms_records):,}", "#6c5ce7"),
-            ("📦", "Unique Packs", f"{field_data.num_unique_packs:,}", "#0984e3"),
-            ("⚡", "Failure Events", f"{len(charger_fail_records):,}", "#e17055"),
-            ("📅", "Data Span", f"{field_data.max_month} mo.", "#fdcb6e"),
-        ]
-        for col, (icon, label, value, accent) in zip(fd_summary_cols, fd_cards):
-            col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-        st.write("")
-
-        # Preview data
-        if bms_records:
-            with st.expander(f"BMS data preview ({len(bms_records)} records)"):
-                bms_preview = [{
-                    "Pack": r.pack_id, "Month": r.month,
-                    "SOH": f"{r.soh:.3f}", "Cycles": r.cumulative_cycles,
-                    "Temp (°C)": f"{r.temperature_avg_c:.1f}" if r.temperature_avg_c else "—",
-                } for r in bms_records[:50]]
-                st.dataframe(bms_preview, use_container_width=True, hide_index=True)
-                if len(bms_records) > 50:
-                    st.caption(f"Showing first 50 of {len(bms_records)} records.")
-
-        if charger_fail_records:
-            with st.expander(f"Charger failure preview ({len(charger_fail_records)} events)"):
-                cf_preview = [{
-                    "Dock": r.dock_id, "Month": r.failure_month,
-                    "Downtime (hrs)": f"{r.downtime_hours:.1f}",
-                    "Variant": r.charger_variant_name or "—",
-                    "Repair ₹": f"₹{r.repair_cost:,.0f}" if r.repair_cost else "—",
-                    "Replaced": "Yes" if r.was_replaced else "No",
-                } for r in charger_fail_records[:50]]
-                st.dataframe(cf_preview, use_container_width=True, hide_index=True)
-                if len(charger_fail_records) > 50:
-                    st.caption(f"Showing first 50 of {len(charger_fail_records)} events.")
-
-        # ── Variance Analysis ─────────────────────────────────────────
-        st.divider()
-        st.header("Model vs Reality")
+        field_data = FieldDataSet(bms_records=bms_records, charger_failure_records=charger_fail_records)
 
-        fd_charger_idx = 0
-        if multi_charger:
-            fd_charger_idx = st.selectbox(
-                "Charger variant for analysis", range(len(charger_variants)),
-                format_func=lambda i: charger_variants[i].name,
-                key="fd_cv",
-            )
+        has_field_data = len(bms_records) > 0 or len(charger_fail_records) > 0
 
-        cv_for_fd = charger_variants[fd_charger_idx]
-        variance_report = compute_variance_report(
-            field_data, pack, cv_for_fd, chaos_cfg, station,
-        )
-
-        # Degradation variance
-        if variance_report.degradation_monthly:
-            st.subheader("Battery SOH — Model vs Field")
-
-            drift_color = "#00b894" if variance_report.overall_soh_drift_pct and variance_report.overall_soh_drift_pct >= 0 else "#d63031"
-            var_cols = st.columns(3)
-            var_cards = [
-                ("📊", "SOH Drift",
-                 f"{variance_report.overall_soh_drift_pct:+.2f}%" if variance_report.overall_soh_drift_pct is not None else "N/A",
-                 drift_color),
-                ("🔋", "Data Months", f"{len(variance_report.degradation_monthly)}", "#0984e3"),
-                ("📦", "Packs Sampled", f"{variance_report.degradation_monthly[0].num_packs_sampled:,}", "#6c5ce7"),
-            ]
-            for col, (icon, label, value, accent) in zip(var_cols, var_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-            st.write("")
-
-            if variance_report.overall_soh_drift_pct is not None:
-                if variance_report.overall_soh_drift_pct < -5:
-                    st.error("⚠️ Field data shows batteries degrading **faster** than the model predicts. Consider increasing β.")
-                elif variance_report.overall_soh_drift_pct > 5:
-                    st.success("✅ Field batteries are healthier than predicted — model is conservative.")
-                else:
-                    st.info("ℹ️ Field data closely matches model predictions (within ±5%).")
-
-            # SOH comparison chart
-            projected_soh = {dv.month: dv.projected_avg_soh for dv in variance_report.degradation_monthly}
-            actual_soh = {dv.month: dv.actual_avg_soh for dv in variance_report.degradation_monthly}
-            all_months = sorted(projected_soh.keys())
-            soh_chart = {
-                "Projected SOH": [projected_soh[m] for m in all_months],
-                "Actual SOH": [actual_soh[m] for m in all_months],
-            }
-            st.line_chart(soh_chart, y_label="State of Health", x_label="Month", height=300,
-                          use_container_width=True)
-
-            with st.expander("Degradation variance detail"):
-                deg_rows = [{
-                    "Month": dv.month,
-                    "Projected SOH": f"{dv.projected_avg_soh:.4f}",
-                    "Actual SOH": f"{dv.actual_avg_soh:.4f}",
-                    "Variance": f"{dv.variance_pct:+.2f}%",
-                    "Packs Sampled": dv.num_packs_sampled,
-                } for dv in variance_report.degradation_monthly]
-                st.dataframe(deg_rows, use_container_width=True, hide_index=True)
-
-            with st.expander("Show degradation formula"):
-                st.markdown(f"**Model**: SOH = 1.0 − β × cycles − calendar × months")
-                st.markdown(f"**β** = {pack.cycle_degradation_rate_pct}% / cycle × aggressiveness ({chaos_cfg.aggressiveness_index})")
-                st.markdown(f"**Calendar aging** = {pack.calendar_aging_rate_pct_per_month}% / month")
-                st.markdown(f"**Variance** = (actual − projected) / projected × 100")
-
-        # MTBF variance
-        if variance_report.mtbf_variance:
-            st.subheader("Charger Reliability — Spec vs Field")
-
-            mtbf_drift_color = "#00b894" if variance_report.overall_mtbf_drift_pct and variance_report.overall_mtbf_drift_pct >= 0 else "#d63031"
-            mtbf_cols = st.columns(3)
-            mv = variance_report.mtbf_variance[0]
-            mtbf_cards = [
-                ("📊", "MTBF Drift",
-                 f"{variance_report.overall_mtbf_drift_pct:+.2f}%" if variance_report.overall_mtbf_drift_pct is not None else "N/A",
-                 mtbf_drift_color),
-                ("🛠️", "Rated MTBF", f"{mv.projected_mtbf_hours:,.0f} hrs", "#0984e3"),
-                ("📈", "Observed MTBF", f"{mv.actual_mtbf_hours:,.0f} hrs", "#6c5ce7"),
+        if has_field_data:
+            # Data summary cards
+            fd_cards = [
+                ("🔋", "BMS Records", fmt_count(len(bms_records)), "#6c5ce7"),
+                ("📦", "Unique Packs", fmt_count(field_data.num_unique_packs), "#0984e3"),
+                ("⚡", "Failure Events", fmt_count(len(charger_fail_records)), "#e17055"),
+                ("📅", "Data Span", f"{field_data.max_month} mo.", "#fdcb6e"),
             ]
-            for col, (icon, label, value, accent) in zip(mtbf_cols, mtbf_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-            st.write("")
-
-            if variance_report.overall_mtbf_drift_pct is not None:
-                if variance_report.overall_mtbf_drift_pct < -20:
-                    st.error("⚠️ Chargers failing **more frequently** than spec. Actual MTBF is significantly below rated.")
-                elif variance_report.overall_mtbf_drift_pct > 20:
-                    st.success("✅ Chargers outperforming spec — actual MTBF exceeds rated value.")
-                else:
-                    st.info("ℹ️ Charger failure rate is within ±20% of spec.")
-
-            with st.expander("MTBF variance detail"):
-                mtbf_rows = [{
-                    "Variant": mv.charger_variant_name or "Fleet",
-                    "Spec MTBF": f"{mv.projected_mtbf_hours:,.0f} hrs",
-                    "Actual MTBF": f"{mv.actual_mtbf_hours:,.0f} hrs",
-                    "Variance": f"{mv.variance_pct:+.2f}%",
-                    "Total Op. Hours": f"{mv.total_operating_hours:,.0f}",
-                    "Failures": mv.total_failures,
-                } for mv in variance_report.mtbf_variance]
-                st.dataframe(mtbf_rows, use_container_width=True, hide_index=True)
-
-            with st.expander("Show MTBF formula"):
-                st.markdown("**Actual MTBF** = total_operating_hours / total_failures")
-                st.markdown(f"**Total operating hours** = unique_docks × hours/day × 30 × months")
-                st.markdown(f"**Variance** = (actual − projected) / projected × 100")
-
-        if not variance_report.degradation_monthly and not variance_report.mtbf_variance:
-            st.info("No variance data to display. Upload field data above to compare against model predictions.")
-
-        # ── Auto-Tuning ───────────────────────────────────────────────
-        st.divider()
-        st.header("Auto-Calibration")
-        st.caption("Adjust model parameters based on field observations")
-
-        at_cols = st.columns(2)
-        at_min_conf = at_cols[0].slider(
-            "Min confidence threshold", 0.0, 1.0, 0.1, 0.05,
-            key="at_conf",
-            help="Parameters with confidence below this threshold are excluded. "
-                 "Confidence is based on sample size (packs ÷ 50, failures ÷ 10).",
-        )
-        at_run = at_cols[1].button("🔧  Run Auto-Tune", type="primary", key="at_run")
+            st.markdown(card_row(fd_cards, pad_below=True), unsafe_allow_html=True)
 
-        if at_run:
-            with st.spinner("Auto-tuning parameters from field data…"):
-                tune_result = auto_tune_parameters(
-                    field_data, scenario, cv_for_fd, min_confidence=at_min_conf,
+            # Preview data
+            if bms_records:
+                bms_prev_exp = st.expander(
+                    f"BMS data preview ({len(bms_records)} records)", key="bms_preview", on_change="rerun",
                 )
-            st.session_state["tune_result"] = tune_result
-
-        if "tune_result" in st.session_state:
-            tune = st.session_state["tune_result"]
-
-            tune_info_cols = st.columns(3)
-            tune_info_cards = [
-                ("📅", "Data Months Used", f"{tune.data_months_used}", "#6c5ce7"),
-                ("📦", "Packs Sampled", f"{tune.num_packs_used:,}", "#0984e3"),
-                ("⚡", "Failure Events", f"{tune.num_failure_events_used:,}", "#e17055"),
-            ]
-            for col, (icon, label, value, accent) in zip(tune_info_cols, tune_info_cards):
-                col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-            st.write("")
-
-            if tune.parameters:
-                st.subheader("Tuned Parameters")
-                tune_rows = []
-                for tp in tune.parameters:
-                    direction = "↑" if tp.change_pct > 0 else "↓"
-                    conf_bar = "█" * int(tp.confidence * 10) + "░" * (10 - int(tp.confidence * 10))
-                    tune_rows.append({
-                        "Parameter": tp.param_path,
-                        "Original": f"{tp.original_value:.4g}",
-                        "Tuned": f"{tp.tuned_value:.4g}",
-                        "Change": f"{direction} {tp.change_pct:+.1f}%",
-                        "Confidence": f"{conf_bar} {tp.confidence:.0%}",
-                    })
-                st.dataframe(tune_rows, use_container_width=True, hide_index=True)
-
-                # Apply tuned parameters button
-                if st.button("✅  Apply Tuned Parameters & Re-run", type="primary", key="at_apply"):
-                    with st.spinner("Applying tuned parameters and re-running simulation…"):
-                        tuned_scenario, tuned_charger = apply_tuned_parameters(
-                            scenario, cv_for_fd, tune,
+                with bms_prev_exp:
+                    if not bms_prev_exp.open:
+                        st.caption("Expand to load the first 50 records.")
+                    else:
+                        bc = _columns(
+                            bms_records[:50], "pack_id", "month", "soh", "cumulative_cycles", "temperature_avg_c",
                         )
-                        tuned_result = run_engine(tuned_scenario, tuned_charger)
-
-                        # Compute NPVs for comparison
-                        orig_result = results[fd_charger_idx]
-                        orig_salvage = orig_result.derived.total_packs * p.second_life_salvage_value
-                        orig_dcf = build_dcf_table(
-                            orig_result.months, orig_result.summary, finance_cfg,
-                            sim_cfg.discount_rate_annual, orig_salvage,
+                        temp = pd.Series(bc["temperature_avg_c"], dtype=np.float64)
+                        st.dataframe(pd.DataFrame({
+                            "Pack": bc["pack_id"], "Month": bc["month"],
+                            "SOH": pd.Series(bc["soh"]).map("{:.3f}".format),
+                            "Cycles": bc["cumulative_cycles"],
+                            "Temp (°C)": np.where(temp.fillna(0) != 0, temp.map("{:.1f}".format), "—"),
+                        }), use_container_width=True, hide_index=True)
+                        if len(bms_records) > 50:
+                            st.caption(f"Showing first 50 of {len(bms_records)} records.")
+
+            if charger_fail_records:
+                cf_prev_exp = st.expander(
+                    f"Charger failure preview ({len(charger_fail_records)} events)", key="cf_preview", on_change="rerun",
+                )
+                with cf_prev_exp:
+                    if not cf_prev_exp.open:
+                        st.caption("Expand to load the first 50 events.")
+                    else:
+                        fc = _columns(
+                            charger_fail_records[:50], "dock_id", "failure_month", "downtime_hours",
+                            "charger_variant_name", "repair_cost", "was_replaced",
                         )
+                        repair = pd.Series(fc["repair_cost"], dtype=np.float64)
+                        st.dataframe(pd.DataFrame({
+                            "Dock": fc["dock_id"], "Month": fc["failure_month"],
+                            "Downtime (hrs)": pd.Series(fc["downtime_hours"]).map("{:.1f}".format),
+                            "Variant": pd.Series(fc["charger_variant_name"]).fillna("").replace("", "—"),
+                            "Repair ₹": np.where(repair.fillna(0) != 0, repair.map("₹{:,.0f}".format), "—"),
+                            "Replaced": np.where(fc["was_replaced"].astype(bool), "Yes", "No"),
+                        }), use_container_width=True, hide_index=True)
+                        if len(charger_fail_records) > 50:
+                            st.caption(f"Showing first 50 of {len(charger_fail_records)} events.")
+
+            # ── Variance Analysis ─────────────────────────────────────────
+            st.divider()
+            st.header("Model vs Reality")
+
+            fd_charger_idx = 0
+            if multi_charger:
+                fd_charger_idx = _cv_index_by_name[st.selectbox(
+                    "Charger variant for analysis", list(_cv_index_by_name), key="fd_cv",
+                )]
+
+            cv_for_fd = charger_variants[fd_charger_idx]
+            variance_report = compute_variance_report(
+                field_data, pack, cv_for_fd, chaos_cfg, station,
+            )
 
-                        tuned_salvage = tuned_result.derived.total_packs * tuned_scenario.pack.second_life_salvage_value
-                        tuned_dcf = build_dcf_table(
-                            tuned_result.months, tuned_result.summary, tuned_scenario.finance,
-                            tuned_scenario.simulation.discount_rate_annual, tuned_salvage,
+            # Degradation variance
+            if variance_report.degradation_monthly:
+                st.subheader("Battery SOH — Model vs Field")
+
+                drift_color = "#00b894" if variance_report.overall_soh_drift_pct and variance_report.overall_soh_drift_pct >= 0 else "#d63031"
+                var_cards = [
+                    ("📊", "SOH Drift",
+                     f"{variance_report.overall_soh_drift_pct:+.2f}%" if variance_report.overall_soh_drift_pct is not None else "N/A",
+                     drift_color),
+                    ("🔋", "Data Months", f"{len(variance_report.degradation_monthly)}", "#0984e3"),
+                    ("📦", "Packs Sampled", fmt_count(variance_report.degradation_monthly[0].num_packs_sampled), "#6c5ce7"),
+                ]
+                st.markdown(card_row(var_cards, pad_below=True), unsafe_allow_html=True)
+
+                if variance_report.overall_soh_drift_pct is not None:
+                    if variance_report.overall_soh_drift_pct < -5:
+                        st.error("⚠️ Field data shows batteries degrading **faster** than the model predicts. Consider increasing β.")
+                    elif variance_report.overall_soh_drift_pct > 5:
+                        st.success("✅ Field batteries are healthier than predicted — model is conservative.")
+                    else:
+                        st.info("ℹ️ Field data closely matches model predictions (within ±5%).")
+
+                # SOH comparison chart
+                # degradation_monthly is already in month order; field months may be sparse
+                soh_chart = pd.DataFrame({
+                    "Projected SOH": _f32([dv.projected_avg_soh for dv in variance_report.degradation_monthly]),
+                    "Actual SOH": _f32([dv.actual_avg_soh for dv in variance_report.degradation_monthly]),
+                }, index=pd.Index([dv.month for dv in variance_report.degradation_monthly], name="Month"))
+                st.line_chart(soh_chart, y_label="State of Health", x_label="Month", height=300,
+                              use_container_width=True)
+
+                deg_var_exp = st.expander("Degradation variance detail", key="deg_variance_detail", on_change="rerun")
+                with deg_var_exp:
+                    if not deg_var_exp.open:
+                        st.caption("Expand to load the monthly degradation variance.")
+                    else:
+                        dgc = _columns(
+                            variance_report.degradation_monthly,
+                            "month", "projected_avg_soh", "actual_avg_soh", "variance_pct", "num_packs_sampled",
                         )
+                        st.dataframe(pd.DataFrame({
+                            "Month": dgc["month"],
+                            "Projected SOH": pd.Series(dgc["projected_avg_soh"]).map("{:.4f}".format),
+                            "Actual SOH": pd.Series(dgc["actual_avg_soh"]).map("{:.4f}".format),
+                            "Variance": pd.Series(dgc["variance_pct"]).map("{:+.2f}%".format),
+                            "Packs Sampled": dgc["num_packs_sampled"],
+                        }), use_container_width=True, hide_index=True)
+
+                with st.expander("Show degradation formula"):
+                    st.markdown(
+                        "**Model**: SOH = 1.0 − β × cycles − calendar × months\n\n"
+                        f"**β** = {pack.cycle_degradation_rate_pct}% / cycle × aggressiveness ({chaos_cfg.aggressiveness_index})\n\n"
+                        f"**Calendar aging** = {pack.calendar_aging_rate_pct_per_month}% / month\n\n"
+                        "**Variance** = (actual − projected) / projected × 100"
+                    )
+
+            # MTBF variance
+            if variance_report.mtbf_variance:
+                st.subheader("Charger Reliability — Spec vs Field")
+
+                mtbf_drift_color = "#00b894" if variance_report.overall_mtbf_drift_pct and variance_report.overall_mtbf_drift_pct >= 0 else "#d63031"
+                mv = variance_report.mtbf_variance[0]
+                mtbf_cards = [
+                    ("📊", "MTBF Drift",
+                     f"{variance_report.overall_mtbf_drift_pct:+.2f}%" if variance_report.overall_mtbf_drift_pct is not None else "N/A",
+                     mtbf_drift_color),
+                    ("🛠️", "Rated MTBF", f"{mv.projected_mtbf_hours:,.0f} hrs", "#0984e3"),
+                    ("📈", "Observed MTBF", f"{mv.actual_mtbf_hours:,.0f} hrs", "#6c5ce7"),
+                ]
+                st.markdown(card_row(mtbf_cards, pad_below=True), unsafe_allow_html=True)
+
+                if variance_report.overall_mtbf_drift_pct is not None:
+                    if variance_report.overall_mtbf_drift_pct < -20:
+                        st.error("⚠️ Chargers failing **more frequently** than spec. Actual MTBF is significantly below rated.")
+                    elif variance_report.overall_mtbf_drift_pct > 20:
+                        st.success("✅ Chargers outperforming spec — actual MTBF exceeds rated value.")
+                    else:
+                        st.info("ℹ️ Charger failure rate is within ±20% of spec.")
+
+                mtbf_var_exp = st.expander("MTBF variance detail", key="mtbf_variance_detail", on_change="rerun")
+                with mtbf_var_exp:
+                    if not mtbf_var_exp.open:
+                        st.caption("Expand to load the MTBF variance by variant.")
+                    else:
+                        mvc = _columns(
+                            variance_report.mtbf_variance, "charger_variant_name", "projected_mtbf_hours",
+                            "actual_mtbf_hours", "variance_pct", "total_operating_hours", "total_failures",
+                        )
+                        st.dataframe(pd.DataFrame({
+                            "Variant": pd.Series(mvc["charger_variant_name"]).fillna("").replace("", "Fleet"),
+                            "Spec MTBF": pd.Series(mvc["projected_mtbf_hours"]).map("{:,.0f} hrs".format),
+                            "Actual MTBF": pd.Series(mvc["actual_mtbf_hours"]).map("{:,.0f} hrs".format),
+                            "Variance": pd.Series(mvc["variance_pct"]).map("{:+.2f}%".format),
+                            "Total Op. Hours": pd.Series(mvc["total_operating_hours"]).map("{:,.0f}".format),
+                            "Failures": mvc["total_failures"],
+                        }), use_container_width=True, hide_index=True)
+
+                with st.expander("Show MTBF formula"):
+                    st.markdown(
+                        "**Actual MTBF** = total_operating_hours / total_failures\n\n"
+                        "**Total operating hours** = unique_docks × hours/day × 30 × months\n\n"
+                        "**Variance** = (actual − projected) / projected × 100"
+                    )
+
+            if not variance_report.degradation_monthly and not variance_report.mtbf_variance:
+                st.info("No variance data to display. Upload field data above to compare against model predictions.")
+
+            # ── Auto-Tuning ───────────────────────────────────────────────
+            st.divider()
+            st.header("Auto-Calibration")
+            st.caption("Adjust model parameters based on field observations")
+
+            at_cols = st.columns(2)
+            at_min_conf = at_cols[0].slider(
+                "Min confidence threshold", 0.0, 1.0, 0.1, 0.05,
+                key="at_conf",
+                help="Parameters with confidence below this threshold are excluded. "
+                     "Confidence is based on sample size (packs ÷ 50, failures ÷ 10).",
+            )
+            at_run = at_cols[1].button("🔧  Run Auto-Tune", type="primary", key="at_run")
+
+            if at_run:
+                with st.spinner("Auto-tuning parameters from field data…"):
+                    tune_result = _cached_auto_tune(
+                        _upload_digest(bms_file, charger_file), _scenario_key,
+                        cv_for_fd.model_dump_json(), at_min_conf,
+                        field_data, scenario, cv_for_fd,
+                    )
+                st.session_state["tune_result"] = tune_result
+                # The summary cards and tuned-parameters table only change with
+                # the tune result, so they are rendered here rather than every rerun
+                tune_info_cards = [
+                    ("📅", "Data Months Used", f"{tune_result.data_months_used}", "#6c5ce7"),
+                    ("📦", "Packs Sampled", fmt_count(tune_result.num_packs_used), "#0984e3"),
+                    ("⚡", "Failure Events", fmt_count(tune_result.num_failure_events_used), "#e17055"),
+                ]
+                st.session_state["tune_info_html"] = card_row(tune_info_cards, pad_below=True)
+                if tune_result.parameters:
+                    tc_cols = _columns(
+                        tune_result.parameters, "param_path", "original_value", "tuned_value", "change_pct", "confidence",
+                    )
+                    chg = pd.Series(tc_cols["change_pct"], dtype=np.float64)
+                    conf = pd.Series(tc_cols["confidence"], dtype=np.float64)
+                    st.session_state["tune_table"] = pd.DataFrame({
+                        "Parameter": tc_cols["param_path"],
+                        "Original": pd.Series(tc_cols["original_value"]).map(_fmt_4g),
+                        "Tuned": pd.Series(tc_cols["tuned_value"]).map(_fmt_4g),
+                        "Change": np.where(chg > 0, "↑ ", "↓ ") + chg.map(_fmt_change_pct),
+                        "Confidence": _CONF_BARS[np.clip((conf * 10).astype(np.int64), 0, 10)]
+                                      + conf.map(_fmt_conf_pct),
+                    })
 
-                    st.session_state["tuned_comparison"] = {
-                        "original_npv": orig_dcf.npv,
-                        "tuned_npv": tuned_dcf.npv,
-                        "original_ncf": orig_result.summary.total_net_cash_flow,
-                        "tuned_ncf": tuned_result.summary.total_net_cash_flow,
-                        "original_be": orig_result.summary.break_even_month,
-                        "tuned_be": tuned_result.summary.break_even_month,
-                    }
-
-                if "tuned_comparison" in st.session_state:
-                    tc = st.session_state["tuned_comparison"]
-                    st.subheader("Calibration Impact")
-
-                    npv_delta = tc["tuned_npv"] - tc["original_npv"]
-                    delta_color = "#00b894" if npv_delta >= 0 else "#d63031"
-                    delta_dir = "better" if npv_delta >= 0 else "worse"
-
-                    imp_cols = st.columns(3)
-                    imp_cards = [
-                        ("📊", "Original NPV", _fmt_inr(tc["original_npv"]),
-                         "#6c5ce7"),
-                        ("🔧", "Calibrated NPV", _fmt_inr(tc["tuned_npv"]),
-                         "#00b894" if tc["tuned_npv"] > 0 else "#d63031"),
-                        ("📈", "NPV Delta", f"{_fmt_inr(npv_delta)} ({delta_dir})",
-                         delta_color),
-                    ]
-                    for col, (icon, label, value, accent) in zip(imp_cols, imp_cards):
-                        col.markdown(_card(icon, label, value, accent), unsafe_allow_html=True)
-                    st.write("")
-
-                    comp_table = [
-                        {
-                            "Metric": "NPV",
-                            "Original": _fmt_inr(tc["original_npv"]),
-                            "Tuned": _fmt_inr(tc["tuned_npv"]),
-                            "Delta": _fmt_inr(npv_delta),
-                        },
-                        {
-                            "Metric": "Net Cash Flow",
-                            "Original": _fmt_inr(tc["original_ncf"]),
-                            "Tuned": _fmt_inr(tc["tuned_ncf"]),
-                            "Delta": _fmt_inr(tc["tuned_ncf"] - tc["original_ncf"]),
-                        },
-                        {
-                            "Metric": "Break-even",
-                            "Original": f"Mo. {tc['original_be']}" if tc["original_be"] else "Never",
-                            "Tuned": f"Mo. {tc['tuned_be']}" if tc["tuned_be"] else "Never",
-                            "Delta": (
-                                f"{tc['tuned_be'] - tc['original_be']:+d} months"
-                                if tc["original_be"] and tc["tuned_be"]
-                                else "N/A"
-                            ),
-                        },
-                    ]
-                    st.dataframe(comp_table, use_container_width=True, hide_index=True)
-
-            else:
-                st.info("No parameters met the confidence threshold. "
-                        "Try lowering the threshold or uploading more field data.")
-
-            with st.expander("Show calibration methodology"):
-                st.markdown("""
-**Degradation rate (β)**: For each BMS record, compute:
-`β_eff = (1.0 − SOH − calendar_loss) / cumulative_cycles`, then take the median.
+            if "tune_result" in st.session_state:
+                tune = st.session_state["tune_result"]
+
+                st.markdown(st.session_state["tune_info_html"], unsafe_allow_html=True)
+
+                if tune.parameters:
+                    st.subheader("Tuned Parameters")
+                    st.dataframe(st.session_state["tune_table"], use_container_width=True, hide_index=True)
+
+                    # Apply tuned parameters button
+                    if st.button("✅  Apply Tuned Parameters & Re-run", type="primary", key="at_apply"):
+                        fd_cv_key = cv_for_fd.model_dump_json()
+                        tune_key = tune.model_dump_json()
+                        # Re-clicking with unchanged inputs keeps the existing comparison
+                        tuned_inputs_hash = hashlib.blake2b(
+                            f"{_scenario_key}\0{fd_cv_key}\0{tune_key}".encode(), digest_size=16,
+                        ).digest()
+                        if (
+                            st.session_state.get("tuned_inputs_hash") != tuned_inputs_hash
+                            or "tuned_comparison" not in st.session_state
+                        ):
+                            with st.spinner("Applying tuned parameters and re-running simulation…"):
+                                tuned_result, tuned_dcf = _cached_tuned_rerun(
+                                    _scenario_key, fd_cv_key, tune_key, scenario, cv_for_fd, tune,
+                                )
+
+                                # Original DCF comes from the Finance tab's cache
+                                orig_result = results[fd_charger_idx]
+                                orig_dcf = _compute_finance(
+                                    _scenario_key, fd_cv_key, orig_result, cv_for_fd,
+                                )[1]
+
+                            tc = {
+                                "original_npv": orig_dcf.npv,
+                                "tuned_npv": tuned_dcf.npv,
+                                "original_ncf": orig_result.summary.total_net_cash_flow,
+                                "tuned_ncf": tuned_result.summary.total_net_cash_flow,
+                                "original_be": orig_result.summary.break_even_month,
+                                "tuned_be": tuned_result.summary.break_even_month,
+                            }
+                            # Display strings are formatted once here; reruns only read them back
+                            tc["original_npv_str"] = fmt_inr(tc["original_npv"])
+                            tc["tuned_npv_str"] = fmt_inr(tc["tuned_npv"])
+                            tc["npv_delta_str"] = fmt_inr(tc["tuned_npv"] - tc["original_npv"])
+                            tc["original_be_str"] = _fmt_be(tc["original_be"])
+                            tc["tuned_be_str"] = _fmt_be(tc["tuned_be"])
+                            tc["be_delta_str"] = _fmt_be_delta(tc["original_be"], tc["tuned_be"])
+                            st.session_state["tuned_comparison"] = tc
+                            st.session_state["tuned_comparison_df"] = pd.DataFrame({
+                                "Metric": ["NPV", "Net Cash Flow", "Break-even"],
+                                "Original": [tc["original_npv_str"], fmt_inr(tc["original_ncf"]), tc["original_be_str"]],
+                                "Tuned": [tc["tuned_npv_str"], fmt_inr(tc["tuned_ncf"]), tc["tuned_be_str"]],
+                                "Delta": [
+                                    tc["npv_delta_str"],
+                                    fmt_inr(tc["tuned_ncf"] - tc["original_ncf"]),
+                                    tc["be_delta_str"],
+                                ],
+                            })
+                            if (
+                                math.isclose(tc["tuned_npv"], tc["original_npv"], rel_tol=1e-9)
+                                and tc["tuned_ncf"] == tc["original_ncf"]
+                                and tc["tuned_be"] == tc["original_be"]
+                            ):
+                                # No material change: the panel collapses to one notice
+                                st.session_state["tuned_comparison_html"] = None
+                            else:
+                                npv_delta = tc["tuned_npv"] - tc["original_npv"]
+                                delta_color = "#00b894" if npv_delta >= 0 else "#d63031"
+                                delta_dir = "better" if npv_delta >= 0 else "worse"
+                                imp_cards = [
+                                    ("📊", "Original NPV", tc["original_npv_str"],
+                                     "#6c5ce7"),
+                                    ("🔧", "Calibrated NPV", tc["tuned_npv_str"],
+                                     "#00b894" if tc["tuned_npv"] > 0 else "#d63031"),
+                                    ("📈", "NPV Delta", f"{tc['npv_delta_str']} ({delta_dir})",
+                                     delta_color),
+                                ]
+                                st.session_state["tuned_comparison_html"] = card_row(imp_cards, pad_below=True)
+                            st.session_state["tuned_inputs_hash"] = tuned_inputs_hash
+
+                    if "tuned_comparison" in st.session_state:
+                        tc = st.session_state["tuned_comparison"]
+                        st.subheader("Calibration Impact")
+
+                        impact_html = st.session_state["tuned_comparison_html"]
+                        if impact_html is None:
+                            st.info(f"Calibration produced no material change — NPV stays at {tc['original_npv_str']}.")
+                        else:
+                            st.markdown(impact_html, unsafe_allow_html=True)
+                            st.dataframe(st.session_state["tuned_comparison_df"], use_container_width=True, hide_index=True)
 
-**Calendar aging**: For low-cycle packs (< 50 cycles), estimate:
-`calendar_rate = (1.0 − SOH) / months`, then take the median.
+                else:
+                    st.info("No parameters met the confidence threshold. "
+                            "Try lowering the threshold or uploading more field data.")
 
-**Charger MTBF**: From failure logs, compute:
-`actual_MTBF = total_operating_hours / total_failures`
+                method_exp = st.expander("Show calibration methodology", key="at_methodology", on_change="rerun")
+                with method_exp:
+                    if method_exp.open:
+                        st.markdown(_CALIBRATION_METHODOLOGY_MD)
 
-**Confidence scoring**:
-- BMS: `min(1.0, num_packs / 50)` — 50+ packs = full confidence
-- MTBF: `min(1.0, num_failures / 10)` — 10+ failures = full confidence
-""")
+        else:
+            st.info("👆 Upload BMS and/or charger failure CSV files above to enable variance analysis and auto-tuning.")
 
-    else:
-        st.info("👆 Upload BMS and/or charger failure CSV files above to enable variance analysis and auto-tuning.")
+    _render_field_data()
 
-    # ── Sample CSV templates ──────────────────────────────────────────
-    st.divider()
-    st.header("Download Templates")
-    st.caption("Sample CSV templates as starting points for your field data")
+    if intelligence_tab.open:
+        # ── Sample CSV templates ──────────────────────────────────────────
+        st.divider()
+        st.header("Download Templates")
+        st.caption("Sample CSV templates as starting points for your field data")
 
-    tmpl_cols = st.columns(2)
-    with tmpl_cols[0]:
-        bms_template = "pack_id,month,soh,cumulative_cycles,temperature_avg_c\nP001,6,0.95,300,35.2\nP001,12,0.89,620,34.0\nP002,6,0.94,310,36.0\nP002,12,0.88,650,33.5\n"
-        st.download_button(
+        tmpl_cols = st.columns(2)
+        tmpl_cols[0].download_button(
             "📥  Download BMS template CSV",
-            data=bms_template,
+            data=_BMS_TEMPLATE_BYTES,
             file_name="bms_telemetry_template.csv",
             mime="text/csv",
             key="dl_bms",
         )
-    with tmpl_cols[1]:
-        charger_template = "dock_id,failure_month,downtime_hours,charger_variant_name,repair_cost,was_replaced\nD01,3,8.5,Budget-1kW,1200,false\nD02,5,12.0,Budget-1kW,1500,false\nD01,9,24.0,Budget-1kW,2000,true\n"
-        st.download_button(
+        tmpl_cols[1].download_button(
             "📥  Download Charger Failure template CSV",
-            data=charger_template,
+            data=_CHARGER_TEMPLATE_BYTES,
             file_name="charger_failures_template.csv",
             mime="text/csv",
             key="dl_charger",
@@ -0,0 +1,49 @@
+"""HTML building blocks for the dashboard — styled metric cards and card rows.
+
+Like :mod:`zng_simulator.dashboard.formatting`, these live outside
+``app.py`` so their ``lru_cache`` entries survive Streamlit reruns.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=2048)
+def card(icon: str, label: str, value: str, accent: str = "#6c5ce7") -> str:
+    """Return HTML for a styled metric card with colored top accent (memoised)."""
+    return f"""
+    <div style="
+        background: linear-gradient(135deg, rgba(30,34,44,0.95), rgba(22,26,35,0.98));
+        border: 1px solid rgba(255,255,255,0.05);
+        border-top: 3px solid {accent};
+        border-radius: 8px;
+        padding: 14px 16px 12px;
+        box-shadow: 0 1px 6px rgba(0,0,0,0.18);
+        text-align: center;
+    ">
+        <div style="font-size: 1.3rem; margin-bottom: 2px; line-height: 1;">{icon}</div>
+        <div style="font-family: 'Inter', sans-serif; font-size: 1.25rem; font-weight: 700; color: #fff; letter-spacing: -0.3px; line-height: 1.3;">{value}</div>
+        <div style="font-family: 'Inter', sans-serif; font-size: 0.65rem; color: rgba(255,255,255,0.42); text-transform: uppercase; letter-spacing: 0.6px; margin-top: 3px; line-height: 1.3; font-weight: 500;">{label}</div>
+    </div>
+    """.strip()
+
+
+def card_row(cards: list[tuple[str, str, str, str]], pad_below: bool = False) -> str:
+    """Return one CSS-grid HTML block laying out ``(icon, label, value, accent)`` cards side by side.
+
+    ``pad_below`` adds a bottom margin in the same block instead of a separate
+    spacer element.
+    """
+    return _card_row_html(tuple(cards), pad_below)
+
+
+@lru_cache(maxsize=512)
+def _card_row_html(cards: tuple[tuple[str, str, str, str], ...], pad_below: bool) -> str:
+    """Cached body of :func:`card_row`, keyed on the hashable card tuple."""
+    inner = "".join(card(*c) for c in cards)
+    margin = " margin-bottom: 1.5rem;" if pad_below else ""
+    return (
+        f'<div style="display: grid; grid-template-columns: repeat({len(cards)}, minmax(0, 1fr)); gap: 1rem;{margin}">'
+        f"{inner}</div>"
+    )
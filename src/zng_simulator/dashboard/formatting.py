@@ -0,0 +1,49 @@
+"""Number formatting for the dashboard — INR amounts and grouped counts.
+
+Streamlit re-executes ``app.py`` on every rerun, so ``lru_cache`` helpers
+defined there start empty each time. Defined here, in an imported module,
+the caches persist for the life of the process and the same figures are
+not re-formatted on every widget edit.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+def fmt_inr(val: float) -> str:
+    """Format INR with lakhs / crores for large values."""
+    # 0.0 and -0.0 share a cache key but format differently ("₹0" / "₹-0").
+    if val == 0 or not math.isfinite(val):
+        return f"₹{val:,.0f}"
+    return _fmt_inr_cached(val)
+
+
+@lru_cache(maxsize=4096)
+def _fmt_inr_cached(val: float) -> str:
+    """Cached body of :func:`fmt_inr`, keyed on the unrounded amount."""
+    if abs(val) >= 1e7:
+        return f"₹{val / 1e7:,.2f} Cr"
+    if abs(val) >= 1e5:
+        return f"₹{val / 1e5:,.2f} L"
+    return f"₹{val:,.0f}"
+
+
+@lru_cache(maxsize=4096)
+def fmt_count(val: int) -> str:
+    """Thousands-grouped integer count (``12,345``)."""
+    return f"{val:,}"
+
+
+def rupees(col: np.ndarray) -> pd.Series:
+    """Format a numeric column as whole-rupee strings (``₹1,234``).
+
+    Rounds the whole column with ``np.rint`` first so each cell is a cheap
+    integer format on a plain Python int rather than a float format on a
+    NumPy scalar.
+    """
+    return pd.Series(list(map("₹{:,}".format, np.rint(col).astype(np.int64).tolist())), dtype=object)
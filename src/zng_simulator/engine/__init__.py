@@ -1,24 +1,28 @@
 """Engine — Phase 1 deterministic + Phase 2 stochastic computation logic."""
 
 from zng_simulator.engine.derived import compute_derived_params
-from zng_simulator.engine.charger_tco import compute_charger_tco
+from zng_simulator.engine.charger_tco import compute_charger_tco, compute_charger_tco_batch
 from zng_simulator.engine.pack_tco import compute_pack_tco
 from zng_simulator.engine.cost_per_cycle import compute_cpc_waterfall
-from zng_simulator.engine.cashflow import run_simulation
-from zng_simulator.engine.demand import generate_daily_demand, generate_monthly_demand
+from zng_simulator.engine.cashflow import run_simulation, run_simulation_batch
+from zng_simulator.engine.demand import generate_daily_demand, generate_demand_months, generate_monthly_demand
 from zng_simulator.engine.degradation import DegradationTracker, DegradationStepResult
 from zng_simulator.engine.charger_reliability import ChargerReliabilityTracker, ChargerReliabilityStepResult
-from zng_simulator.engine.orchestrator import run_engine
+from zng_simulator.engine.orchestrator import run_engine, run_engine_batch
 
 __all__ = [
     "compute_derived_params",
     "compute_charger_tco",
+    "compute_charger_tco_batch",
     "compute_pack_tco",
     "compute_cpc_waterfall",
     "run_simulation",
+    "run_simulation_batch",
     # Phase 2
     "run_engine",
+    "run_engine_batch",
     "generate_daily_demand",
+    "generate_demand_months",
     "generate_monthly_demand",
     "DegradationTracker",
     "DegradationStepResult",
@@ -8,26 +8,98 @@ Key distinction:
 
 from __future__ import annotations
 
-import math
+import numpy as np
 
 from zng_simulator.config.scenario import Scenario
 from zng_simulator.config.charger import ChargerVariant
 from zng_simulator.engine.derived import compute_derived_params
-from zng_simulator.engine.charger_tco import compute_charger_tco
+from zng_simulator.engine.charger_tco import compute_charger_tco, compute_charger_tco_batch
 from zng_simulator.engine.pack_tco import compute_pack_tco
 from zng_simulator.engine.cost_per_cycle import compute_cpc_waterfall
 from zng_simulator.models.results import (
+    ChargerTCOBreakdown,
+    DerivedParams,
     MonthlySnapshot,
     RunSummary,
     SimulationResult,
 )
 
+# Monthly (fleet_size, swap_visits, total_cycles, revenue) arrays over the horizon
+DemandSchedule = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
 
 def run_simulation(scenario: Scenario, charger: ChargerVariant) -> SimulationResult:
     """Run one deterministic simulation for a specific charger variant.
 
     Returns a full SimulationResult with monthly snapshots and summary.
     """
+    derived = compute_derived_params(
+        scenario.vehicle, scenario.pack, charger, scenario.station, scenario.chaos, scenario.revenue,
+    )
+    tco = compute_charger_tco(
+        charger, derived, scenario.vehicle, scenario.revenue, scenario.simulation, scenario.station,
+    )
+    return _simulate(scenario, charger, derived, tco, _demand_schedule(scenario, derived))
+
+
+def run_simulation_batch(
+    scenario: Scenario, chargers: list[ChargerVariant],
+) -> list[SimulationResult]:
+    """Run the deterministic simulation for several charger variants at once.
+
+    Fleet ramp, swap visits, cycles and revenue depend only on the vehicle
+    and revenue inputs, so the monthly demand schedule is built once and
+    shared, and the charger TCOs are computed together in one
+    :func:`compute_charger_tco_batch` pass; each variant then adds its own
+    costs.  Results match calling :func:`run_simulation` per variant.
+    """
+    if not chargers:
+        return []
+    derived = [
+        compute_derived_params(
+            scenario.vehicle, scenario.pack, charger, scenario.station, scenario.chaos, scenario.revenue,
+        )
+        for charger in chargers
+    ]
+    tcos = compute_charger_tco_batch(
+        chargers, derived, scenario.vehicle, scenario.revenue, scenario.simulation, scenario.station,
+    )
+    schedule = _demand_schedule(scenario, derived[0])
+    return [
+        _simulate(scenario, charger, d, tco, schedule)
+        for charger, d, tco in zip(chargers, derived, tcos)
+    ]
+
+
+def _demand_schedule(scenario: Scenario, derived: DerivedParams) -> DemandSchedule:
+    """Charger-independent monthly ``(fleet_size, swap_visits, total_cycles, revenue)`` arrays."""
+    v = scenario.vehicle
+    rev = scenario.revenue
+    m = np.arange(1, scenario.simulation.horizon_months + 1)
+    fleet_size = rev.initial_fleet_size + rev.monthly_fleet_additions * (m - 1)
+
+    # ── Swap visits & cycles ──────────────────────────────────────────
+    # np.rint rounds half to even, like the built-in round()
+    visits_per_day = derived.swap_visits_per_vehicle_per_day * fleet_size
+    swap_visits = np.rint(visits_per_day * 30).astype(np.int64)
+
+    # Each visit swaps ALL packs → that many charge-discharge cycles
+    total_cycles = swap_visits * v.packs_per_vehicle
+
+    # ── Revenue — per VISIT (per vehicle), not per pack ───────────────
+    monthly_revenue = swap_visits * rev.price_per_swap
+
+    return fleet_size, swap_visits, total_cycles, monthly_revenue
+
+
+def _simulate(
+    scenario: Scenario,
+    charger: ChargerVariant,
+    derived: DerivedParams,
+    tco: ChargerTCOBreakdown,
+    schedule: DemandSchedule,
+) -> SimulationResult:
+    """Cost side of the static engine over a precomputed demand schedule and charger TCO."""
     v = scenario.vehicle
     p = scenario.pack
     st = scenario.station
@@ -36,12 +108,6 @@ def run_simulation(scenario: Scenario, charger: ChargerVariant) -> SimulationRes
     ch = scenario.chaos
     sim = scenario.simulation
 
-    # --- Derived parameters ---
-    derived = compute_derived_params(v, p, charger, st, ch, rev)
-
-    # --- Charger TCO ---
-    tco = compute_charger_tco(charger, derived, v, rev, sim, st)
-
     # --- Initial CapEx (month 0) ---
     per_station_capex = (
         st.cabinet_cost + st.site_prep_cost + st.grid_connection_cost + st.security_deposit
@@ -63,106 +129,96 @@ def run_simulation(scenario: Scenario, charger: ChargerVariant) -> SimulationRes
     # --- Cost per cycle waterfall (steady-state) ---
     cpc = compute_cpc_waterfall(derived, p, charger, op, ch, st, v, tco, ptco)
 
-    # --- Monthly loop ---
-    months: list[MonthlySnapshot] = []
-    cumulative_cf = 0.0
-    break_even_month: int | None = None
-    total_revenue = 0.0
-    total_opex_sum = 0.0
-    total_capex_sum = total_initial_capex
-    total_cycles_all = 0
-    total_cpc_weighted = 0.0
-
-    for m in range(1, sim.horizon_months + 1):
-        fleet_size = rev.initial_fleet_size + rev.monthly_fleet_additions * (m - 1)
-
-        # ── Swap visits & cycles ──────────────────────────────────────
-        visits_per_day = derived.swap_visits_per_vehicle_per_day * fleet_size
-        swap_visits = int(round(visits_per_day * 30))
-
-        # Each visit swaps ALL packs → that many charge-discharge cycles
-        total_cycles = swap_visits * v.packs_per_vehicle
-
-        # ── Revenue — per VISIT (per vehicle), not per pack ───────────
-        monthly_revenue = swap_visits * rev.price_per_swap
-
-        # ── OpEx ──────────────────────────────────────────────────────
-        # Station-level fixed costs
-        station_opex = (
-            op.rent_per_month_per_station
-            + op.auxiliary_power_per_month
-            + op.preventive_maintenance_per_month_per_station
-            + op.corrective_maintenance_per_month_per_station
-            + op.insurance_per_month_per_station
-            + op.logistics_per_month_per_station
-        ) * st.num_stations
-
-        # Electricity — per cycle (each pack charged)
-        energy_per_cycle_kwh = (
-            p.nominal_capacity_kwh / charger.charging_efficiency_pct
-            if charger.charging_efficiency_pct > 0 else 0.0
-        )
-        electricity_cost = total_cycles * energy_per_cycle_kwh * op.electricity_tariff_per_kwh
-
-        # Pack handling labor — per pack swapped (= per cycle)
-        labor_cost = total_cycles * op.pack_handling_labor_per_swap
-
-        # Overhead
-        overhead = op.overhead_per_month
-
-        # Sabotage
-        sabotage_cost = ch.sabotage_pct_per_month * initial_packs * p.unit_cost
-
-        monthly_opex = station_opex + electricity_cost + labor_cost + overhead + sabotage_cost
-
-        # ── CapEx this month ──────────────────────────────────────────
-        capex_this_month = 0.0
-        if m == 1:
-            capex_this_month = total_initial_capex
-
-        # Packs for new vehicles
-        if m > 1 and rev.monthly_fleet_additions > 0:
-            new_packs = v.packs_per_vehicle * rev.monthly_fleet_additions
-            capex_this_month += new_packs * p.unit_cost
-
-        # Charger repair/replace spread evenly (TCO is already fleet-level)
-        if tco.expected_failures_over_horizon > 0 and sim.horizon_months > 0:
-            monthly_charger_repair_cost = tco.total_repair_cost / sim.horizon_months
-            monthly_charger_replace_cost = tco.total_replacement_cost / sim.horizon_months
-            capex_this_month += monthly_charger_repair_cost + monthly_charger_replace_cost
-
-        # Pack repair/replace spread evenly (fleet-level)
-        if ptco.expected_failures > 0 and sim.horizon_months > 0:
-            monthly_pack_repair_cost = ptco.total_repair_cost / sim.horizon_months
-            monthly_pack_replace_cost = ptco.total_replacement_cost / sim.horizon_months
-            capex_this_month += monthly_pack_repair_cost + monthly_pack_replace_cost
-
-        # ── Net cash flow ─────────────────────────────────────────────
-        net_cf = monthly_revenue - monthly_opex - capex_this_month
-        cumulative_cf += net_cf
+    # --- Month-invariant terms (hoisted out of the monthly loop) ---
+    # Station-level fixed costs
+    station_opex = (
+        op.rent_per_month_per_station
+        + op.auxiliary_power_per_month
+        + op.preventive_maintenance_per_month_per_station
+        + op.corrective_maintenance_per_month_per_station
+        + op.insurance_per_month_per_station
+        + op.logistics_per_month_per_station
+    ) * st.num_stations
+
+    # Electricity — per cycle (each pack charged)
+    energy_per_cycle_kwh = (
+        p.nominal_capacity_kwh / charger.charging_efficiency_pct
+        if charger.charging_efficiency_pct > 0 else 0.0
+    )
 
-        if break_even_month is None and cumulative_cf >= 0 and m > 1:
-            break_even_month = m
+    # Overhead and sabotage
+    overhead = op.overhead_per_month
+    sabotage_cost = ch.sabotage_pct_per_month * initial_packs * p.unit_cost
 
-        total_revenue += monthly_revenue
-        total_opex_sum += monthly_opex
-        if m > 1:
-            total_capex_sum += capex_this_month
-        total_cycles_all += total_cycles
-        total_cpc_weighted += cpc.total * total_cycles
+    # Packs for new vehicles (months 2+)
+    new_pack_capex = (
+        v.packs_per_vehicle * rev.monthly_fleet_additions * p.unit_cost
+        if rev.monthly_fleet_additions > 0 else 0.0
+    )
 
-        months.append(MonthlySnapshot(
+    # Charger and pack repair/replace spread evenly (TCO is already fleet-level)
+    monthly_charger_failure_capex = 0.0
+    if tco.expected_failures_over_horizon > 0 and sim.horizon_months > 0:
+        monthly_charger_repair_cost = tco.total_repair_cost / sim.horizon_months
+        monthly_charger_replace_cost = tco.total_replacement_cost / sim.horizon_months
+        monthly_charger_failure_capex = monthly_charger_repair_cost + monthly_charger_replace_cost
+    monthly_pack_failure_capex = 0.0
+    if ptco.expected_failures > 0 and sim.horizon_months > 0:
+        monthly_pack_repair_cost = ptco.total_repair_cost / sim.horizon_months
+        monthly_pack_replace_cost = ptco.total_replacement_cost / sim.horizon_months
+        monthly_pack_failure_capex = monthly_pack_repair_cost + monthly_pack_replace_cost
+
+    # --- Monthly arrays ---
+    fleet_size, swap_visits, total_cycles, monthly_revenue = schedule
+
+    # ── OpEx ──────────────────────────────────────────────────────────
+    electricity_cost = total_cycles * energy_per_cycle_kwh * op.electricity_tariff_per_kwh
+    # Pack handling labor — per pack swapped (= per cycle)
+    labor_cost = total_cycles * op.pack_handling_labor_per_swap
+
+    monthly_opex = station_opex + electricity_cost + labor_cost + overhead + sabotage_cost
+
+    # ── CapEx per month ───────────────────────────────────────────────
+    capex = np.full(len(total_cycles), new_pack_capex)
+    capex[0] = total_initial_capex
+    capex += monthly_charger_failure_capex
+    capex += monthly_pack_failure_capex
+
+    # ── Net cash flow ─────────────────────────────────────────────────
+    # Running totals use cumsum, which adds strictly left to right like the
+    # scalar accumulation it replaces (np.sum would add pairwise).
+    net_cf = monthly_revenue - monthly_opex - capex
+    cumulative_cf = np.cumsum(net_cf)
+
+    # First month after the launch month where the cumulative CF turns non-negative
+    reached = np.flatnonzero(cumulative_cf[1:] >= 0)
+    break_even_month = int(reached[0]) + 2 if reached.size else None
+
+    total_revenue = float(np.cumsum(monthly_revenue)[-1])
+    total_opex_sum = float(np.cumsum(monthly_opex)[-1])
+    # Month 1 counts only the initial build-out; later months add their full CapEx
+    total_capex_sum = float(np.cumsum(np.concatenate(([total_initial_capex], capex[1:])))[-1])
+    total_cycles_all = int(total_cycles.sum())
+    total_cpc_weighted = float(np.cumsum(cpc.total * total_cycles)[-1])
+
+    months = [
+        MonthlySnapshot(
             month=m,
-            fleet_size=fleet_size,
-            swap_visits=swap_visits,
-            total_cycles=total_cycles,
-            revenue=round(monthly_revenue, 2),
-            opex_total=round(monthly_opex, 2),
-            capex_this_month=round(capex_this_month, 2),
-            net_cash_flow=round(net_cf, 2),
-            cumulative_cash_flow=round(cumulative_cf, 2),
+            fleet_size=fleet,
+            swap_visits=visits,
+            total_cycles=cycles,
+            revenue=round(revenue, 2),
+            opex_total=round(opex, 2),
+            capex_this_month=round(capex_m, 2),
+            net_cash_flow=round(ncf, 2),
+            cumulative_cash_flow=round(cum, 2),
             cost_per_cycle=cpc,
-        ))
+        )
+        for m, fleet, visits, cycles, revenue, opex, capex_m, ncf, cum in zip(
+            range(1, len(capex) + 1), fleet_size.tolist(), swap_visits.tolist(), total_cycles.tolist(),
+            monthly_revenue.tolist(), monthly_opex.tolist(), capex.tolist(), net_cf.tolist(), cumulative_cf.tolist(),
+        )
+    ]
 
     # --- Summary ---
     avg_cpc = total_cpc_weighted / total_cycles_all if total_cycles_all > 0 else 0.0
@@ -28,7 +28,8 @@ fully replaced (age resets to 0, cumulative failures reset).
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import gamma as math_gamma
+from functools import lru_cache
+from math import gamma as math_gamma, isclose
 
 import numpy as np
 
@@ -39,7 +40,7 @@ from zng_simulator.config.charger import ChargerVariant
 # Step result
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChargerReliabilityStepResult:
     """Immutable output of one month's charger reliability step."""
 
@@ -62,6 +63,50 @@ class ChargerReliabilityStepResult:
     """total_dock_hours − downtime_hours (clamped ≥ 0)."""
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Weibull shape constants
+# ═══════════════════════════════════════════════════════════════════════════
+
+@lru_cache(maxsize=64)
+def _weibull_shape_constants(beta: float) -> tuple[float, bool]:
+    """Return ``(Γ(1 + 1/β), β ≈ 1)`` for a Weibull shape.
+
+    Depends on β alone, so a Monte-Carlo batch building one tracker per
+    run evaluates Γ once per charger variant rather than once per tracker.
+    """
+    return math_gamma(1 + 1 / beta), isclose(beta, 1.0)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Per-dock update kernel
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _advance_docks(
+    age_hours: np.ndarray,
+    cumulative_failures: np.ndarray,
+    failures_per_dock: np.ndarray,
+    hours: float,
+    replacement_threshold: int,
+    replaced: np.ndarray,
+) -> int:
+    """Apply one month's sampled failures to the per-dock state, in place.
+
+    Adds ``failures_per_dock`` to the cumulative counts, flags docks that
+    reach ``replacement_threshold`` in the ``replaced`` bool buffer, ages
+    every dock by ``hours`` and resets the flagged ones to a new charger
+    (age 0, no failures). Masked writes go through ``np.copyto`` so the
+    update allocates nothing.
+
+    Returns the number of full replacements.
+    """
+    cumulative_failures += failures_per_dock
+    np.greater_equal(cumulative_failures, replacement_threshold, out=replaced)
+    age_hours += hours
+    np.copyto(age_hours, 0.0, where=replaced)
+    np.copyto(cumulative_failures, 0, where=replaced)
+    return int(np.count_nonzero(replaced))
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Reliability tracker
 # ═══════════════════════════════════════════════════════════════════════════
@@ -109,11 +154,30 @@ class ChargerReliabilityTracker:
 
         # Weibull parameters
         self._beta = charger.weibull_shape  # shape
-        self._eta = charger.mtbf_hours / math_gamma(1 + 1 / self._beta)  # scale
-
-        # Per-dock arrays
+        gamma_factor, self._is_exponential = _weibull_shape_constants(self._beta)
+        self._eta = charger.mtbf_hours / gamma_factor  # scale
+
+        # β = 1 → constant hazard: every dock expects h / MTBF failures a
+        # month regardless of age, so the per-dock hazard can be skipped
+        # (λ is clamped like the Weibull ΔH in ``step``)
+        self._exp_lambda = min(self._hours_per_month / charger.mtbf_hours, 100.0)
+
+        # Per-dock arrays. Failure counts reset to 0 once they reach
+        # replacement_threshold, so they stay small and int32 has ample
+        # headroom; ages stay float64 because they feed (t / η)^β and so
+        # the Poisson rates.
         self._age_hours = np.zeros(total_docks, dtype=np.float64)
-        self._cumulative_failures = np.zeros(total_docks, dtype=np.int64)
+        self._cumulative_failures = np.zeros(total_docks, dtype=np.int32)
+
+        # Cumulative hazard (t / η)^β at each dock's current age. A month's
+        # end value is the next month's start value, so it is carried
+        # forward rather than re-evaluated; new chargers restart at 0.
+        self._h_start = np.zeros(total_docks, dtype=np.float64)
+
+        # Scratch buffers for the monthly hazard, reused by every step
+        self._h_end_buf = np.empty(total_docks, dtype=np.float64)
+        self._delta_h_buf = np.empty(total_docks, dtype=np.float64)
+        self._replaced_buf = np.empty(total_docks, dtype=np.bool_)
 
     # ── Public API ──────────────────────────────────────────────────────
 
@@ -149,35 +213,36 @@ class ChargerReliabilityTracker:
         β = self._beta
         η = self._eta
 
-        # ── 1. Compute incremental cumulative hazard per dock ───────────
-        t_start = self._age_hours
-        t_end = t_start + h
-
-        # ΔH = (t_end / η)^β − (t_start / η)^β
-        h_start = (t_start / η) ** β
-        h_end = (t_end / η) ** β
-        delta_h = h_end - h_start  # expected failures per dock this month
-
-        # ── 2. Sample failures from Poisson ─────────────────────────────
-        # Clamp delta_h to avoid numerical issues with very large values
-        delta_h = np.clip(delta_h, 0.0, 100.0)
-        failures_per_dock = self._rng.poisson(delta_h)
+        if self._is_exponential:
+            # ── 1–2. Constant hazard: one batched Poisson(h / MTBF) draw ──
+            failures_per_dock = self._rng.poisson(self._exp_lambda, size=self._total_docks)
+        else:
+            # ── 1. Compute incremental cumulative hazard per dock ───────
+            # ΔH = (t_end / η)^β − (t_start / η)^β, evaluated in place in
+            # the scratch buffers (t_end = age + h; the t_start term is
+            # carried over from last month)
+            h_end = np.add(self._age_hours, h, out=self._h_end_buf)
+            h_end /= η
+            h_end **= β
+            # expected failures per dock this month
+            delta_h = np.subtract(h_end, self._h_start, out=self._delta_h_buf)
+
+            # ── 2. Sample failures from Poisson ─────────────────────────
+            # Clamp delta_h to avoid numerical issues with very large values
+            np.clip(delta_h, 0.0, 100.0, out=delta_h)
+            failures_per_dock = self._rng.poisson(delta_h)
 
         total_failures = int(failures_per_dock.sum())
 
-        # ── 3. Update cumulative failures ───────────────────────────────
-        self._cumulative_failures += failures_per_dock
-
-        # ── 4. Check full replacements ──────────────────────────────────
-        needs_replacement = self._cumulative_failures >= self._charger.replacement_threshold
-        num_replacements = int(needs_replacement.sum())
-
-        # Reset replaced docks (new charger: age = 0, failures = 0)
-        self._age_hours[needs_replacement] = 0.0
-        self._cumulative_failures[needs_replacement] = 0
-
-        # ── 5. Age non-replaced docks ───────────────────────────────────
-        self._age_hours[~needs_replacement] += h
+        # ── 3–5. Accumulate failures, replace worn docks, age the rest ──
+        num_replacements = _advance_docks(
+            self._age_hours, self._cumulative_failures, failures_per_dock,
+            h, self._charger.replacement_threshold, self._replaced_buf,
+        )
+        if not self._is_exponential:
+            # This month's end hazard becomes next month's start hazard
+            self._h_start, self._h_end_buf = self._h_end_buf, self._h_start
+            np.copyto(self._h_start, 0.0, where=self._replaced_buf)
 
         # ── 6. Compute costs ────────────────────────────────────────────
         repair_cost = total_failures * self._charger.repair_cost_per_event
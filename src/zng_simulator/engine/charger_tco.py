@@ -12,11 +12,15 @@ All metrics are therefore computed at the **fleet** level:
 
 Availability = MTBF / (MTBF + MTTR) is a derived statistic.
 Downtime = failures × MTTR (fleet-wide hours of dock-downtime).
+
+``compute_charger_tco_batch`` evaluates these formulas for several charger
+variants at once over NumPy arrays; ``compute_charger_tco`` is the
+single-variant case.
 """
 
 from __future__ import annotations
 
-import math
+import numpy as np
 
 from zng_simulator.config.charger import ChargerVariant
 from zng_simulator.config.revenue import RevenueConfig
@@ -39,8 +43,31 @@ def compute_charger_tco(
     Core formula (fleet-level):
       Expected Failures = (hrs/day × 365 × years × total_docks) / MTBF
     """
+    return compute_charger_tco_batch([charger], [derived], vehicle, revenue, simulation, station)[0]
+
+
+def compute_charger_tco_batch(
+    chargers: list[ChargerVariant],
+    derived: list[DerivedParams],
+    vehicle: VehicleConfig,
+    revenue: RevenueConfig,
+    simulation: SimulationConfig,
+    station: StationConfig,
+) -> list[ChargerTCOBreakdown]:
+    """Compute fleet-level TCO for several charger variants in one pass.
+
+    ``derived[i]`` must be the derived params for ``chargers[i]``.  Each
+    formula is applied element-wise across the variants, in the same
+    operation order as the scalar form, so every breakdown is identical to
+    calling :func:`compute_charger_tco` per variant.
+    """
     horizon_years = simulation.horizon_months / 12.0
-    total_docks = derived.total_docks  # stations × docks_per_station
+    # stations × docks_per_station
+    total_docks = np.array([d.total_docks for d in derived], dtype=np.int64)
+
+    mtbf = np.array([c.mtbf_hours for c in chargers], dtype=np.float64)
+    mttr = np.array([c.mttr_hours for c in chargers], dtype=np.float64)
+    threshold = np.array([c.replacement_threshold for c in chargers], dtype=np.int64)
 
     # ── Hours ──────────────────────────────────────────────────────────
     scheduled_hours_per_year_per_dock = station.operating_hours_per_day * 365
@@ -48,37 +75,44 @@ def compute_charger_tco(
         scheduled_hours_per_year_per_dock * horizon_years * total_docks
     )
 
+    # Configs are edited in place (sensitivity sweeps, field-data
+    # calibration) without re-validation, so every ratio keeps a zero guard.
+    # The divisions stay true divisions: x * (1/n) can floor differently
+    # from x / n (49.0 * (1/49) floors to 0), which would shift replacements.
+
     # ── Expected failures (fleet-wide) ─────────────────────────────────
-    expected_failures = (
-        fleet_operating_hours / charger.mtbf_hours
-        if charger.mtbf_hours > 0 else 0.0
+    expected_failures = np.divide(
+        fleet_operating_hours, mtbf,
+        out=np.zeros_like(mtbf), where=mtbf > 0,
     )
 
     # ── Availability (derived statistic) ───────────────────────────────
-    availability = (
-        charger.mtbf_hours / (charger.mtbf_hours + charger.mttr_hours)
-        if (charger.mtbf_hours + charger.mttr_hours) > 0 else 1.0
+    uptime_cycle = mtbf + mttr
+    availability = np.divide(
+        mtbf, uptime_cycle,
+        out=np.ones_like(mtbf), where=uptime_cycle > 0,
     )
 
     # ── Repair costs (fleet-wide) ──────────────────────────────────────
-    total_repair_cost = expected_failures * charger.repair_cost_per_event
+    total_repair_cost = expected_failures * np.array([c.repair_cost_per_event for c in chargers])
 
     # ── Full replacements (fleet-wide) ─────────────────────────────────
     # After every `replacement_threshold` failures across the fleet,
     # one unit is fully replaced.
-    num_replacements = (
-        int(math.floor(expected_failures / charger.replacement_threshold))
-        if charger.replacement_threshold > 0 else 0
-    )
-    total_replacement_cost = num_replacements * charger.full_replacement_cost
+    num_replacements = np.floor(np.divide(
+        expected_failures, threshold,
+        out=np.zeros_like(expected_failures), where=threshold > 0,
+    )).astype(np.int64)
+    total_replacement_cost = num_replacements * np.array([c.full_replacement_cost for c in chargers])
 
     # ── Downtime & lost revenue (fleet-wide) ───────────────────────────
-    total_downtime_hours = expected_failures * charger.mttr_hours
+    total_downtime_hours = expected_failures * mttr
 
     # Revenue lost per hour of dock downtime:
+    cycles_per_day_per_dock = np.array([d.cycles_per_day_per_dock for d in derived], dtype=np.float64)
     cycles_per_hour = (
-        derived.cycles_per_day_per_dock / station.operating_hours_per_day
-        if station.operating_hours_per_day > 0 else 0.0
+        cycles_per_day_per_dock / station.operating_hours_per_day
+        if station.operating_hours_per_day > 0 else np.zeros_like(cycles_per_day_per_dock)
     )
     # Revenue attributable to one cycle = price_per_swap / packs_per_vehicle
     revenue_per_cycle = (
@@ -88,10 +122,10 @@ def compute_charger_tco(
     lost_revenue = total_downtime_hours * cycles_per_hour * revenue_per_cycle
 
     # ── Fleet purchase cost ────────────────────────────────────────────
-    fleet_purchase_cost = charger.purchase_cost_per_slot * total_docks
+    fleet_purchase_cost = np.array([c.purchase_cost_per_slot for c in chargers]) * total_docks
 
     # ── Spare inventory (per station) ──────────────────────────────────
-    fleet_spare_cost = charger.spare_inventory_cost * station.num_stations
+    fleet_spare_cost = np.array([c.spare_inventory_cost for c in chargers]) * station.num_stations
 
     # ── Fleet TCO ──────────────────────────────────────────────────────
     total_tco = (
@@ -104,27 +138,39 @@ def compute_charger_tco(
 
     # ── Cycles actually served (fleet-wide) ────────────────────────────
     fleet_uptime_hours = fleet_operating_hours - total_downtime_hours
-    fleet_cycles_served = (
-        cycles_per_hour * fleet_uptime_hours
-        if fleet_uptime_hours > 0 else 0.0
-    )
+    fleet_cycles_served = np.where(fleet_uptime_hours > 0, cycles_per_hour * fleet_uptime_hours, 0.0)
 
-    cost_per_cycle = total_tco / fleet_cycles_served if fleet_cycles_served > 0 else 0.0
-
-    return ChargerTCOBreakdown(
-        total_docks=total_docks,
-        purchase_cost=round(fleet_purchase_cost, 2),
-        scheduled_hours_per_year_per_dock=round(scheduled_hours_per_year_per_dock, 1),
-        fleet_operating_hours=round(fleet_operating_hours, 1),
-        availability=round(availability, 6),
-        expected_failures_over_horizon=round(expected_failures, 2),
-        total_repair_cost=round(total_repair_cost, 2),
-        num_replacements=num_replacements,
-        total_replacement_cost=round(total_replacement_cost, 2),
-        total_downtime_hours=round(total_downtime_hours, 2),
-        lost_revenue_from_downtime=round(lost_revenue, 2),
-        spare_inventory_cost=round(fleet_spare_cost, 2),
-        total_tco=round(total_tco, 2),
-        cycles_served_over_horizon=round(fleet_cycles_served, 2),
-        cost_per_cycle=round(cost_per_cycle, 4),
+    cost_per_cycle = np.divide(
+        total_tco, fleet_cycles_served,
+        out=np.zeros_like(total_tco), where=fleet_cycles_served > 0,
     )
+
+    return [
+        ChargerTCOBreakdown(
+            total_docks=docks,
+            purchase_cost=round(purchase, 2),
+            scheduled_hours_per_year_per_dock=round(scheduled_hours_per_year_per_dock, 1),
+            fleet_operating_hours=round(fleet_hours, 1),
+            availability=round(avail, 6),
+            expected_failures_over_horizon=round(failures, 2),
+            total_repair_cost=round(repair, 2),
+            num_replacements=replacements,
+            total_replacement_cost=round(replacement, 2),
+            total_downtime_hours=round(downtime, 2),
+            lost_revenue_from_downtime=round(lost, 2),
+            spare_inventory_cost=round(spare, 2),
+            total_tco=round(tco, 2),
+            cycles_served_over_horizon=round(served, 2),
+            cost_per_cycle=round(cpc, 4),
+        )
+        for (
+            docks, purchase, fleet_hours, avail, failures, repair, replacements,
+            replacement, downtime, lost, spare, tco, served, cpc,
+        ) in zip(
+            total_docks.tolist(), fleet_purchase_cost.tolist(), fleet_operating_hours.tolist(),
+            availability.tolist(), expected_failures.tolist(), total_repair_cost.tolist(),
+            num_replacements.tolist(), total_replacement_cost.tolist(), total_downtime_hours.tolist(),
+            lost_revenue.tolist(), fleet_spare_cost.tolist(), total_tco.tolist(),
+            fleet_cycles_served.tolist(), cost_per_cycle.tolist(),
+        )
+    ]
@@ -2,10 +2,18 @@
 
 Each component = some monthly cost ÷ monthly cycles, or
 asset cost ÷ lifetime cycles.
+
+The waterfall is memoised on the scalar inputs it reads rather than on the
+config models, which are mutable (sensitivity sweeps and auto-tuning set
+fields in place), so a cached entry can never go stale. The cache holds
+plain floats; each call builds its own result model, so a caller editing
+one result cannot change what later calls return.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from zng_simulator.config.battery import PackSpec
 from zng_simulator.config.charger import ChargerVariant
 from zng_simulator.config.opex import OpExConfig
@@ -36,52 +44,93 @@ def compute_cpc_waterfall(
     Battery component = degradation cost + pack failure cost.
     Every formula matches §6.4 and §12.6.4 of the PRD.
     """
-    cycles_per_month = derived.cycles_per_month_per_station
-    num_stations = station.num_stations
-    total_cycles_per_month = derived.total_network_cycles_per_month
-
+    components = _waterfall(
+        derived.cycles_per_month_per_station,
+        derived.total_network_cycles_per_month,
+        derived.pack_lifetime_cycles,
+        pack.unit_cost,
+        pack.second_life_salvage_value,
+        pack.nominal_capacity_kwh,
+        pack_tco.failure_cost_per_cycle,
+        charger_tco.cost_per_cycle,
+        charger.charging_efficiency_pct,
+        opex.electricity_tariff_per_kwh,
+        opex.rent_per_month_per_station,
+        opex.preventive_maintenance_per_month_per_station,
+        opex.corrective_maintenance_per_month_per_station,
+        opex.insurance_per_month_per_station,
+        opex.logistics_per_month_per_station,
+        opex.overhead_per_month,
+        chaos.sabotage_pct_per_month,
+        station.docks_per_station,
+    )
+    return CostPerCycleWaterfall(**dict(zip(CostPerCycleWaterfall.model_fields, components)))
+
+
+@lru_cache(maxsize=256)
+def _waterfall(
+    cycles_per_month: float,
+    total_cycles_per_month: float,
+    pack_lifetime_cycles: float,
+    pack_unit_cost: float,
+    pack_salvage_value: float,
+    pack_capacity_kwh: float,
+    pack_failure_cost_per_cycle: float,
+    charger_cost_per_cycle: float,
+    charging_efficiency_pct: float,
+    electricity_tariff_per_kwh: float,
+    rent_per_month_per_station: float,
+    preventive_maintenance_per_month_per_station: float,
+    corrective_maintenance_per_month_per_station: float,
+    insurance_per_month_per_station: float,
+    logistics_per_month_per_station: float,
+    overhead_per_month: float,
+    sabotage_pct_per_month: float,
+    docks_per_station: int,
+) -> tuple[float, ...]:
+    """Cached body of :func:`compute_cpc_waterfall`, keyed on its scalar inputs.
+
+    Returns the components in :class:`CostPerCycleWaterfall` field order
+    (battery … overhead, then total).
+    """
     # Guard against division by zero
     if total_cycles_per_month <= 0:
-        return CostPerCycleWaterfall(
-            battery=0, charger=0, electricity=0, real_estate=0,
-            maintenance=0, insurance=0, sabotage=0, logistics=0,
-            overhead=0, total=0,
-        )
+        return (0.0,) * 10
 
     # 1. Battery: degradation + random failure costs
     #    Degradation: (pack_cost − salvage) / lifetime_cycles
     #    Failures:    pack_tco.failure_cost_per_cycle (fleet-level MTBF)
     cpc_battery_degradation = (
-        (pack.unit_cost - pack.second_life_salvage_value) / derived.pack_lifetime_cycles
-        if derived.pack_lifetime_cycles > 0
+        (pack_unit_cost - pack_salvage_value) / pack_lifetime_cycles
+        if pack_lifetime_cycles > 0
         else 0.0
     )
-    cpc_battery = cpc_battery_degradation + pack_tco.failure_cost_per_cycle
+    cpc_battery = cpc_battery_degradation + pack_failure_cost_per_cycle
 
     # 2. Charger: from TCO model
-    cpc_charger = charger_tco.cost_per_cycle
+    cpc_charger = charger_cost_per_cycle
 
     # 3. Electricity: (pack_capacity / efficiency) × tariff
-    energy_drawn_kwh = pack.nominal_capacity_kwh / charger.charging_efficiency_pct if charger.charging_efficiency_pct > 0 else 0.0
-    cpc_electricity = energy_drawn_kwh * opex.electricity_tariff_per_kwh
+    energy_drawn_kwh = pack_capacity_kwh / charging_efficiency_pct if charging_efficiency_pct > 0 else 0.0
+    cpc_electricity = energy_drawn_kwh * electricity_tariff_per_kwh
 
     # 4. Real estate: rent per station / cycles per month per station
     cpc_real_estate = (
-        opex.rent_per_month_per_station / cycles_per_month
+        rent_per_month_per_station / cycles_per_month
         if cycles_per_month > 0
         else 0.0
     )
 
     # 5. Maintenance: (preventive + corrective) per station / cycles per month per station
     monthly_maintenance = (
-        opex.preventive_maintenance_per_month_per_station
-        + opex.corrective_maintenance_per_month_per_station
+        preventive_maintenance_per_month_per_station
+        + corrective_maintenance_per_month_per_station
     )
     cpc_maintenance = monthly_maintenance / cycles_per_month if cycles_per_month > 0 else 0.0
 
     # 6. Insurance: premium per station / cycles per month per station
     cpc_insurance = (
-        opex.insurance_per_month_per_station / cycles_per_month
+        insurance_per_month_per_station / cycles_per_month
         if cycles_per_month > 0
         else 0.0
     )
@@ -98,36 +147,36 @@ def compute_cpc_waterfall(
     #    A pack does ~cycles_per_day × 30 / (total_packs / total_docks) cycles per month — complex.
     #    Phase 1 simple formula: sabotage_pct × pack_cost per month, divided by cycles per dock per month.
     sabotage_monthly_loss_per_station = (
-        chaos.sabotage_pct_per_month
-        * station.docks_per_station  # proxy for packs at station
-        * pack.unit_cost
+        sabotage_pct_per_month
+        * docks_per_station  # proxy for packs at station
+        * pack_unit_cost
     )
     cpc_sabotage = sabotage_monthly_loss_per_station / cycles_per_month if cycles_per_month > 0 else 0.0
 
     # 8. Logistics: rebalancing cost per station / cycles per month per station
     cpc_logistics = (
-        opex.logistics_per_month_per_station / cycles_per_month
+        logistics_per_month_per_station / cycles_per_month
         if cycles_per_month > 0
         else 0.0
     )
 
     # 9. Overhead: network-wide overhead / total network cycles per month
-    cpc_overhead = opex.overhead_per_month / total_cycles_per_month if total_cycles_per_month > 0 else 0.0
+    cpc_overhead = overhead_per_month / total_cycles_per_month if total_cycles_per_month > 0 else 0.0
 
     total = (
         cpc_battery + cpc_charger + cpc_electricity + cpc_real_estate
         + cpc_maintenance + cpc_insurance + cpc_sabotage + cpc_logistics + cpc_overhead
     )
 
-    return CostPerCycleWaterfall(
-        battery=round(cpc_battery, 4),
-        charger=round(cpc_charger, 4),
-        electricity=round(cpc_electricity, 4),
-        real_estate=round(cpc_real_estate, 4),
-        maintenance=round(cpc_maintenance, 4),
-        insurance=round(cpc_insurance, 4),
-        sabotage=round(cpc_sabotage, 4),
-        logistics=round(cpc_logistics, 4),
-        overhead=round(cpc_overhead, 4),
-        total=round(total, 4),
+    return (
+        round(cpc_battery, 4),
+        round(cpc_charger, 4),
+        round(cpc_electricity, 4),
+        round(cpc_real_estate, 4),
+        round(cpc_maintenance, 4),
+        round(cpc_insurance, 4),
+        round(cpc_sabotage, 4),
+        round(cpc_logistics, 4),
+        round(cpc_overhead, 4),
+        round(total, 4),
     )
@@ -26,45 +26,130 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from zng_simulator.config.battery import PackSpec
 from zng_simulator.config.chaos import ChaosConfig
 from zng_simulator.models.results import CohortStatus
 
 
 # ═══════════════════════════════════════════════════════════════════════════
-# Internal mutable cohort (lightweight dataclass for simulation speed)
+# Internal cohort storage (struct-of-arrays for vectorised monthly steps)
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass
-class _Cohort:
-    """Mutable internal state for one pack cohort."""
-
-    cohort_id: int
-    born_month: int
-    pack_count: int
-    current_soh: float = 1.0
-    cumulative_cycles: int = 0
-    is_retired: bool = False
-    retired_month: int | None = None
-
-    def to_snapshot(self) -> CohortStatus:
-        """Convert to immutable Pydantic model for output."""
-        return CohortStatus(
-            cohort_id=self.cohort_id,
-            born_month=self.born_month,
-            pack_count=self.pack_count,
-            current_soh=round(self.current_soh, 6),
-            cumulative_cycles=self.cumulative_cycles,
-            is_retired=self.is_retired,
-            retired_month=self.retired_month,
-        )
+_INITIAL_CAPACITY = 64
+
+
+class _CohortArrays:
+    """Mutable state of every cohort, one NumPy array per field.
+
+    Row ``i`` is cohort ``i`` (ids are assigned in insertion order), so a
+    monthly step is a few array operations instead of a loop over objects.
+    Storage grows by doubling; only the first ``n`` rows are live.
+    ``retired_month`` is meaningful only where ``is_retired`` is set.
+    """
+
+    __slots__ = ("n", "born_month", "pack_count", "soh",
+                 "cumulative_cycles", "is_retired", "retired_month")
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        self.n = 0
+        self.born_month = np.zeros(capacity, dtype=np.int64)
+        self.pack_count = np.zeros(capacity, dtype=np.int64)
+        self.soh = np.ones(capacity, dtype=np.float64)
+        self.cumulative_cycles = np.zeros(capacity, dtype=np.int64)
+        self.is_retired = np.zeros(capacity, dtype=bool)
+        self.retired_month = np.zeros(capacity, dtype=np.int64)
+
+    def append(self, pack_counts: np.ndarray, born_month: int) -> None:
+        """Add fresh cohorts (SOH = 1.0), one per entry of ``pack_counts``."""
+        k = len(pack_counts)
+        lo, hi = self.n, self.n + k
+        if hi > len(self.soh):
+            self._grow(hi)
+        self.born_month[lo:hi] = born_month
+        self.pack_count[lo:hi] = pack_counts
+        self.n = hi
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self.soh)
+        while capacity < needed:
+            capacity *= 2
+        for name, fill in (("born_month", 0), ("pack_count", 0), ("soh", 1.0),
+                           ("cumulative_cycles", 0), ("is_retired", False),
+                           ("retired_month", 0)):
+            old = getattr(self, name)
+            grown = np.full(capacity, fill, dtype=old.dtype)
+            grown[:self.n] = old[:self.n]
+            setattr(self, name, grown)
+
+    def to_snapshots(self) -> list[CohortStatus]:
+        """Convert every cohort to an immutable Pydantic model for output."""
+        n = self.n
+        retired = self.is_retired[:n].tolist()
+        return [
+            CohortStatus(
+                cohort_id=cid,
+                born_month=born,
+                pack_count=count,
+                current_soh=round(soh, 6),
+                cumulative_cycles=cycles,
+                is_retired=is_ret,
+                retired_month=ret_month if is_ret else None,
+            )
+            for cid, born, count, soh, cycles, is_ret, ret_month in zip(
+                range(n),
+                self.born_month[:n].tolist(),
+                self.pack_count[:n].tolist(),
+                self.soh[:n].tolist(),
+                self.cumulative_cycles[:n].tolist(),
+                retired,
+                self.retired_month[:n].tolist(),
+            )
+        ]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Per-cohort update kernel
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _degrade_cohorts(
+    soh: np.ndarray,
+    cumulative_cycles: np.ndarray,
+    is_retired: np.ndarray,
+    retired_month: np.ndarray,
+    soh_loss: float,
+    cycles: int,
+    retirement_soh: float,
+    month: int,
+) -> np.ndarray:
+    """Apply one month's degradation to the live cohort rows, in place.
+
+    Subtracts ``soh_loss`` from, and adds ``cycles`` to, every non-retired
+    cohort, then retires those at or below ``retirement_soh`` (stamping
+    ``month``). Updates are masked ufunc writes (``where=``) rather than
+    fancy-index gathers and scatters.
+
+    Returns the indices of the newly retired cohorts, in cohort order.
+    """
+    active = ~is_retired
+    np.subtract(soh, soh_loss, out=soh, where=active)
+    np.add(cumulative_cycles, cycles, out=cumulative_cycles, where=active)
+
+    # Epsilon handles IEEE-754 float noise:
+    # e.g. 1.0 − 0.1 − 0.1 − 0.1 = 0.7000000000000001, not 0.7
+    newly = np.less_equal(soh, retirement_soh + 1e-9)
+    newly &= active
+    is_retired |= newly
+    np.copyto(retired_month, month, where=newly)
+    return np.flatnonzero(newly)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Step result
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DegradationStepResult:
     """Immutable output of one month's degradation step.
 
@@ -88,7 +173,8 @@ class DegradationStepResult:
     """Weighted average SOH across all active packs (0–1). 0.0 if no active packs."""
 
     cohort_snapshots: list[CohortStatus] = field(default_factory=list)
-    """Snapshot of every cohort (active + retired) at the end of this month."""
+    """Snapshot of every cohort (active + retired) at the end of this month.
+    Empty when the step was called with ``build_snapshots=False``."""
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -139,54 +225,57 @@ class DegradationTracker:
         # Retirement threshold
         self._retirement_soh = pack.retirement_soh_pct
 
-        # Cohort storage
-        self._cohorts: list[_Cohort] = []
-        self._next_id: int = 0
+        # Cohort storage; the active pack total is kept incrementally so
+        # step() never has to re-scan the cohorts for it
+        self._cohorts = _CohortArrays()
+        self._active_packs: int = 0
 
     # ── Public API ──────────────────────────────────────────────────────
 
     def add_cohort(self, pack_count: int, born_month: int) -> int:
         """Add a new cohort of packs. Returns the assigned cohort_id."""
-        cid = self._next_id
-        self._next_id += 1
-        self._cohorts.append(_Cohort(
-            cohort_id=cid,
-            born_month=born_month,
-            pack_count=pack_count,
-        ))
+        cid = self._cohorts.n
+        self._cohorts.append(np.array([pack_count]), born_month)
+        self._active_packs += pack_count
         return cid
 
     @property
     def active_pack_count(self) -> int:
         """Total packs across all non-retired cohorts."""
-        return sum(c.pack_count for c in self._cohorts if not c.is_retired)
+        return self._active_packs
 
     @property
     def avg_soh(self) -> float:
         """Pack-count-weighted average SOH of active cohorts."""
-        total_packs = 0
-        weighted_soh = 0.0
-        for c in self._cohorts:
-            if not c.is_retired:
-                total_packs += c.pack_count
-                weighted_soh += c.current_soh * c.pack_count
-        return weighted_soh / total_packs if total_packs > 0 else 0.0
+        if self._active_packs <= 0:
+            return 0.0
+        c = self._cohorts
+        active = ~c.is_retired[:c.n]
+        # cumsum accumulates in cohort order, like a running Python sum
+        weighted = np.cumsum(c.soh[:c.n][active] * c.pack_count[:c.n][active])
+        return float(weighted[-1]) / self._active_packs
 
     @property
     def cohort_count(self) -> int:
         """Total cohorts (including retired)."""
-        return len(self._cohorts)
+        return self._cohorts.n
 
     @property
     def active_cohort_count(self) -> int:
         """Number of non-retired cohorts."""
-        return sum(1 for c in self._cohorts if not c.is_retired)
+        return self._cohorts.n - int(np.count_nonzero(self._cohorts.is_retired[:self._cohorts.n]))
 
     def get_snapshots(self) -> list[CohortStatus]:
         """Current state of all cohorts (active + retired)."""
-        return [c.to_snapshot() for c in self._cohorts]
+        return self._cohorts.to_snapshots()
 
-    def step(self, month: int, total_fleet_cycles: int) -> DegradationStepResult:
+    def step(
+        self,
+        month: int,
+        total_fleet_cycles: int,
+        *,
+        build_snapshots: bool = True,
+    ) -> DegradationStepResult:
         """Advance one month: degrade SOH, check retirements, auto-replace.
 
         Parameters
@@ -196,20 +285,24 @@ class DegradationTracker:
         total_fleet_cycles : int
             Total charge-discharge cycles across the entire fleet this month.
             Distributed uniformly across all active packs.
+        build_snapshots : bool
+            Build the per-cohort ``CohortStatus`` list. Pass False when only
+            the retirement counts and average SOH are needed — the Pydantic
+            snapshots are the most expensive part of a step.
 
         Returns
         -------
         DegradationStepResult
             Retirements, replacements, avg SOH, and cohort snapshots.
         """
-        active_packs = self.active_pack_count
+        active_packs = self._active_packs
         if active_packs <= 0:
             return DegradationStepResult(
                 packs_retired=0,
                 packs_replaced=0,
                 active_pack_count=0,
                 avg_soh=0.0,
-                cohort_snapshots=self.get_snapshots(),
+                cohort_snapshots=self.get_snapshots() if build_snapshots else [],
             )
 
         # ── 1. Allocate cycles uniformly across active packs ────────────
@@ -220,40 +313,28 @@ class DegradationTracker:
         soh_loss_calendar = self._calendar_per_month
         total_soh_loss = soh_loss_cycling + soh_loss_calendar
 
-        packs_retired_this_month = 0
-        newly_retired: list[_Cohort] = []
-
-        for cohort in self._cohorts:
-            if cohort.is_retired:
-                continue
-
-            # Apply degradation
-            cohort.current_soh -= total_soh_loss
-            cohort.cumulative_cycles += int(round(cycles_per_pack))
-
-            # Check retirement (epsilon handles IEEE-754 float noise:
-            # e.g. 1.0 − 0.1 − 0.1 − 0.1 = 0.7000000000000001, not 0.7)
-            if cohort.current_soh <= self._retirement_soh + 1e-9:
-                cohort.is_retired = True
-                cohort.retired_month = month
-                packs_retired_this_month += cohort.pack_count
-                newly_retired.append(cohort)
+        c = self._cohorts
+        n = c.n
+        newly_retired = _degrade_cohorts(
+            c.soh[:n], c.cumulative_cycles[:n], c.is_retired[:n], c.retired_month[:n],
+            total_soh_loss, int(round(cycles_per_pack)), self._retirement_soh, month,
+        )
+        retired_counts = c.pack_count[newly_retired]
+        packs_retired_this_month = int(retired_counts.sum())
+        self._active_packs -= packs_retired_this_month
 
-        # ── 3. Auto-replace retired cohorts ─────────────────────────────
+        # ── 3. Auto-replace retired cohorts (in cohort order) ───────────
         packs_replaced = 0
         if self._auto_replace and packs_retired_this_month > 0:
-            for retired_cohort in newly_retired:
-                self.add_cohort(
-                    pack_count=retired_cohort.pack_count,
-                    born_month=month,
-                )
-                packs_replaced += retired_cohort.pack_count
+            c.append(retired_counts, born_month=month)
+            self._active_packs += packs_retired_this_month
+            packs_replaced = packs_retired_this_month
 
         # ── 4. Build result ─────────────────────────────────────────────
         return DegradationStepResult(
             packs_retired=packs_retired_this_month,
             packs_replaced=packs_replaced,
-            active_pack_count=self.active_pack_count,
+            active_pack_count=self._active_packs,
             avg_soh=round(self.avg_soh, 6),
-            cohort_snapshots=self.get_snapshots(),
+            cohort_snapshots=self.get_snapshots() if build_snapshots else [],
         )
@@ -1,6 +1,7 @@
 """Stochastic demand generator — Phase 2 (§7.1).
 
-Generates daily swap-visit counts for a given month, incorporating:
+Generates daily swap-visit counts for a given month (or a block of months in
+one draw, see ``generate_demand_months``), incorporating:
   1. Deterministic baseline from ``DerivedParams.swap_visits_per_vehicle_per_day``
   2. Weekend demand reduction (``DemandConfig.weekend_factor``)
   3. Seasonal sinusoidal variation (``DemandConfig.seasonal_amplitude``)
@@ -15,6 +16,8 @@ seasonal_amplitude=0) the output matches the Phase 1 static engine exactly.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 
 from zng_simulator.config.demand import DemandConfig
@@ -23,6 +26,36 @@ from zng_simulator.models.results import DerivedParams
 DAYS_PER_MONTH = 30
 """Fixed 30-day month used throughout the simulator (matches Phase 1)."""
 
+# Simple weekday model: month starts on a Monday (day 0 = Mon).
+# Days 5, 6 (Sat, Sun) of each 7-day week are weekends.
+_WEEKEND_MASK = np.fromiter(
+    ((d % 7) in (5, 6) for d in range(DAYS_PER_MONTH)), dtype=bool, count=DAYS_PER_MONTH,
+)
+
+# sin(2π·month/12) for months 1‥240.  The table spans the whole horizon
+# rather than one year because sin(2π·13/12) and sin(2π·1/12) differ in the
+# last bits; wrapping by month % 12 would shift seeded results.
+_SEASONAL_TABLE_MONTHS = 240
+_SEASONAL_SIN = np.sin(2.0 * np.pi * np.arange(1, _SEASONAL_TABLE_MONTHS + 1) / 12.0)
+
+
+@lru_cache(maxsize=64)
+def _day_factors(weekend_factor: float) -> np.ndarray:
+    """Per-day demand multiplier: ``weekend_factor`` on weekends, 1 otherwise.
+
+    Cached per factor, so the array is returned read-only.
+    """
+    factors = np.where(_WEEKEND_MASK, weekend_factor, 1.0)
+    factors.setflags(write=False)
+    return factors
+
+
+def _seasonal_sin(months: np.ndarray) -> np.ndarray:
+    """sin(2π·month/12) per month, from the table when in range."""
+    if months.size and months.min() >= 1 and months.max() <= _SEASONAL_TABLE_MONTHS:
+        return _SEASONAL_SIN[months - 1]
+    return np.sin(2.0 * np.pi * months / 12.0)
+
 
 def generate_daily_demand(
     demand: DemandConfig,
@@ -33,6 +66,8 @@ def generate_daily_demand(
 ) -> np.ndarray:
     """Generate 30 daily swap-visit counts for one month.
 
+    Single-month form of :func:`generate_demand_months`.
+
     Parameters
     ----------
     demand : DemandConfig
@@ -51,27 +86,69 @@ def generate_daily_demand(
     np.ndarray
         Shape ``(30,)`` of non-negative integer daily swap visits.
     """
+    return generate_demand_months(
+        demand, derived, np.array([fleet_size]), np.array([month]), rng,
+    )[0]
+
+
+def generate_demand_months(
+    demand: DemandConfig,
+    derived: DerivedParams,
+    fleet_sizes: np.ndarray,
+    months: np.ndarray,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Generate daily swap-visit counts for several months in one draw.
+
+    Builds the whole ``(len(months), 30)`` matrix of daily means at once and
+    samples it with a single ``rng.poisson`` / ``rng.gamma`` call, instead of
+    one small call per month.  NumPy fills array draws in row-major order, so
+    the result is identical to calling :func:`generate_daily_demand` for each
+    month in turn on the same ``rng``.
+
+    Parameters
+    ----------
+    demand : DemandConfig
+        Stochastic demand settings (distribution, volatility, weekend, seasonal).
+    derived : DerivedParams
+        Operational parameters — ``swap_visits_per_vehicle_per_day`` is the key input.
+    fleet_sizes : np.ndarray
+        Active vehicles in each month, aligned with ``months``.
+    months : np.ndarray
+        1-indexed month numbers. Used for seasonal variation.
+    rng : numpy.random.Generator
+        Seeded RNG for reproducibility.
+
+    Returns
+    -------
+    np.ndarray
+        Shape ``(len(months), 30)`` of non-negative integer daily swap visits;
+        ``.sum(axis=1)`` gives the monthly totals.
+    """
     # ── 1. Deterministic baseline ───────────────────────────────────────
-    base_daily_visits = derived.swap_visits_per_vehicle_per_day * fleet_size
+    base_daily_visits = derived.swap_visits_per_vehicle_per_day * np.asarray(fleet_sizes)
+
+    # Phase-1-equivalent case (zero-noise Gamma, flat week, no season): every
+    # day is the rounded baseline, so skip the seasonal and per-day matrices.
+    # Poisson and bimodal stay random even when these settings are neutral.
+    if (
+        demand.distribution == "gamma"
+        and demand.volatility <= 0.0
+        and demand.seasonal_amplitude == 0.0
+        and demand.weekend_factor == 1.0
+    ):
+        daily = np.maximum(np.round(base_daily_visits).astype(np.int64), 0)
+        return np.repeat(daily[:, None], DAYS_PER_MONTH, axis=1)
 
     # ── 2. Seasonal adjustment ──────────────────────────────────────────
     # Sinusoidal with 12-month period.
     # month=3 → sin(π/2) = +1 (peak), month=9 → sin(3π/2) = −1 (trough)
-    seasonal_factor = 1.0 + demand.seasonal_amplitude * np.sin(
-        2.0 * np.pi * month / 12.0
-    )
+    seasonal_factor = 1.0 + demand.seasonal_amplitude * _seasonal_sin(np.asarray(months))
 
     adjusted_base = base_daily_visits * seasonal_factor
 
     # ── 3. Per-day means (weekday / weekend) ────────────────────────────
-    daily_means = np.full(DAYS_PER_MONTH, adjusted_base, dtype=np.float64)
-
-    # Simple weekday model: month starts on a Monday (day 0 = Mon).
-    # Days 5, 6 (Sat, Sun) of each 7-day week are weekends.
-    weekend_mask = np.array(
-        [(d % 7) in (5, 6) for d in range(DAYS_PER_MONTH)], dtype=bool
-    )
-    daily_means[weekend_mask] *= demand.weekend_factor
+    daily_means = adjusted_base[:, None] * _day_factors(demand.weekend_factor)
 
     # ── 4. Stochastic draw ──────────────────────────────────────────────
     if demand.distribution == "poisson":
@@ -108,30 +185,31 @@ def generate_daily_demand(
         # μ1 = mean - w2 * separation * mean
         # μ2 = mean + w1 * separation * mean
         # This ensures: w1*μ1 + w2*μ2 = mean
-        mu1_offsets = -w2 * separation * daily_means
-        mu2_offsets = w1 * separation * daily_means
+        flat_means = daily_means.ravel()
+        mu1_offsets = -w2 * separation * flat_means
+        mu2_offsets = w1 * separation * flat_means
         
         # Standard deviation for each peak
-        std_devs = demand.bimodal_std_ratio * daily_means
+        std_devs = demand.bimodal_std_ratio * flat_means
         
-        # Sample from mixture
-        daily_samples = np.zeros(DAYS_PER_MONTH, dtype=np.float64)
-        for i in range(DAYS_PER_MONTH):
+        # Sample from mixture, day by day in month order
+        daily_samples = np.zeros(flat_means.size, dtype=np.float64)
+        for i in range(flat_means.size):
             # Choose which peak to sample from
             if rng.random() < w1:
                 # Sample from peak 1
                 daily_samples[i] = rng.normal(
-                    daily_means[i] + mu1_offsets[i],
+                    flat_means[i] + mu1_offsets[i],
                     max(std_devs[i], 0.1)
                 )
             else:
                 # Sample from peak 2
                 daily_samples[i] = rng.normal(
-                    daily_means[i] + mu2_offsets[i],
+                    flat_means[i] + mu2_offsets[i],
                     max(std_devs[i], 0.1)
                 )
         
-        daily_visits = np.round(daily_samples).astype(np.int64)
+        daily_visits = np.round(daily_samples).astype(np.int64).reshape(daily_means.shape)
     
     else:
         # Fallback: deterministic (should not happen with Pydantic validation).
@@ -20,6 +20,10 @@ from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
+from pydantic import TypeAdapter
 
 from zng_simulator.config.battery import PackSpec
 from zng_simulator.config.charger import ChargerVariant
@@ -43,7 +47,7 @@ from zng_simulator.models.field_data import (
 # CSV ingestion
 # ═══════════════════════════════════════════════════════════════════════════
 
-def ingest_bms_csv(source: str | Path | io.StringIO) -> list[BMSRecord]:
+def ingest_bms_csv(source: str | Path | io.StringIO | io.BytesIO) -> list[BMSRecord]:
     """Parse a BMS telemetry CSV into a list of BMSRecord.
 
     Expected columns (header row required):
@@ -51,14 +55,19 @@ def ingest_bms_csv(source: str | Path | io.StringIO) -> list[BMSRecord]:
 
     Parameters
     ----------
-    source : str | Path | io.StringIO
-        File path or in-memory StringIO with CSV content.
+    source : str | Path | io.StringIO | io.BytesIO
+        File path, or in-memory text or UTF-8 bytes with CSV content
+        (an uploaded file can be passed as-is).
 
     Returns
     -------
     list[BMSRecord]
         Validated records.  Rows that fail validation are silently skipped.
     """
+    table = _read_csv_table(source, _BMS_COLUMN_TYPES, _BMS_REQUIRED)
+    if table is not None:
+        return _bms_records_from_table(table)
+
     rows = _read_csv(source)
     records: list[BMSRecord] = []
     for row in rows:
@@ -80,7 +89,7 @@ def ingest_bms_csv(source: str | Path | io.StringIO) -> list[BMSRecord]:
     return records
 
 
-def ingest_charger_csv(source: str | Path | io.StringIO) -> list[ChargerFailureRecord]:
+def ingest_charger_csv(source: str | Path | io.StringIO | io.BytesIO) -> list[ChargerFailureRecord]:
     """Parse a charger failure log CSV into ChargerFailureRecord list.
 
     Expected columns (header row required):
@@ -88,14 +97,19 @@ def ingest_charger_csv(source: str | Path | io.StringIO) -> list[ChargerFailureR
 
     Parameters
     ----------
-    source : str | Path | io.StringIO
-        File path or in-memory StringIO with CSV content.
+    source : str | Path | io.StringIO | io.BytesIO
+        File path, or in-memory text or UTF-8 bytes with CSV content
+        (an uploaded file can be passed as-is).
 
     Returns
     -------
     list[ChargerFailureRecord]
         Validated records.
     """
+    table = _read_csv_table(source, _CHARGER_COLUMN_TYPES, _CHARGER_REQUIRED)
+    if table is not None:
+        return _charger_records_from_table(table)
+
     rows = _read_csv(source)
     records: list[ChargerFailureRecord] = []
     for row in rows:
@@ -125,8 +139,112 @@ def ingest_charger_csv(source: str | Path | io.StringIO) -> list[ChargerFailureR
     return records
 
 
-def _read_csv(source: str | Path | io.StringIO) -> list[dict[str, str]]:
-    """Read CSV from file path or StringIO, returning list of dicts."""
+# Columnar fast path: Arrow parses and type-checks the whole file at once, rows
+# violating the model constraints are dropped with column masks, and the rest
+# are validated as one batch.  Any cell Arrow cannot convert to the declared
+# type makes the whole file fall back to the row-by-row parser, which skips
+# just the offending rows.
+_NULL_TOKENS = ["", "NA", "null"]
+_TRUE_TOKENS = ["true", "1", "yes"]
+
+_BMS_REQUIRED = frozenset({"pack_id", "month", "soh", "cumulative_cycles"})
+_BMS_COLUMN_TYPES = {
+    "pack_id": pa.string(),
+    "month": pa.int64(),
+    "soh": pa.float64(),
+    "cumulative_cycles": pa.int64(),
+    "temperature_avg_c": pa.float64(),
+}
+
+_CHARGER_REQUIRED = frozenset({"dock_id", "failure_month", "downtime_hours"})
+_CHARGER_COLUMN_TYPES = {
+    "dock_id": pa.string(),
+    "charger_variant_name": pa.string(),
+    "failure_month": pa.int64(),
+    "downtime_hours": pa.float64(),
+    "repair_cost": pa.float64(),
+    "was_replaced": pa.string(),
+}
+
+_BMS_RECORDS = TypeAdapter(list[BMSRecord])
+_CHARGER_RECORDS = TypeAdapter(list[ChargerFailureRecord])
+
+
+def _read_csv_table(
+    source: str | Path | io.StringIO | io.BytesIO,
+    column_types: dict[str, pa.DataType],
+    required: frozenset[str],
+) -> pa.Table | None:
+    """Parse CSV into an Arrow table, or None if it needs the row-by-row path."""
+    if isinstance(source, io.BytesIO):
+        source = pa.BufferReader(pa.py_buffer(source.getbuffer()))
+    elif isinstance(source, io.StringIO):
+        source = pa.BufferReader(source.getvalue().encode("utf-8"))
+    else:
+        source = str(source)
+    convert = pa_csv.ConvertOptions(
+        column_types=column_types,
+        null_values=_NULL_TOKENS,
+        strings_can_be_null=False,
+    )
+    try:
+        table = pa_csv.read_csv(source, convert_options=convert)
+    except pa.ArrowInvalid:
+        return None
+    if not required <= set(table.column_names):
+        return None
+    return table
+
+
+def _bms_records_from_table(table: pa.Table) -> list[BMSRecord]:
+    soh = table["soh"]
+    valid = pc.and_(
+        pc.and_(pc.greater_equal(table["month"], 1), pc.greater_equal(table["cumulative_cycles"], 0)),
+        pc.and_(pc.greater_equal(soh, 0.0), pc.less_equal(soh, 1.0)),
+    )
+    table = table.filter(pc.fill_null(valid, False))
+    table = table.set_column(
+        table.column_names.index("pack_id"), "pack_id",
+        pc.utf8_trim_whitespace(table["pack_id"]),
+    )
+    columns = [c for c in _BMS_COLUMN_TYPES if c in table.column_names]
+    return _BMS_RECORDS.validate_python(table.select(columns).to_pylist())
+
+
+def _charger_records_from_table(table: pa.Table) -> list[ChargerFailureRecord]:
+    valid = pc.and_(
+        pc.greater_equal(table["failure_month"], 1),
+        pc.greater_equal(table["downtime_hours"], 0.0),
+    )
+    table = table.filter(pc.fill_null(valid, False))
+    table = table.set_column(
+        table.column_names.index("dock_id"), "dock_id",
+        pc.utf8_trim_whitespace(table["dock_id"]),
+    )
+    if "charger_variant_name" in table.column_names:
+        names = table["charger_variant_name"]
+        table = table.set_column(
+            table.column_names.index("charger_variant_name"), "charger_variant_name",
+            pc.if_else(
+                pc.is_in(names, value_set=pa.array(_NULL_TOKENS)),
+                pa.scalar(None, pa.string()),
+                pc.utf8_trim_whitespace(names),
+            ),
+        )
+    if "was_replaced" in table.column_names:
+        flags = pc.utf8_lower(pc.utf8_trim_whitespace(table["was_replaced"]))
+        table = table.set_column(
+            table.column_names.index("was_replaced"), "was_replaced",
+            pc.is_in(flags, value_set=pa.array(_TRUE_TOKENS)),
+        )
+    columns = [c for c in _CHARGER_COLUMN_TYPES if c in table.column_names]
+    return _CHARGER_RECORDS.validate_python(table.select(columns).to_pylist())
+
+
+def _read_csv(source: str | Path | io.StringIO | io.BytesIO) -> list[dict[str, str]]:
+    """Read CSV from file path, StringIO or BytesIO, returning list of dicts."""
+    if isinstance(source, io.BytesIO):
+        source = io.StringIO(source.getvalue().decode("utf-8"))
     if isinstance(source, io.StringIO):
         source.seek(0)
         reader = csv.DictReader(source)
@@ -208,40 +326,47 @@ def _compute_degradation_variance(
     beta_per_cycle = (pack.cycle_degradation_rate_pct / 100.0) * aggressiveness
     calendar_per_month = pack.calendar_aging_rate_pct_per_month / 100.0
 
-    # Group field records by month → compute actual avg SOH
-    months_data: dict[int, list[BMSRecord]] = {}
-    for rec in field_data.bms_records:
-        months_data.setdefault(rec.month, []).append(rec)
+    # Group field records by month → compute actual avg SOH.  Months are
+    # compacted to 0..k-1 so bincount sums each group in one pass.
+    records = field_data.bms_records
+    n = len(records)
+    rec_months = np.fromiter((r.month for r in records), dtype=np.int64, count=n)
+    soh = np.fromiter((r.soh for r in records), dtype=np.float64, count=n)
+    cycles = np.fromiter((r.cumulative_cycles for r in records), dtype=np.float64, count=n)
+
+    months, group = np.unique(rec_months, return_inverse=True)
+    counts = np.bincount(group)
+    actual_avg_soh = np.bincount(group, weights=soh) / counts
 
-    # Compute average cycles per pack at each month for model projection
     # Use the field data's cumulative cycles to determine how many cycles
     # each pack has done, so the model projection matches the actual usage.
-    results: list[DegradationVariance] = []
-
-    for month in sorted(months_data.keys()):
-        records = months_data[month]
-        actual_avg_soh = sum(r.soh for r in records) / len(records)
-        avg_cumulative_cycles = sum(r.cumulative_cycles for r in records) / len(records)
+    avg_cumulative_cycles = np.bincount(group, weights=cycles) / counts
 
-        # Model prediction: SOH = 1.0 - β × cycles - calendar × months
-        projected_soh_loss_cycling = beta_per_cycle * avg_cumulative_cycles
-        projected_soh_loss_calendar = calendar_per_month * month
-        projected_avg_soh = max(1.0 - projected_soh_loss_cycling - projected_soh_loss_calendar, 0.0)
-
-        variance_pct = (
-            (actual_avg_soh - projected_avg_soh) / projected_avg_soh * 100.0
-            if projected_avg_soh > 0 else 0.0
-        )
+    # Model prediction: SOH = 1.0 - β × cycles - calendar × months
+    projected_avg_soh = np.maximum(
+        1.0 - beta_per_cycle * avg_cumulative_cycles - calendar_per_month * months, 0.0,
+    )
+    positive = projected_avg_soh > 0
+    variance_pct = np.zeros_like(projected_avg_soh)
+    np.divide(
+        actual_avg_soh - projected_avg_soh, projected_avg_soh,
+        out=variance_pct, where=positive,
+    )
+    variance_pct *= 100.0
 
-        results.append(DegradationVariance(
+    return [
+        DegradationVariance(
             month=month,
-            projected_avg_soh=round(projected_avg_soh, 6),
-            actual_avg_soh=round(actual_avg_soh, 6),
-            variance_pct=round(variance_pct, 4),
-            num_packs_sampled=len(records),
-        ))
-
-    return results
+            projected_avg_soh=round(projected, 6),
+            actual_avg_soh=round(actual, 6),
+            variance_pct=round(var, 4),
+            num_packs_sampled=count,
+        )
+        for month, projected, actual, var, count in zip(
+            months.tolist(), projected_avg_soh.tolist(), actual_avg_soh.tolist(),
+            variance_pct.tolist(), counts.tolist(),
+        )
+    ]
 
 
 def _compute_mtbf_variance(
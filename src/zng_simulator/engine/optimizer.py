@@ -14,11 +14,18 @@ Search strategy (binary search over fleet sizes):
 For stochastic engines, the confidence level determines which percentile
 to test against.  E.g. confidence=90 means the P10 outcome (pessimistic
 end) must satisfy the target — i.e. "90% of simulations meet the goal".
+
+Both searches accept ``max_workers`` to evaluate fleet sizes in a process
+pool.  The binary search then evaluates the next few levels of candidate
+midpoints speculatively in parallel; the path it takes (and so the
+result) is identical to the sequential search.
 """
 
 from __future__ import annotations
 
 import math
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
 from copy import deepcopy
 
 from zng_simulator.config.charger import ChargerVariant
@@ -37,6 +44,7 @@ def find_minimum_fleet_size(
     max_fleet: int = 2000,
     max_iterations: int = 30,
     break_even_target_months: int | None = None,
+    max_workers: int | None = None,
 ) -> PilotSizingResult:
     """Binary-search for the minimum fleet size that achieves a financial target.
 
@@ -64,6 +72,9 @@ def find_minimum_fleet_size(
         Maximum binary search steps.
     break_even_target_months : int | None
         Required for ``target_metric='break_even_within'``.
+    max_workers : int | None
+        If > 1, evaluate upcoming bisection midpoints speculatively in a
+        process pool of this size.  ``None`` / 1 runs sequentially.
 
     Returns
     -------
@@ -82,32 +93,51 @@ def find_minimum_fleet_size(
 
     lo, hi = min_fleet, max_fleet
 
-    while lo <= hi and iterations < max_iterations:
-        mid = (lo + hi) // 2
-        iterations += 1
-
-        npv, ncf, be_month = _evaluate_fleet_size(
-            scenario, charger, mid, target_confidence_pct,
-        )
-
-        passed = _check_target(target_metric, npv, ncf, be_month, break_even_target_months)
-
-        search_log.append({
-            "fleet_size": mid,
-            "npv": round(npv, 2) if npv is not None else None,
-            "ncf": round(ncf, 2) if ncf is not None else None,
-            "break_even_month": be_month,
-            "passed": passed,
-        })
-
-        if passed:
-            best_passing = mid
-            best_npv = npv
-            best_be = be_month
-            best_ncf = ncf
-            hi = mid - 1  # try smaller
-        else:
-            lo = mid + 1  # need bigger
+    # Pool of depth-d speculation: one batch covers d bisection levels
+    pool = _make_pool(scenario, charger, max_workers)
+    depth = math.ceil(math.log2(max_workers + 1)) if pool is not None else 1
+    evaluated: dict[int, tuple[float | None, float | None, int | None]] = {}
+
+    try:
+        while lo <= hi and iterations < max_iterations:
+            mid = (lo + hi) // 2
+            iterations += 1
+
+            if mid not in evaluated:
+                if pool is None:
+                    evaluated[mid] = _evaluate_fleet_size(
+                        scenario, charger, mid, target_confidence_pct,
+                    )
+                else:
+                    batch = [
+                        c for c in _bisection_candidates(lo, hi, depth)
+                        if c not in evaluated
+                    ]
+                    confs = [target_confidence_pct] * len(batch)
+                    evaluated.update(zip(batch, pool.map(_evaluate_in_worker, batch, confs)))
+            npv, ncf, be_month = evaluated[mid]
+
+            passed = _check_target(target_metric, npv, ncf, be_month, break_even_target_months)
+
+            search_log.append({
+                "fleet_size": mid,
+                "npv": round(npv, 2) if npv is not None else None,
+                "ncf": round(ncf, 2) if ncf is not None else None,
+                "break_even_month": be_month,
+                "passed": passed,
+            })
+
+            if passed:
+                best_passing = mid
+                best_npv = npv
+                best_be = be_month
+                best_ncf = ncf
+                hi = mid - 1  # try smaller
+            else:
+                lo = mid + 1  # need bigger
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
     achieved = best_passing is not None
     recommended = best_passing if achieved else max_fleet
@@ -135,6 +165,58 @@ def find_minimum_fleet_size(
     )
 
 
+def _bisection_candidates(lo: int, hi: int, depth: int) -> list[int]:
+    """Midpoints the binary search can visit in its next ``depth`` steps from [lo, hi]."""
+    candidates: list[int] = []
+    frontier = [(lo, hi)]
+    for _ in range(depth):
+        nxt: list[tuple[int, int]] = []
+        for a, b in frontier:
+            if a > b:
+                continue
+            m = (a + b) // 2
+            candidates.append(m)
+            nxt += [(a, m - 1), (m + 1, b)]
+        frontier = nxt
+    return candidates
+
+
+# Per-worker search context, installed once by the pool initializer so the
+# scenario is pickled once per worker rather than once per fleet size.
+_worker_ctx: tuple[Scenario, ChargerVariant] | None = None
+
+
+def _init_worker(scenario: Scenario, charger: ChargerVariant) -> None:
+    global _worker_ctx
+    _worker_ctx = (scenario, charger)
+
+
+def _evaluate_in_worker(
+    fleet_size: int, confidence_pct: float,
+) -> tuple[float | None, float | None, int | None]:
+    assert _worker_ctx is not None
+    scenario, charger = _worker_ctx
+    return _evaluate_fleet_size(scenario, charger, fleet_size, confidence_pct)
+
+
+def _make_pool(
+    scenario: Scenario, charger: ChargerVariant, max_workers: int | None,
+) -> Executor | None:
+    """Process pool for fleet-size evaluation, or None to run in-process.
+
+    Uses the ``spawn`` start method: forking a threaded host process (e.g.
+    the Streamlit server) is unsafe.
+    """
+    if max_workers is None or max_workers <= 1:
+        return None
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(scenario, charger),
+    )
+
+
 def _evaluate_fleet_size(
     scenario: Scenario,
     charger: ChargerVariant,
@@ -217,6 +299,7 @@ def find_optimal_scale(
     fleet_sizes: list[int] | None = None,
     target_metric: str = "positive_npv",
     target_confidence_pct: float = 50.0,
+    max_workers: int | None = None,
 ) -> PilotSizingResult:
     """Evaluate specific fleet sizes and return the best.
 
@@ -238,6 +321,8 @@ def find_optimal_scale(
         Same as ``find_minimum_fleet_size``.
     target_confidence_pct : float
         Same as ``find_minimum_fleet_size``.
+    max_workers : int | None
+        If > 1, evaluate the fleet sizes concurrently in a process pool.
 
     Returns
     -------
@@ -247,16 +332,25 @@ def find_optimal_scale(
     if fleet_sizes is None:
         fleet_sizes = [50, 100, 200, 300, 500]
 
+    pool = _make_pool(scenario, charger, max_workers)
+    if pool is None:
+        outcomes = [
+            _evaluate_fleet_size(scenario, charger, fs, target_confidence_pct)
+            for fs in fleet_sizes
+        ]
+    else:
+        with pool:
+            outcomes = list(pool.map(
+                _evaluate_in_worker, fleet_sizes, [target_confidence_pct] * len(fleet_sizes),
+            ))
+
     search_log: list[dict] = []
     best_fleet = None
     best_npv_val: float | None = None
     best_be: int | None = None
     best_ncf: float | None = None
 
-    for fs in fleet_sizes:
-        npv, ncf, be_month = _evaluate_fleet_size(
-            scenario, charger, fs, target_confidence_pct,
-        )
+    for fs, (npv, ncf, be_month) in zip(fleet_sizes, outcomes):
         passed = _check_target(target_metric, npv, ncf, be_month, scenario.simulation.horizon_months)
 
         search_log.append({
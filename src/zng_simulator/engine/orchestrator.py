@@ -12,13 +12,16 @@ Each month follows this sequence:
 Monte-Carlo mode runs N independent simulations with different seeds
 and aggregates P10/P50/P90 percentiles for investor-grade outputs.
 
-Entry point: ``run_engine(scenario, charger)``
+Entry points: ``run_engine(scenario, charger)`` and
+``run_engine_batch(scenario, chargers)`` for several charger variants
   - Routes to Phase 1 static engine when ``scenario.simulation.engine == "static"``
   - Routes to stochastic loop when ``engine == "stochastic"``
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import numpy as np
 
 from zng_simulator.config.scenario import Scenario
@@ -27,12 +30,16 @@ from zng_simulator.engine.derived import compute_derived_params
 from zng_simulator.engine.charger_tco import compute_charger_tco
 from zng_simulator.engine.pack_tco import compute_pack_tco
 from zng_simulator.engine.cost_per_cycle import compute_cpc_waterfall
-from zng_simulator.engine.cashflow import run_simulation  # Phase 1 fallback
+from zng_simulator.engine.cashflow import run_simulation, run_simulation_batch  # Phase 1 fallback
 from zng_simulator.engine.demand import generate_monthly_demand
 from zng_simulator.engine.degradation import DegradationTracker
 from zng_simulator.engine.charger_reliability import ChargerReliabilityTracker
 from zng_simulator.models.results import (
+    ChargerTCOBreakdown,
+    CostPerCycleWaterfall,
+    DerivedParams,
     MonthlySnapshot,
+    PackTCOBreakdown,
     RunSummary,
     SimulationResult,
     MonteCarloSummary,
@@ -61,22 +68,39 @@ def run_engine(scenario: Scenario, charger: ChargerVariant) -> SimulationResult:
     return _run_single_stochastic(scenario, charger, seed)
 
 
+def run_engine_batch(scenario: Scenario, chargers: list[ChargerVariant]) -> list[SimulationResult]:
+    """Run the selected engine for each charger variant, in order.
+
+    The static engine shares the charger-independent demand schedule across
+    variants (``cashflow.run_simulation_batch``); the stochastic engine
+    runs each variant independently, exactly as ``run_engine`` would.
+    """
+    if scenario.simulation.engine == "static":
+        return run_simulation_batch(scenario, chargers)
+    return [run_engine(scenario, charger) for charger in chargers]
+
+
 # ═══════════════════════════════════════════════════════════════════════════
-# Single stochastic run
+# Deterministic setup
 # ═══════════════════════════════════════════════════════════════════════════
 
-def _run_single_stochastic(
-    scenario: Scenario,
-    charger: ChargerVariant,
-    seed: int,
-) -> SimulationResult:
-    """Execute one stochastic simulation run.
+@dataclass(frozen=True, slots=True)
+class _StochasticSetup:
+    """Seed-independent inputs of a stochastic run, shared by every Monte-Carlo run."""
 
-    This is the core loop that replaces the Phase 1 static engine with:
-      - Stochastic demand (Poisson/Gamma)
-      - Cohort-based battery degradation (lumpy CapEx)
-      - Per-dock charger failure simulation (Weibull/exponential)
-    """
+    derived: DerivedParams
+    tco: ChargerTCOBreakdown
+    ptco: PackTCOBreakdown
+    cpc: CostPerCycleWaterfall
+    """Deterministic steady-state waterfall (reference CPC)."""
+
+    initial_packs: int
+    total_initial_capex: float
+    """Stations + chargers + initial pack inventory (₹), spent in month 1."""
+
+
+def _deterministic_setup(scenario: Scenario, charger: ChargerVariant) -> _StochasticSetup:
+    """Derived params, TCOs, CPC waterfall and initial CapEx for one charger variant."""
     v = scenario.vehicle
     p = scenario.pack
     st = scenario.station
@@ -84,11 +108,7 @@ def _run_single_stochastic(
     rev = scenario.revenue
     ch = scenario.chaos
     sim = scenario.simulation
-    demand_cfg = scenario.demand
 
-    rng = np.random.default_rng(seed)
-
-    # ── Deterministic setup (same for every run) ────────────────────────
     derived = compute_derived_params(v, p, charger, st, ch, rev)
     tco = compute_charger_tco(charger, derived, v, rev, sim, st)
 
@@ -107,6 +127,49 @@ def _run_single_stochastic(
     ptco = compute_pack_tco(p, derived, v, rev, sim, st, initial_packs)
     cpc = compute_cpc_waterfall(derived, p, charger, op, ch, st, v, tco, ptco)
 
+    return _StochasticSetup(derived, tco, ptco, cpc, initial_packs, total_initial_capex)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Single stochastic run
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _run_single_stochastic(
+    scenario: Scenario,
+    charger: ChargerVariant,
+    seed: int,
+    setup: _StochasticSetup | None = None,
+    record_cohorts: bool = True,
+) -> SimulationResult:
+    """Execute one stochastic simulation run.
+
+    This is the core loop that replaces the Phase 1 static engine with:
+      - Stochastic demand (Poisson/Gamma)
+      - Cohort-based battery degradation (lumpy CapEx)
+      - Per-dock charger failure simulation (Weibull/exponential)
+
+    With ``record_cohorts=False`` no per-month cohort snapshots are built
+    and ``cohort_history`` is None — for runs whose summary is all that is
+    kept.
+    """
+    v = scenario.vehicle
+    p = scenario.pack
+    st = scenario.station
+    op = scenario.opex
+    rev = scenario.revenue
+    ch = scenario.chaos
+    sim = scenario.simulation
+    demand_cfg = scenario.demand
+
+    rng = np.random.default_rng(seed)
+
+    # ── Deterministic setup (same for every run) ────────────────────────
+    if setup is None:
+        setup = _deterministic_setup(scenario, charger)
+    derived, tco, ptco, cpc = setup.derived, setup.tco, setup.ptco, setup.cpc
+    initial_packs = setup.initial_packs
+    total_initial_capex = setup.total_initial_capex
+
     # ── Initialize stochastic engines ───────────────────────────────────
     degradation = DegradationTracker(p, ch, auto_replace=True)
     degradation.add_cohort(initial_packs, born_month=1)
@@ -117,10 +180,10 @@ def _run_single_stochastic(
 
     # ── Monthly loop ────────────────────────────────────────────────────
     months: list[MonthlySnapshot] = []
-    cohort_history: list = []
+    cohort_history: list | None = [] if record_cohorts else None
 
     cumulative_cf = 0.0
-    break_even_month: int | None = None
+    cumulative_path = np.empty(sim.horizon_months)
 
     total_revenue = 0.0
     total_opex_sum = 0.0
@@ -143,7 +206,9 @@ def _run_single_stochastic(
         )
 
         # ── 2. Battery degradation (cohort tracker) ─────────────────────
-        deg_result = degradation.step(month=m, total_fleet_cycles=total_cycles)
+        deg_result = degradation.step(
+            month=m, total_fleet_cycles=total_cycles, build_snapshots=record_cohorts,
+        )
 
         # Lumpy replacement CapEx
         replacement_capex = deg_result.packs_retired * p.unit_cost
@@ -201,9 +266,7 @@ def _run_single_stochastic(
         # ── 7. Net cash flow ────────────────────────────────────────────
         net_cf = monthly_revenue - monthly_opex - capex_this_month
         cumulative_cf += net_cf
-
-        if break_even_month is None and cumulative_cf >= 0 and m > 1:
-            break_even_month = m
+        cumulative_path[m - 1] = cumulative_cf
 
         # Accumulators
         total_revenue += monthly_revenue
@@ -218,7 +281,8 @@ def _run_single_stochastic(
         total_salvage_credit += salvage_credit
 
         # ── 8. Record snapshot ──────────────────────────────────────────
-        cohort_history.append(deg_result.cohort_snapshots)
+        if cohort_history is not None:
+            cohort_history.append(deg_result.cohort_snapshots)
 
         months.append(MonthlySnapshot(
             month=m,
@@ -241,6 +305,12 @@ def _run_single_stochastic(
         ))
 
     # ── Build summary ───────────────────────────────────────────────────
+    # First month after the launch month where the cumulative CF turns
+    # non-negative (a linear search: lumpy replacement CapEx means the
+    # path is not monotone, so a sorted search would not be valid)
+    reached = np.flatnonzero(cumulative_path[1:] >= 0)
+    break_even_month = int(reached[0]) + 2 if reached.size else None
+
     avg_cpc = total_cpc_weighted / total_cycles_all if total_cycles_all > 0 else 0.0
     last_soh = months[-1].avg_soh if months else None
 
@@ -285,7 +355,9 @@ def _run_monte_carlo(
     """Run N stochastic simulations and aggregate into P10/P50/P90.
 
     Strategy:
-      1. Run N simulations with sequential seeds (base_seed + i)
+      0. Build the seed-independent setup (derived params, TCOs, CPC) once
+      1. Run N simulations with sequential seeds (base_seed + i), skipping
+         the per-month cohort snapshots since only summaries are kept
       2. Collect RunSummary from each
       3. Compute MonteCarloSummary with percentiles
       4. Re-run the median simulation to get the representative full result
@@ -295,9 +367,10 @@ def _run_monte_carlo(
     num_runs = scenario.simulation.monte_carlo_runs
 
     # ── Collect summaries ───────────────────────────────────────────────
+    setup = _deterministic_setup(scenario, charger)
     summaries: list[RunSummary] = []
     for i in range(num_runs):
-        result = _run_single_stochastic(scenario, charger, base_seed + i)
+        result = _run_single_stochastic(scenario, charger, base_seed + i, setup, record_cohorts=False)
         summaries.append(result.summary)
 
     # ── Percentile arrays ───────────────────────────────────────────────
@@ -330,7 +403,7 @@ def _run_monte_carlo(
 
     # ── Find & re-run the median run ────────────────────────────────────
     median_idx = int(np.argmin(np.abs(ncfs - mc.ncf_p50)))
-    representative = _run_single_stochastic(scenario, charger, base_seed + median_idx)
+    representative = _run_single_stochastic(scenario, charger, base_seed + median_idx, setup)
 
     # Attach Monte-Carlo summary to the representative result
     return representative.model_copy(update={"monte_carlo": mc})
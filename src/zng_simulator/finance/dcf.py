@@ -12,6 +12,8 @@ Key formulas:
 
 from __future__ import annotations
 
+import numpy as np
+
 from zng_simulator.config.finance import FinanceConfig
 from zng_simulator.models.results import (
     DCFResult,
@@ -21,6 +23,25 @@ from zng_simulator.models.results import (
 )
 
 
+def _monthly_rate(annual_rate: float) -> float:
+    """Convert an annual discount rate to its compounded monthly equivalent."""
+    return (1 + annual_rate) ** (1 / 12) - 1
+
+
+def _discount_kernel(
+    cash_flows: np.ndarray, r_monthly: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Discount a dense array of monthly cash flows in one vectorised pass.
+
+    Returns ``(discount_factor, pv_net_cf, cumulative_pv)`` arrays, one
+    element per month (index 0 = month 1).
+    """
+    t = np.arange(1, len(cash_flows) + 1)
+    discount_factor = 1 / (1 + r_monthly) ** t
+    pv = cash_flows * discount_factor
+    return discount_factor, pv, np.cumsum(pv)
+
+
 def compute_npv(cash_flows: list[float], annual_rate: float) -> float:
     """Compute Net Present Value of monthly cash flows.
 
@@ -39,11 +60,9 @@ def compute_npv(cash_flows: list[float], annual_rate: float) -> float:
     if not cash_flows:
         return 0.0
 
-    r_monthly = (1 + annual_rate) ** (1 / 12) - 1
-    npv = 0.0
-    for t, cf in enumerate(cash_flows, start=1):
-        npv += cf / (1 + r_monthly) ** t
-    return npv
+    cf = np.asarray(cash_flows, dtype=float)
+    t = np.arange(1, len(cf) + 1)
+    return float(np.sum(cf / (1 + _monthly_rate(annual_rate)) ** t))
 
 
 def compute_irr(cash_flows: list[float], max_iter: int = 200, tol: float = 1e-8) -> float | None:
@@ -64,23 +83,29 @@ def compute_irr(cash_flows: list[float], max_iter: int = 200, tol: float = 1e-8)
     if not (has_positive and has_negative):
         return None
 
+    cf = np.asarray(cash_flows, dtype=float)
+    t = np.arange(1, len(cf) + 1)
+
+    def npv_at(annual_rate: float) -> float:
+        return float(np.sum(cf / (1 + _monthly_rate(annual_rate)) ** t))
+
     # Bisection between -50% and 1000% annual
     low, high = -0.50, 10.0
+    npv_low = npv_at(low)
 
     for _ in range(max_iter):
         mid = (low + high) / 2
-        npv_mid = compute_npv(cash_flows, mid)
+        npv_mid = npv_at(mid)
 
         if abs(npv_mid) < tol:
             return mid
 
-        # Check sign of NPV at low to determine direction
-        npv_low = compute_npv(cash_flows, low)
-
+        # Sign of NPV at low determines direction; it only moves when low does
         if npv_low * npv_mid < 0:
             high = mid
         else:
             low = mid
+            npv_low = npv_mid
 
         if high - low < tol:
             return mid
@@ -105,7 +130,7 @@ def compute_terminal_value(
     if config.terminal_value_method == "none":
         return 0.0
 
-    r_monthly = (1 + annual_discount_rate) ** (1 / 12) - 1
+    r_monthly = _monthly_rate(annual_discount_rate)
     discount_to_present = 1 / (1 + r_monthly) ** horizon_months
 
     if config.terminal_value_method == "salvage":
@@ -131,13 +156,12 @@ def compute_discounted_payback(cash_flows: list[float], annual_rate: float) -> i
     if not cash_flows:
         return None
 
-    r_monthly = (1 + annual_rate) ** (1 / 12) - 1
-    cumulative_pv = 0.0
-    for t, cf in enumerate(cash_flows, start=1):
-        cumulative_pv += cf / (1 + r_monthly) ** t
-        if cumulative_pv >= 0 and t > 1:
-            return t
-    return None
+    _, _, cumulative_pv = _discount_kernel(
+        np.asarray(cash_flows, dtype=float), _monthly_rate(annual_rate),
+    )
+    # Month 1 never counts as payback, so search from month 2 onwards
+    hits = np.flatnonzero(cumulative_pv[1:] >= 0)
+    return int(hits[0]) + 2 if hits.size else None
 
 
 def build_dcf_table(
@@ -165,22 +189,24 @@ def build_dcf_table(
     cash_flows = [m.net_cash_flow for m in months]
     horizon = len(months)
 
-    r_monthly = (1 + annual_discount_rate) ** (1 / 12) - 1
+    r_monthly = _monthly_rate(annual_discount_rate)
 
-    # Monthly DCF rows
-    dcf_rows: list[MonthlyDCFRow] = []
-    cumulative_pv = 0.0
-    for t, cf in enumerate(cash_flows, start=1):
-        df = 1 / (1 + r_monthly) ** t
-        pv = cf * df
-        cumulative_pv += pv
-        dcf_rows.append(MonthlyDCFRow(
+    # Monthly DCF rows — discounting is done on whole arrays, rows are only
+    # materialised at the end.
+    df_arr, pv_arr, cum_arr = _discount_kernel(np.asarray(cash_flows, dtype=float), r_monthly)
+    dcf_rows: list[MonthlyDCFRow] = [
+        MonthlyDCFRow(
             month=t,
             discount_factor=round(df, 6),
             nominal_net_cf=round(cf, 2),
             pv_net_cf=round(pv, 2),
-            cumulative_pv=round(cumulative_pv, 2),
-        ))
+            cumulative_pv=round(cum, 2),
+        )
+        for t, (cf, df, pv, cum) in enumerate(
+            zip(cash_flows, df_arr.tolist(), pv_arr.tolist(), cum_arr.tolist()), start=1,
+        )
+    ]
+    cumulative_pv = float(cum_arr[-1]) if horizon else 0.0
 
     # Terminal value
     last_year_ncf = sum(cf for cf in cash_flows[-12:]) if horizon >= 12 else sum(cash_flows)
@@ -13,7 +13,7 @@ Key formulas:
 
 from __future__ import annotations
 
-import math
+import numpy as np
 
 from zng_simulator.config.finance import FinanceConfig
 from zng_simulator.models.results import (
@@ -24,6 +24,40 @@ from zng_simulator.models.results import (
 )
 
 
+def _amortize(
+    loan: float,
+    monthly_rate: float,
+    emi: float,
+    grace: int,
+    num_months: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Closed-form amortization over ``num_months`` months.
+
+    Returns ``(opening, interest, principal, payment, closing)`` arrays
+    (index 0 = month 1).  The balance is flat at ``loan`` through the grace
+    period; after k EMI payments it is ``L·(1+r)^k − EMI·((1+r)^k − 1)/r``,
+    so the whole schedule is evaluated without a month-by-month recurrence.
+    The balance is evaluated once for months 1‥num_months+1 and each month
+    closes on the next month's opening value, so rounded closing and
+    opening balances always chain.
+    """
+    m = np.arange(1, num_months + 2)
+    k = np.maximum(m - grace - 1, 0)  # EMI payments made before month m
+    if monthly_rate > 0:
+        growth = (1 + monthly_rate) ** k
+        balance = loan * growth - emi * (growth - 1) / monthly_rate
+    else:
+        balance = loan - emi * k
+    balance = np.maximum(balance, 0.0)
+    opening, closing = balance[:-1], balance[1:]
+
+    interest = opening * monthly_rate
+    in_grace = m[:-1] <= grace
+    # Don't overshoot the outstanding balance on the final instalment
+    principal = np.where(in_grace, 0.0, np.minimum(emi - interest, opening))
+    return opening, interest, principal, interest + principal, closing
+
+
 def build_debt_schedule(
     total_initial_capex: float,
     finance_cfg: FinanceConfig,
@@ -66,39 +100,28 @@ def build_debt_schedule(
     else:
         emi = 0.0
 
-    rows: list[DebtScheduleRow] = []
-    balance = loan
-    total_interest = 0.0
-    total_principal = 0.0
-
     num_months = min(tenor, horizon_months)
+    opening, interest, principal, payment, closing = _amortize(
+        loan, monthly_rate, emi, grace, num_months,
+    )
 
-    for m in range(1, num_months + 1):
-        interest = balance * monthly_rate
-        if m <= grace:
-            # Grace period: interest-only
-            principal = 0.0
-            payment = interest
-        else:
-            # Amortization period: EMI
-            principal = emi - interest
-            principal = min(principal, balance)  # don't overshoot
-            payment = interest + principal
-
-        closing = balance - principal
-
-        rows.append(DebtScheduleRow(
+    rows: list[DebtScheduleRow] = [
+        DebtScheduleRow(
             month=m,
-            opening_balance=round(balance, 2),
-            interest=round(interest, 2),
-            principal=round(principal, 2),
-            emi=round(payment, 2),
-            closing_balance=round(max(closing, 0), 2),
-        ))
-
-        total_interest += interest
-        total_principal += principal
-        balance = max(closing, 0)
+            opening_balance=round(ob, 2),
+            interest=round(i, 2),
+            principal=round(p, 2),
+            emi=round(pay, 2),
+            closing_balance=round(cb, 2),
+        )
+        for m, (ob, i, p, pay, cb) in enumerate(
+            zip(opening.tolist(), interest.tolist(), principal.tolist(),
+                payment.tolist(), closing.tolist()),
+            start=1,
+        )
+    ]
+    total_interest = float(interest.sum())
+    total_principal = float(principal.sum())
 
     return DebtSchedule(
         loan_amount=round(loan, 2),
@@ -142,31 +165,31 @@ def compute_dscr(
             asset_cover_ratio=None,
         )
 
-    monthly_dscr: list[float] = []
-    breach_months: list[int] = []
     debt_rows_by_month = {r.month: r for r in debt.rows}
+    n = len(months)
+    month_nums = np.fromiter((snap.month for snap in months), dtype=np.int64, count=n)
+    noi = np.fromiter((snap.revenue - snap.opex_total for snap in months), dtype=np.float64, count=n)
+    emi = np.fromiter(
+        (debt_rows_by_month[m].emi if m in debt_rows_by_month else 0.0 for m in month_nums.tolist()),
+        dtype=np.float64, count=n,
+    )
 
-    for snap in months:
-        m = snap.month
-        noi = snap.revenue - snap.opex_total
-
-        debt_row = debt_rows_by_month.get(m)
-        if debt_row and debt_row.emi > 0:
-            dscr_val = noi / debt_row.emi
-        else:
-            dscr_val = float("inf")  # no debt service this month
-
-        monthly_dscr.append(round(dscr_val, 4))
+    # No debt service this month → DSCR is unbounded (inf)
+    dscr = np.full(n, np.inf)
+    np.divide(noi, emi, out=dscr, where=emi > 0)
+    breach_mask = (dscr < finance_cfg.dscr_covenant_threshold) & (dscr != np.inf)
 
-        if dscr_val < finance_cfg.dscr_covenant_threshold and dscr_val != float("inf"):
-            breach_months.append(m)
+    monthly_dscr = [round(d, 4) for d in dscr.tolist()]
+    breach_months = month_nums[breach_mask].tolist()
 
     # Filter out inf values for statistics
-    finite_dscr = [d for d in monthly_dscr if d != float("inf") and not math.isinf(d)]
+    rounded = np.asarray(monthly_dscr, dtype=np.float64)
+    finite_mask = ~np.isinf(rounded)
+    finite_dscr = rounded[finite_mask].tolist()
 
     avg = sum(finite_dscr) / len(finite_dscr) if finite_dscr else float("inf")
     min_val = min(finite_dscr) if finite_dscr else float("inf")
-    min_month = monthly_dscr.index(min_val) + 1 if finite_dscr else 0
+    min_month = int(np.flatnonzero(rounded == min_val)[0]) + 1 if finite_dscr else 0
 
     # Asset cover ratio
     acr = None
@@ -10,7 +10,9 @@ Models for:
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from typing import Any
+
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -263,3 +265,24 @@ class PilotSizingResult(BaseModel):
 
     search_log: list[dict] = Field(default_factory=list)
     """Log of (fleet_size, npv, break_even) at each search step."""
+
+    # Chart views of ``search_log``, sorted once when the result is built.
+    # Private, so they stay out of model_dump and API responses.
+    _log_by_fleet_size: list[dict] = PrivateAttr(default_factory=list)
+    _npv_by_fleet_size: tuple[float, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
+        self._log_by_fleet_size = sorted(self.search_log, key=lambda e: e["fleet_size"])
+        self._npv_by_fleet_size = tuple(
+            e["npv"] if e["npv"] is not None else 0.0 for e in self._log_by_fleet_size
+        )
+
+    @property
+    def search_log_by_fleet_size(self) -> list[dict]:
+        """``search_log`` ordered by fleet size (for charting)."""
+        return self._log_by_fleet_size
+
+    @property
+    def npv_by_fleet_size(self) -> tuple[float, ...]:
+        """NPV of each :attr:`search_log_by_fleet_size` entry; missing NPVs are 0."""
+        return self._npv_by_fleet_size
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from zng_simulator.config import Scenario, ChargerVariant
-from zng_simulator.engine.cashflow import run_simulation
+from zng_simulator.engine.cashflow import run_simulation, run_simulation_batch
 
 
 def test_simulation_returns_correct_months(scenario: Scenario, budget_charger: ChargerVariant):
@@ -53,6 +53,24 @@ def test_summary_totals_match(scenario: Scenario, budget_charger: ChargerVariant
     assert abs(result.summary.total_opex - total_opex) < 1.0
 
 
+def test_break_even_is_first_non_negative_month_after_launch(scenario: Scenario, budget_charger: ChargerVariant):
+    sc = scenario.model_copy(update={"revenue": scenario.revenue.model_copy(update={"price_per_swap": 200.0})})
+    result = run_simulation(sc, budget_charger)
+    be = result.summary.break_even_month
+    assert be is not None and be > 1
+    assert result.months[be - 1].cumulative_cash_flow >= 0
+    assert all(s.cumulative_cash_flow < 0 for s in result.months[1:be - 1])
+
+
+def test_single_month_horizon(scenario: Scenario, budget_charger: ChargerVariant):
+    """Month 1 alone: no break-even (launch month is excluded), totals are month 1's."""
+    sc = scenario.model_copy(update={"simulation": scenario.simulation.model_copy(update={"horizon_months": 1})})
+    result = run_simulation(sc, budget_charger)
+    assert len(result.months) == 1
+    assert result.summary.break_even_month is None
+    assert result.summary.total_revenue == result.months[0].revenue
+
+
 def test_cpc_waterfall_populated(scenario: Scenario, budget_charger: ChargerVariant):
     result = run_simulation(scenario, budget_charger)
     assert result.cpc_waterfall.total > 0
@@ -77,6 +95,14 @@ def test_premium_vs_budget(scenario: Scenario, budget_charger: ChargerVariant, p
     assert 0.5 < ratio < 2.0
 
 
+def test_batch_matches_per_variant_runs(scenario: Scenario, budget_charger: ChargerVariant, premium_charger: ChargerVariant):
+    """The batch shares the demand schedule but must reproduce each single run exactly."""
+    batch = run_simulation_batch(scenario, [budget_charger, premium_charger])
+    assert [r.charger_variant_id for r in batch] == [budget_charger.name, premium_charger.name]
+    for res, charger in zip(batch, [budget_charger, premium_charger]):
+        assert res.model_dump() == run_simulation(scenario, charger).model_dump()
+
+
 def test_yaml_scenario_loads():
     """Test that base_case.yaml can be loaded into a Scenario."""
     import yaml
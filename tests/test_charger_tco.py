@@ -17,7 +17,7 @@ from zng_simulator.config import (
     StationConfig, PackSpec, ChaosConfig,
 )
 from zng_simulator.engine.derived import compute_derived_params
-from zng_simulator.engine.charger_tco import compute_charger_tco
+from zng_simulator.engine.charger_tco import compute_charger_tco, compute_charger_tco_batch
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────
@@ -257,3 +257,49 @@ def test_spare_inventory_is_per_station(
 
     expected = budget_charger.spare_inventory_cost * station.num_stations
     assert abs(tco.spare_inventory_cost - expected) < 1.0
+
+
+def test_zero_inputs_set_in_place_stay_finite(
+    vehicle: VehicleConfig, pack: PackSpec, budget_charger: ChargerVariant,
+    station: StationConfig, revenue: RevenueConfig, sim_config: SimulationConfig,
+    chaos: ChaosConfig,
+):
+    """Sweeps setattr config fields without re-validation; zeros must not give inf/NaN."""
+    derived = compute_derived_params(vehicle, pack, budget_charger, station, chaos)
+
+    setattr(budget_charger, "mtbf_hours", 0.0)
+    tco = compute_charger_tco(budget_charger, derived, vehicle, revenue, sim_config, station)
+    assert tco.expected_failures_over_horizon == 0.0
+    assert tco.num_replacements == 0
+    assert tco.availability == 0.0
+    assert math.isfinite(tco.total_tco) and math.isfinite(tco.cost_per_cycle)
+
+    setattr(budget_charger, "mtbf_hours", 8_000.0)
+    setattr(budget_charger, "replacement_threshold", 0)
+    setattr(vehicle, "packs_per_vehicle", 0)
+    tco = compute_charger_tco(budget_charger, derived, vehicle, revenue, sim_config, station)
+    assert tco.num_replacements == 0
+    assert tco.lost_revenue_from_downtime == 0.0
+    assert math.isfinite(tco.total_tco)
+
+    setattr(station, "operating_hours_per_day", 0.0)
+    tco = compute_charger_tco(budget_charger, derived, vehicle, revenue, sim_config, station)
+    assert tco.fleet_operating_hours == 0.0
+    assert tco.cycles_served_over_horizon == 0.0
+    assert math.isfinite(tco.total_tco) and math.isfinite(tco.cost_per_cycle)
+
+
+def test_batch_matches_per_variant(
+    vehicle: VehicleConfig, pack: PackSpec, budget_charger: ChargerVariant,
+    premium_charger: ChargerVariant, station: StationConfig, revenue: RevenueConfig,
+    sim_config: SimulationConfig, chaos: ChaosConfig,
+):
+    """The batch form returns, in order, exactly what each single call returns."""
+    chargers = [budget_charger, premium_charger]
+    derived = [compute_derived_params(vehicle, pack, c, station, chaos) for c in chargers]
+    batch = compute_charger_tco_batch(chargers, derived, vehicle, revenue, sim_config, station)
+
+    assert len(batch) == 2
+    for tco, c, d in zip(batch, chargers, derived):
+        assert tco == compute_charger_tco(c, d, vehicle, revenue, sim_config, station)
+    assert batch[1].expected_failures_over_horizon < batch[0].expected_failures_over_horizon
@@ -79,3 +79,30 @@ def test_all_components_non_negative(
     for field in ["battery", "charger", "electricity", "real_estate", "maintenance",
                   "insurance", "sabotage", "logistics", "overhead", "total"]:
         assert getattr(cpc, field) >= 0, f"{field} should be non-negative"
+
+
+def test_in_place_config_edit_is_not_served_from_cache(
+    vehicle: VehicleConfig, pack: PackSpec, budget_charger: ChargerVariant,
+    station: StationConfig, opex: OpExConfig, chaos: ChaosConfig,
+    revenue: RevenueConfig, sim_config: SimulationConfig,
+):
+    """Sensitivity sweeps set config fields in place; the memoised waterfall must follow."""
+    derived, tco, ptco, before = _make_cpc(vehicle, pack, budget_charger, station, opex, chaos, revenue, sim_config)
+    opex.electricity_tariff_per_kwh *= 2
+    after = compute_cpc_waterfall(derived, pack, budget_charger, opex, chaos, station, vehicle, tco, ptco)
+    assert after.electricity > before.electricity
+    assert after.real_estate == before.real_estate
+
+
+def test_results_are_independent_objects(
+    vehicle: VehicleConfig, pack: PackSpec, budget_charger: ChargerVariant,
+    station: StationConfig, opex: OpExConfig, chaos: ChaosConfig,
+    revenue: RevenueConfig, sim_config: SimulationConfig,
+):
+    """Editing one returned waterfall must not leak into later cache hits."""
+    derived, tco, ptco, first = _make_cpc(vehicle, pack, budget_charger, station, opex, chaos, revenue, sim_config)
+    electricity = first.electricity
+    first.electricity = -1.0
+    second = compute_cpc_waterfall(derived, pack, budget_charger, opex, chaos, station, vehicle, tco, ptco)
+    assert second is not first
+    assert second.electricity == electricity
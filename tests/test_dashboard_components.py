@@ -0,0 +1,26 @@
+"""Tests for dashboard HTML components — metric cards and card rows."""
+
+from zng_simulator.dashboard.components import card, card_row
+
+
+class TestCard:
+    def test_contents_and_accent(self):
+        html = card("🔋", "Packs", "1,234", "#00b894")
+        assert "1,234" in html and "Packs" in html and "🔋" in html
+        assert "border-top: 3px solid #00b894;" in html
+
+    def test_default_accent(self):
+        assert "border-top: 3px solid #6c5ce7;" in card("🔋", "Packs", "1")
+
+
+class TestCardRow:
+    def test_one_grid_column_per_card(self):
+        cards = [("🔋", "Packs", "10", "#6c5ce7"), ("⚡", "Docks", "4", "#00b894")]
+        html = card_row(cards)
+        assert "repeat(2, minmax(0, 1fr))" in html
+        assert html.count("border-top: 3px solid") == 2
+        assert "margin-bottom" not in html.split(">", 1)[0]
+
+    def test_pad_below(self):
+        html = card_row([("🔋", "Packs", "10", "#6c5ce7")], pad_below=True)
+        assert "margin-bottom: 1.5rem;" in html.split(">", 1)[0]
@@ -0,0 +1,43 @@
+"""Tests for dashboard number formatting — INR lakh/crore labels and grouped counts."""
+
+import math
+
+import numpy as np
+
+from zng_simulator.dashboard.formatting import fmt_count, fmt_inr, rupees
+
+
+class TestFmtInr:
+    def test_small_amount_grouped(self):
+        assert fmt_inr(12_345.4) == "₹12,345"
+
+    def test_lakhs(self):
+        assert fmt_inr(4_421_000) == "₹44.21 L"
+
+    def test_crores(self):
+        assert fmt_inr(-11_000_000) == "₹-1.10 Cr"
+
+    def test_lakh_and_crore_labels_round_once(self):
+        assert fmt_inr(12_349_999.6) == "₹1.23 Cr"
+        assert fmt_inr(9_999_999.7) == "₹100.00 L"
+        assert fmt_inr(99_999.6) == "₹100,000"
+
+    def test_signed_zero(self):
+        assert fmt_inr(0.0) == "₹0"
+        assert fmt_inr(-0.0) == "₹-0"
+
+    def test_non_finite_passthrough(self):
+        assert fmt_inr(math.inf) == "₹inf"
+        assert fmt_inr(math.nan) == "₹nan"
+
+
+class TestFmtCount:
+    def test_grouping(self):
+        assert fmt_count(1_234_567) == "1,234,567"
+        assert fmt_count(0) == "0"
+
+
+class TestRupees:
+    def test_rounds_half_to_even_like_round(self):
+        col = np.array([1234.5, 1235.5, -0.4, 1_000_000.49])
+        assert rupees(col).tolist() == [f"₹{round(x):,}" for x in col.tolist()]
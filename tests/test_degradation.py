@@ -556,3 +556,37 @@ class TestEdgeCases:
 
         # Should have retired and been replaced
         assert any(s.is_retired for s in result.cohort_snapshots)
+
+    def test_many_cohorts_keep_their_state(self, chaos: ChaosConfig):
+        """Cohort storage grows past its initial capacity without losing state."""
+        pack = PackSpec(
+            cycle_degradation_rate_pct=0.10,
+            calendar_aging_rate_pct_per_month=0.0,
+            retirement_soh_pct=0.70,
+        )
+        tracker = DegradationTracker(pack, chaos, auto_replace=False)
+        for m in range(1, 201):
+            tracker.add_cohort(pack_count=m, born_month=m)
+            result = tracker.step(month=m, total_fleet_cycles=0)
+
+        assert tracker.cohort_count == 200
+        assert tracker.active_pack_count == sum(range(1, 201))
+        snaps = result.cohort_snapshots
+        assert [s.cohort_id for s in snaps] == list(range(200))
+        assert [s.pack_count for s in snaps] == list(range(1, 201))
+        assert all(s.current_soh == 1.0 and s.retired_month is None for s in snaps)
+
+    def test_step_without_snapshots(self, simple_pack: PackSpec, chaos: ChaosConfig):
+        """build_snapshots=False skips the cohort list but not the bookkeeping."""
+        with_snaps = DegradationTracker(simple_pack, chaos, auto_replace=True)
+        without = DegradationTracker(simple_pack, chaos, auto_replace=True)
+        for tracker in (with_snaps, without):
+            tracker.add_cohort(pack_count=100, born_month=1)
+
+        for m in range(1, 40):
+            a = with_snaps.step(month=m, total_fleet_cycles=3_000)
+            b = without.step(month=m, total_fleet_cycles=3_000, build_snapshots=False)
+            assert b.cohort_snapshots == []
+            assert (a.packs_retired, a.packs_replaced, a.active_pack_count, a.avg_soh) == \
+                   (b.packs_retired, b.packs_replaced, b.active_pack_count, b.avg_soh)
+        assert without.get_snapshots() == with_snaps.get_snapshots()
@@ -9,6 +9,7 @@ Covers:
   - Seasonal amplitude creates month-to-month variation
   - Seed reproducibility
   - Monthly convenience wrapper
+  - Multi-month batch matches month-by-month draws
   - Fleet growth scales demand linearly
 """
 
@@ -21,6 +22,7 @@ from zng_simulator.config.demand import DemandConfig
 from zng_simulator.engine.demand import (
     DAYS_PER_MONTH,
     generate_daily_demand,
+    generate_demand_months,
     generate_monthly_demand,
 )
 from zng_simulator.models.results import DerivedParams
@@ -119,6 +121,22 @@ class TestDeterministic:
         expected = round(base_derived.swap_visits_per_vehicle_per_day * 200) * 30
         assert visits == expected
 
+    def test_deterministic_mode_consumes_no_randomness(self, base_derived: DerivedParams):
+        """The neutral Gamma case leaves the generator untouched."""
+        demand = DemandConfig(
+            distribution="gamma", volatility=0.0,
+            weekend_factor=1.0, seasonal_amplitude=0.0,
+        )
+        rng = np.random.default_rng(42)
+        state = rng.bit_generator.state
+        daily = generate_demand_months(
+            demand, base_derived, np.array([200, 400]), np.array([1, 2]), rng,
+        )
+        assert rng.bit_generator.state == state
+        assert daily.shape == (2, DAYS_PER_MONTH)
+        assert daily.dtype == np.int64
+        assert (daily[1] == round(base_derived.swap_visits_per_vehicle_per_day * 400)).all()
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Poisson distribution
@@ -329,6 +347,21 @@ class TestSeasonalAmplitude:
         assert abs(peak_total / base_total - 1.2) < 0.05
         assert abs(trough_total / base_total - 0.8) < 0.05
 
+    def test_long_horizon_keeps_12_month_period(self, base_derived: DerivedParams):
+        """Months past the precomputed seasonal table follow the same cycle."""
+        demand = DemandConfig(
+            distribution="gamma", volatility=0.0,
+            weekend_factor=1.0, seasonal_amplitude=0.2,
+        )
+        rng = np.random.default_rng(42)
+        for month in (3, 9):
+            for later in (month + 120, month + 300):
+                assert generate_daily_demand(
+                    demand, base_derived, fleet_size=200, month=later, rng=rng,
+                ).sum() == generate_daily_demand(
+                    demand, base_derived, fleet_size=200, month=month, rng=rng,
+                ).sum()
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Reproducibility
@@ -412,3 +445,41 @@ class TestMonthlyDemand:
             packs_per_vehicle=2, rng=rng2,
         )
         assert visits_400 == 2 * visits_200
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Multi-month batch
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestDemandMonths:
+    """generate_demand_months draws several months at once."""
+
+    @pytest.mark.parametrize("distribution", ["poisson", "gamma", "bimodal"])
+    def test_batch_matches_month_by_month(self, base_derived: DerivedParams, distribution: str):
+        """Same seed → the batch equals consecutive single-month calls."""
+        demand = DemandConfig(
+            distribution=distribution, volatility=0.2,
+            weekend_factor=0.7, seasonal_amplitude=0.3,
+        )
+        fleet_sizes = np.array([200, 250, 300, 350, 400])
+        months = np.arange(1, 6)
+
+        rng = np.random.default_rng(7)
+        expected = np.array([
+            generate_daily_demand(demand, base_derived, fleet_size=f, month=m, rng=rng)
+            for f, m in zip(fleet_sizes, months)
+        ])
+        batch = generate_demand_months(
+            demand, base_derived, fleet_sizes, months, np.random.default_rng(7),
+        )
+        assert batch.shape == (5, DAYS_PER_MONTH)
+        np.testing.assert_array_equal(batch, expected)
+
+    @pytest.mark.parametrize("distribution", ["poisson", "gamma", "bimodal"])
+    def test_zero_months_gives_empty_block(self, base_derived: DerivedParams, distribution: str):
+        demand = DemandConfig(distribution=distribution, seasonal_amplitude=0.2)
+        empty = np.array([], dtype=np.int64)
+        batch = generate_demand_months(
+            demand, base_derived, empty, empty, np.random.default_rng(7),
+        )
+        assert batch.shape == (0, DAYS_PER_MONTH)
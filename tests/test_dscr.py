@@ -55,6 +55,26 @@ class TestBuildDebtSchedule:
         for row in sched.rows[6:]:
             assert row.principal > 0  # Amortization
 
+    @pytest.mark.parametrize("capex,debt_pct,rate,tenor,grace", [
+        (1_000_000, 0.70, 0.12, 60, 6),
+        (5_000_000, 0.70, 0.0, 36, 3),
+        # Large balances where separately rounded closed-form values
+        # used to drift by a paisa between one month and the next
+        (500_533_197, 0.87, 0.293, 310, 0),
+        (596_846_699, 0.82, 0.107, 113, 0),
+    ])
+    def test_closing_balance_is_next_opening(self, capex, debt_pct, rate, tenor, grace):
+        cfg = FinanceConfig(
+            debt_pct_of_capex=debt_pct, interest_rate_annual=rate,
+            loan_tenor_months=tenor, grace_period_months=grace,
+        )
+        sched = build_debt_schedule(capex, cfg, tenor)
+
+        closing = [r.closing_balance for r in sched.rows]
+        opening = [r.opening_balance for r in sched.rows]
+        assert closing[:-1] == opening[1:]
+        assert closing[-1] == 0
+
     def test_zero_debt(self):
         cfg = FinanceConfig(debt_pct_of_capex=0)
         sched = build_debt_schedule(1_000_000, cfg, 60)
@@ -124,6 +124,36 @@ class TestIngestBMSCSV:
         records = ingest_bms_csv(io.StringIO("pack_id,month,soh,cumulative_cycles\n"))
         assert records == []
 
+    def test_out_of_range_rows_skipped(self):
+        """Well-typed rows that violate model bounds are dropped, not the file."""
+        csv_text = (
+            "pack_id,month,soh,cumulative_cycles\n"
+            "P001,6,0.95,300\n"
+            "P002,0,0.95,300\n"
+            "P003,6,1.20,300\n"
+            "P004,6,0.90,-5\n"
+        )
+        records = ingest_bms_csv(io.StringIO(csv_text))
+        assert [r.pack_id for r in records] == ["P001"]
+
+    def test_pack_id_kept_as_text(self):
+        """Numeric-looking pack ids keep leading zeros and lose padding."""
+        records = ingest_bms_csv(io.StringIO(
+            "pack_id,month,soh,cumulative_cycles\n 007 ,6,0.95,300\n"
+        ))
+        assert records[0].pack_id == "007"
+
+    def test_bytes_source(self):
+        """Raw upload bytes parse the same as decoded text, on both parse paths."""
+        for text in (BMS_CSV_VALID, BMS_CSV_MALFORMED):
+            from_bytes = ingest_bms_csv(io.BytesIO(text.encode("utf-8")))
+            assert from_bytes == ingest_bms_csv(io.StringIO(text))
+
+    def test_file_path_source(self, tmp_path):
+        path = tmp_path / "bms.csv"
+        path.write_text(BMS_CSV_VALID, encoding="utf-8")
+        assert ingest_bms_csv(path) == ingest_bms_csv(io.StringIO(BMS_CSV_VALID))
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Charger failure CSV ingestion
@@ -164,6 +194,19 @@ class TestIngestChargerCSV:
         assert records[0].repair_cost is None
         assert records[0].was_replaced is False
 
+    def test_null_tokens_and_flags(self):
+        csv_text = (
+            "dock_id,failure_month,downtime_hours,charger_variant_name,repair_cost,was_replaced\n"
+            "D01,3,8.5,NA,null, YES\n"
+            "D02,4,2.0, Fast-3kW ,900,0\n"
+        )
+        records = ingest_charger_csv(io.StringIO(csv_text))
+        assert records[0].charger_variant_name is None
+        assert records[0].repair_cost is None
+        assert records[0].was_replaced is True
+        assert records[1].charger_variant_name == "Fast-3kW"
+        assert records[1].was_replaced is False
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # FieldDataSet model
@@ -223,6 +266,25 @@ class TestVarianceReport:
             assert dv.actual_avg_soh > 0
             assert dv.num_packs_sampled == 3  # 3 packs per month
 
+    def test_degradation_variance_grouping(self):
+        """Unordered records are grouped per month and averaged."""
+        bms = [
+            BMSRecord(pack_id="P1", month=12, soh=0.80, cumulative_cycles=600),
+            BMSRecord(pack_id="P2", month=3, soh=0.96, cumulative_cycles=150),
+            BMSRecord(pack_id="P1", month=3, soh=0.98, cumulative_cycles=160),
+        ]
+        pack = _default_pack()
+        report = compute_variance_report(
+            FieldDataSet(bms_records=bms), pack, _default_charger(), _default_chaos(),
+        )
+        first, second = report.degradation_monthly
+        assert (first.month, first.num_packs_sampled) == (3, 2)
+        assert (second.month, second.num_packs_sampled) == (12, 1)
+        assert first.actual_avg_soh == pytest.approx(0.97)
+        expected = 1.0 - 0.0001 * 155 - 0.0015 * 3
+        assert first.projected_avg_soh == pytest.approx(expected, abs=1e-6)
+        assert first.variance_pct == pytest.approx((0.97 - expected) / expected * 100, abs=1e-3)
+
     def test_mtbf_variance_computed(self):
         cfail = ingest_charger_csv(io.StringIO(CHARGER_CSV_VALID))
         fds = FieldDataSet(charger_failure_records=cfail)
@@ -14,6 +14,7 @@ from zng_simulator.config.charger import ChargerVariant
 from zng_simulator.engine.optimizer import (
     find_minimum_fleet_size,
     find_optimal_scale,
+    _bisection_candidates,
     _check_target,
 )
 from zng_simulator.models.field_data import PilotSizingResult
@@ -244,3 +245,60 @@ class TestFindOptimalScale:
         )
         assert result.recommended_num_stations == scenario.station.num_stations
         assert result.recommended_docks_per_station == scenario.station.docks_per_station
+
+    def test_search_log_by_fleet_size(self):
+        """The charting view is sorted; search_log keeps evaluation order."""
+        scenario = _base_scenario()
+        charger = _base_charger()
+
+        result = find_optimal_scale(
+            scenario, charger,
+            fleet_sizes=[200, 50, 100],
+            target_metric="positive_ncf",
+        )
+        assert [e["fleet_size"] for e in result.search_log] == [200, 50, 100]
+        assert [e["fleet_size"] for e in result.search_log_by_fleet_size] == [50, 100, 200]
+        npv = {e["fleet_size"]: e["npv"] for e in result.search_log}
+        expected = [npv[f] if npv[f] is not None else 0.0 for f in (50, 100, 200)]
+        assert result.npv_by_fleet_size == tuple(expected)
+
+        dumped = result.model_dump()
+        assert "search_log_by_fleet_size" not in dumped
+        assert "npv_by_fleet_size" not in dumped
+        # Validating a dump (e.g. an API payload) rebuilds the sorted views
+        rebuilt = PilotSizingResult.model_validate(dumped)
+        assert rebuilt.npv_by_fleet_size == tuple(expected)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Parallel evaluation (max_workers)
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestParallelSearch:
+    def test_bisection_candidates_cover_next_levels(self):
+        # [10, 100] → mid 55, then 32 / 78 on the next level
+        assert _bisection_candidates(10, 100, 1) == [55]
+        assert _bisection_candidates(10, 100, 2) == [55, 32, 78]
+        assert _bisection_candidates(5, 5, 3) == [5]
+
+    def test_parallel_binary_search_matches_sequential(self):
+        scenario = _base_scenario()
+        charger = _base_charger()
+        kwargs = dict(target_metric="positive_ncf", min_fleet=10, max_fleet=500)
+
+        seq = find_minimum_fleet_size(scenario, charger, **kwargs)
+        par = find_minimum_fleet_size(scenario, charger, max_workers=3, **kwargs)
+
+        assert par.recommended_fleet_size == seq.recommended_fleet_size
+        assert par.search_iterations == seq.search_iterations
+        assert par.search_log == seq.search_log
+
+    def test_parallel_optimal_scale_matches_sequential(self):
+        scenario = _base_scenario()
+        charger = _base_charger()
+        kwargs = dict(fleet_sizes=[50, 100, 200], target_metric="positive_ncf")
+
+        seq = find_optimal_scale(scenario, charger, **kwargs)
+        par = find_optimal_scale(scenario, charger, max_workers=2, **kwargs)
+
+        assert par == seq
@@ -25,7 +25,7 @@ from zng_simulator.config.revenue import RevenueConfig
 from zng_simulator.config.chaos import ChaosConfig
 from zng_simulator.config.demand import DemandConfig
 from zng_simulator.config.scenario import Scenario, SimulationConfig
-from zng_simulator.engine.orchestrator import run_engine
+from zng_simulator.engine.orchestrator import run_engine, run_engine_batch
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -154,6 +154,19 @@ class TestRouting:
         result = run_engine(base_scenario, test_charger)
         assert result.engine_type == "stochastic"
 
+    def test_batch_routes_like_run_engine(self, base_scenario, test_charger):
+        """run_engine_batch returns one result per variant, matching run_engine."""
+        other = test_charger.model_copy(update={"name": "Other", "mtbf_hours": 20_000})
+        for engine in ("static", "stochastic"):
+            scenario = base_scenario.model_copy(update={"simulation": base_scenario.simulation.model_copy(
+                update={"engine": engine, "horizon_months": 12},
+            )})
+            batch = run_engine_batch(scenario, [test_charger, other])
+            assert [r.engine_type for r in batch] == [engine, engine]
+            for res, charger in zip(batch, [test_charger, other]):
+                single = run_engine(scenario, charger)
+                assert res.summary.total_net_cash_flow == single.summary.total_net_cash_flow
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Single stochastic run
@@ -375,6 +388,12 @@ class TestMonteCarlo:
         # Very unlikely that all 10 runs produce exact same NCF
         assert mc.ncf_p10 != mc.ncf_p90
 
+    def test_representative_run_keeps_cohort_history(self, mc_scenario, test_charger):
+        """Summary-only runs skip cohort snapshots; the representative run keeps them."""
+        result = run_engine(mc_scenario, test_charger)
+        assert result.cohort_history is not None
+        assert len(result.cohort_history) == mc_scenario.simulation.horizon_months
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Fleet growth integration